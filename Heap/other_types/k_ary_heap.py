@@ -13,6 +13,8 @@ Properties:
 Source: https://www.geeksforgeeks.org/k-ary-heap/
 """
 
+from array import array
+
 
 class KAryHeap:
     """
@@ -155,6 +157,145 @@ class KAryHeap:
         return str(self.heap)
 
 
+class IndexedKAryHeap:
+    """
+    Indexed K-ary min-heap over items 0..capacity-1 with true decrease-key.
+
+    Unlike KAryHeap, elements are addressed by item id (e.g. a graph vertex)
+    instead of by heap index. A position table maps each item to its slot,
+    so decrease_key finds the item in O(1) and sifts it up in O(log_k n).
+    Every item is in the heap at most once, so the heap never grows past
+    the number of distinct items (no stale duplicates as with heapq).
+
+    Storage:
+        - items: heap-ordered list of item ids
+        - keys: key of each item, indexed by item id
+        - pos: array('i') slot of each item, -1 if not in the heap
+
+    Time Complexities:
+        - push / decrease_key: O(log_k n)
+        - pop: O(k log_k n)
+        - contains / key lookup: O(1)
+
+    Space Complexity: O(capacity)
+    """
+
+    def __init__(self, capacity: int, k: int = 4):
+        if k < 2:
+            raise ValueError("k must be >= 2")
+        self.k = k
+        self.items: list = []
+        self.keys: list = [0] * capacity
+        self.pos = array("i", [-1]) * capacity
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __contains__(self, item: int) -> bool:
+        return self.pos[item] != -1
+
+    def is_empty(self) -> bool:
+        return len(self.items) == 0
+
+    def key(self, item: int):
+        """Return the current key of an item in the heap."""
+        if self.pos[item] == -1:
+            raise KeyError(item)
+        return self.keys[item]
+
+    def _sift_up(self, i: int, item: int):
+        """Move item up from slot i, shifting larger parents down (hole sift)."""
+        items, keys, pos, k = self.items, self.keys, self.pos, self.k
+        key = keys[item]
+        while i > 0:
+            parent = (i - 1) // k
+            parent_item = items[parent]
+            if keys[parent_item] <= key:
+                break
+            items[i] = parent_item
+            pos[parent_item] = i
+            i = parent
+        items[i] = item
+        pos[item] = i
+
+    def _sift_down(self, i: int, item: int):
+        """Move item down from slot i, pulling the smallest child up."""
+        items, keys, pos, k = self.items, self.keys, self.pos, self.k
+        n = len(items)
+        key = keys[item]
+        while True:
+            start = k * i + 1
+            if start >= n:
+                break
+            end = min(start + k, n)
+            best = start
+            best_key = keys[items[start]]
+            for j in range(start + 1, end):
+                child_key = keys[items[j]]
+                if child_key < best_key:
+                    best = j
+                    best_key = child_key
+            if best_key >= key:
+                break
+            child_item = items[best]
+            items[i] = child_item
+            pos[child_item] = i
+            i = best
+        items[i] = item
+        pos[item] = i
+
+    def push(self, item: int, key):
+        """Insert an item that is not in the heap. O(log_k n)"""
+        if self.pos[item] != -1:
+            raise ValueError(f"Item {item} is already in the heap")
+        self.keys[item] = key
+        self.items.append(item)
+        self._sift_up(len(self.items) - 1, item)
+
+    def decrease_key(self, item: int, new_key):
+        """Lower the key of an item already in the heap. O(log_k n)"""
+        if new_key > self.keys[item]:
+            raise ValueError("New key is greater than current key")
+        self.keys[item] = new_key
+        self._sift_up(self.pos[item], item)
+
+    def push_or_decrease(self, item: int, key) -> bool:
+        """Insert item, or lower its key if smaller. Returns True on change."""
+        i = self.pos[item]
+        if i == -1:
+            self.keys[item] = key
+            self.items.append(item)
+            self._sift_up(len(self.items) - 1, item)
+            return True
+        if key < self.keys[item]:
+            self.keys[item] = key
+            self._sift_up(i, item)
+            return True
+        return False
+
+    def peek(self) -> tuple:
+        """Return (item, key) with the minimum key. O(1)"""
+        if not self.items:
+            raise ValueError("Heap is empty")
+        item = self.items[0]
+        return item, self.keys[item]
+
+    def pop(self) -> tuple:
+        """Remove and return (item, key) with the minimum key. O(k log_k n)"""
+        items = self.items
+        if not items:
+            raise ValueError("Heap is empty")
+        top = items[0]
+        last = items.pop()
+        self.pos[top] = -1
+        if items:
+            self._sift_down(0, last)
+        return top, self.keys[top]
+
+    def __str__(self) -> str:
+        return str([(item, self.keys[item]) for item in self.items])
+
+
 def functional_version(arr: list, k: int):
     """
     Functional style K-ary heap operations.
@@ -252,6 +393,24 @@ def main():
     print(f"Extracted max: {max_val}")
     print(f"After extract: {arr[:n]}")
 
+    print("\n" + "=" * 50)
+    print("Indexed K-ary min-heap (k=4) with decrease-key:")
+    pq = IndexedKAryHeap(capacity=6, k=4)
+    for item, key in [(0, 9), (1, 4), (2, 7), (3, 12), (4, 5)]:
+        pq.push(item, key)
+    print(f"Heap: {pq}")
+
+    pq.decrease_key(3, 1)
+    print(f"After decrease_key(3, 1): min = {pq.peek()}")
+
+    print(f"push_or_decrease(2, 8) changed: {pq.push_or_decrease(2, 8)}")
+    print(f"push_or_decrease(5, 6) changed: {pq.push_or_decrease(5, 6)}")
+
+    order = []
+    while not pq.is_empty():
+        order.append(pq.pop())
+    print(f"Pop order: {order}")
+
 
 if __name__ == "__main__":
     main()
@@ -1,5 +1,7 @@
 from collections import defaultdict
 
+from graph.advanced.walk_counting import count_walks_adjacency
+
 
 def countWalksBF(adj, u, dest, k):
     if k == 0:
@@ -26,6 +28,11 @@ def countWalks(adj, src, dest, k):
     return dp[k][src]
 
 
+def countWalksFast(adj, src, dest, k, mod=None):
+    # Repeated squaring of the adjacency matrix: O(V^3 log k), k up to 1e18
+    return count_walks_adjacency(adj, src, dest, k, mod)
+
+
 if __name__ == "__main__":
     adj = [[0, 1, 1, 1], [0, 0, 0, 1], [0, 0, 0, 1], [0, 0, 0, 0]]
     graph = defaultdict(list)
@@ -37,6 +44,11 @@ if __name__ == "__main__":
     src, dest, k = 0, 3, 2
     expected = 2
 
+    # Before countWalksBF() touches graph[3]: the sink is not a key yet
+    print(f"Matrix Power: {countWalksFast(graph, src, dest, k)}")
     print(f"Brute Force: {countWalksBF(graph, src, dest, k)}")
     print(f"DP Approach: {countWalks(graph, src, dest, k)}")
     print(f"Expected: {expected}")
+
+    cyclic = [[1, 2], [2], [0, 1]]
+    print(f"k = 10^18 (mod 1e9+7): {countWalksFast(cyclic, 0, 2, 10**18, 10**9 + 7)}")
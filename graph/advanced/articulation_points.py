@@ -11,12 +11,19 @@ Tarjan's Algorithm:
   2. u is not root and has a child v such that low[v] >= disc[u]
      (meaning v's subtree has no back edge to an ancestor of u)
 
+Both finders run the single iterative low-link pass in biconnectivity.py
+(no recursion limit on deep graphs).
+
 Time Complexity: O(V + E)
 Space Complexity: O(V)
+
+Run from the repository root: python -m graph.advanced.articulation_points
 """
 
 from typing import List, Set
 
+from graph.advanced.biconnectivity import Biconnectivity, biconnectivity
+
 
 def find_articulation_points(num_vertices: int, edges: List[List[int]]) -> List[int]:
     """
@@ -29,48 +36,7 @@ def find_articulation_points(num_vertices: int, edges: List[List[int]]) -> List[
     Returns:
         Sorted list of articulation points, or [-1] if none exist
     """
-    # Build adjacency list
-    adj: List[List[int]] = [[] for _ in range(num_vertices)]
-    for u, v in edges:
-        adj[u].append(v)
-        adj[v].append(u)
-
-    disc = [-1] * num_vertices
-    low = [-1] * num_vertices
-    parent = [-1] * num_vertices
-    is_ap = [False] * num_vertices
-    timer = [0]
-
-    def dfs(u: int) -> None:
-        disc[u] = low[u] = timer[0]
-        timer[0] += 1
-        children = 0
-
-        for v in adj[u]:
-            if disc[v] == -1:  # v not visited
-                children += 1
-                parent[v] = u
-                dfs(v)
-
-                # Update low value
-                low[u] = min(low[u], low[v])
-
-                # Check AP condition for non-root
-                if parent[u] != -1 and low[v] >= disc[u]:
-                    is_ap[u] = True
-
-            elif v != parent[u]:  # Back edge
-                low[u] = min(low[u], disc[v])
-
-        # Check AP condition for root
-        if parent[u] == -1 and children > 1:
-            is_ap[u] = True
-
-    for i in range(num_vertices):
-        if disc[i] == -1:
-            dfs(i)
-
-    result = [i for i in range(num_vertices) if is_ap[i]]
+    result = biconnectivity(num_vertices, edges).articulation_points
     return result if result else [-1]
 
 
@@ -93,39 +59,7 @@ class ArticulationPointFinder:
         Returns:
             Set of articulation point indices
         """
-        disc = [-1] * self.num_vertices
-        low = [-1] * self.num_vertices
-        parent = [-1] * self.num_vertices
-        ap_set: Set[int] = set()
-        timer = [0]
-
-        def dfs(u: int) -> None:
-            disc[u] = low[u] = timer[0]
-            timer[0] += 1
-            children = 0
-
-            for v in self.adj[u]:
-                if disc[v] == -1:
-                    children += 1
-                    parent[v] = u
-                    dfs(v)
-
-                    low[u] = min(low[u], low[v])
-
-                    if parent[u] != -1 and low[v] >= disc[u]:
-                        ap_set.add(u)
-
-                elif v != parent[u]:
-                    low[u] = min(low[u], disc[v])
-
-            if parent[u] == -1 and children > 1:
-                ap_set.add(u)
-
-        for i in range(self.num_vertices):
-            if disc[i] == -1:
-                dfs(i)
-
-        return ap_set
+        return set(Biconnectivity(self.adj).articulation_points)
 
     def is_articulation_point(self, vertex: int) -> bool:
         """Check if a specific vertex is an articulation point."""
@@ -161,7 +95,8 @@ def naive_articulation_points(num_vertices: int, edges: List[List[int]]) -> List
             adj[v].append(u)
 
         visited = [False] * num_vertices
-        visited[excluded] = True  # Mark excluded as visited
+        if excluded >= 0:
+            visited[excluded] = True  # Mark excluded as visited
         components = 0
 
         for i in range(num_vertices):
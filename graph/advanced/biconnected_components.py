@@ -15,13 +15,20 @@ A biconnected component is either:
 - A maximal set of edges where any two edges lie on a common cycle, or
 - A single bridge (edge whose removal disconnects the graph)
 
+The components come from the single iterative low-link pass in
+biconnectivity.py, which also builds the block-cut tree.
+
 Time Complexity: O(V + E)
 Space Complexity: O(V + E)
+
+Run from the repository root: python -m graph.advanced.biconnected_components
 """
 
 from typing import List, Tuple
 from collections import defaultdict
 
+from graph.advanced.biconnectivity import Biconnectivity, biconnectivity
+
 
 def find_biconnected_components(
     num_vertices: int, edges: List[List[int]]
@@ -36,57 +43,7 @@ def find_biconnected_components(
     Returns:
         List of biconnected components, each as a list of edges
     """
-    # Build adjacency list
-    adj: List[List[int]] = [[] for _ in range(num_vertices)]
-    for u, v in edges:
-        adj[u].append(v)
-        adj[v].append(u)
-
-    disc = [-1] * num_vertices
-    low = [-1] * num_vertices
-    parent = [-1] * num_vertices
-    edge_stack: List[Tuple[int, int]] = []
-    components: List[List[Tuple[int, int]]] = []
-    timer = [0]
-
-    def dfs(u: int) -> None:
-        disc[u] = low[u] = timer[0]
-        timer[0] += 1
-        children = 0
-
-        for v in adj[u]:
-            if disc[v] == -1:  # v not visited
-                children += 1
-                parent[v] = u
-                edge_stack.append((u, v))
-                dfs(v)
-
-                low[u] = min(low[u], low[v])
-
-                # If u is an articulation point, pop component
-                if (parent[u] == -1 and children > 1) or (
-                    parent[u] != -1 and low[v] >= disc[u]
-                ):
-                    component = []
-                    while edge_stack and edge_stack[-1] != (u, v):
-                        component.append(edge_stack.pop())
-                    if edge_stack:
-                        component.append(edge_stack.pop())
-                    components.append(component)
-
-            elif v != parent[u] and disc[v] < disc[u]:  # Back edge
-                low[u] = min(low[u], disc[v])
-                edge_stack.append((u, v))
-
-    for i in range(num_vertices):
-        if disc[i] == -1:
-            dfs(i)
-            # Remaining edges form a component
-            if edge_stack:
-                components.append(edge_stack[:])
-                edge_stack.clear()
-
-    return components
+    return biconnectivity(num_vertices, edges).components()
 
 
 class BiconnectedComponents:
@@ -108,48 +65,7 @@ class BiconnectedComponents:
         Returns:
             List of components, each a list of edges (u, v)
         """
-        disc = [-1] * self.num_vertices
-        low = [-1] * self.num_vertices
-        parent = [-1] * self.num_vertices
-        edge_stack: List[Tuple[int, int]] = []
-        components: List[List[Tuple[int, int]]] = []
-        timer = [0]
-
-        def dfs(u: int) -> None:
-            disc[u] = low[u] = timer[0]
-            timer[0] += 1
-            children = 0
-
-            for v in self.adj[u]:
-                if disc[v] == -1:
-                    children += 1
-                    parent[v] = u
-                    edge_stack.append((u, v))
-                    dfs(v)
-
-                    low[u] = min(low[u], low[v])
-
-                    if (parent[u] == -1 and children > 1) or (
-                        parent[u] != -1 and low[v] >= disc[u]
-                    ):
-                        component = []
-                        while edge_stack[-1] != (u, v):
-                            component.append(edge_stack.pop())
-                        component.append(edge_stack.pop())
-                        components.append(component)
-
-                elif v != parent[u] and disc[v] < disc[u]:
-                    low[u] = min(low[u], disc[v])
-                    edge_stack.append((u, v))
-
-        for i in range(self.num_vertices):
-            if disc[i] == -1:
-                dfs(i)
-                if edge_stack:
-                    components.append(list(edge_stack))
-                    edge_stack.clear()
-
-        return components
+        return Biconnectivity(self.adj).components()
 
     def count_components(self) -> int:
         """Return number of biconnected components."""
@@ -168,12 +84,15 @@ def get_bcc_analysis(num_vertices: int, edges: List[List[int]]) -> dict:
     Returns:
         Dictionary with analysis results
     """
-    components = find_biconnected_components(num_vertices, edges)
+    result = biconnectivity(num_vertices, edges)
+    components = result.components()
 
     return {
         "num_components": len(components),
         "components": components,
         "is_biconnected": len(components) == 1,
+        "articulation_points": result.articulation_points,
+        "bridges": result.bridges,
     }
 
 
@@ -0,0 +1,210 @@
+"""
+Bridges, Articulation Points and Block-Cut Tree in One Iterative Pass
+
+bridges_in_graph.py, articulation_points.py and biconnected_components.py
+each ran their own recursive Tarjan DFS, one Python frame per tree level,
+so a path or a long road network overflowed the recursion limit at a depth
+of about 1000. All three answers come from the same disc/low values, so
+one iterative pass computes them together:
+
+- The DFS stack holds vertices only; every vertex keeps a pointer to its
+  next unscanned arc in the CSR arrays (graph/core/csr_graph.py), so a
+  vertex resumes its scan where it stopped after a child finishes.
+- The arc back to the DFS parent is skipped once, not by vertex id, so a
+  parallel edge to the parent counts as a back edge (a doubled edge is
+  never a bridge).
+- When child u of w finishes with low[u] >= disc[w], w separates u's
+  subtree: the edges pushed since (w, u) are popped as one block
+  (biconnected component), w is a cut vertex unless it is a root with one
+  child, and if low[u] > disc[w] the block is the bridge (w, u).
+
+The block-cut tree has a node per block and per articulation point, and an
+edge between a block and every articulation point in it; it is a forest
+with one tree per connected component that has edges.
+
+Time Complexity: O(V + E)
+Space Complexity: O(V + E)
+
+Reference: https://www.geeksforgeeks.org/biconnected-components/
+
+Run from the repository root: python -m graph.advanced.biconnectivity
+"""
+
+from array import array
+from typing import List, Tuple
+
+from graph.core.csr_graph import CSRGraph
+
+
+class Biconnectivity:
+    """
+    Bridges, articulation points and blocks of an undirected graph.
+
+    Attributes:
+        num_vertices: Number of vertices
+        bridges: Bridges as (u, v) tuples with u < v, in DFS finishing order
+        articulation_points: Sorted cut vertices
+        num_blocks: Number of biconnected components
+    """
+
+    def __init__(self, graph) -> None:
+        """
+        Run the low-link pass.
+
+        Args:
+            graph: Undirected CSRGraph, or an adjacency list listing every
+                   edge in both directions
+        """
+        if not hasattr(graph, "weighted_neighbors"):
+            graph = CSRGraph.from_adjacency(graph)
+        n = self.num_vertices = len(graph)
+        offsets, targets = graph.offsets, graph.targets
+
+        disc = [-1] * n
+        low = [0] * n
+        parent = [-1] * n
+        pointer = list(offsets)
+        skipped = bytearray(n)  # the arc back to the parent was seen
+        is_cut = bytearray(n)
+        # Pushed edges and, per block, where its edges end in the popped list
+        stack_u: List[int] = []
+        stack_v: List[int] = []
+        edges_u: List[int] = []
+        edges_v: List[int] = []
+        self._block_end = block_end = [0]
+        self.bridges: List[Tuple[int, int]] = []
+        timer = 0
+
+        for root in range(n):
+            if disc[root] != -1:
+                continue
+            disc[root] = low[root] = timer
+            timer += 1
+            root_children = 0
+            dfs = [root]
+            while dfs:
+                u = dfs[-1]
+                p = pointer[u]
+                if p < offsets[u + 1]:
+                    pointer[u] = p + 1
+                    v = targets[p]
+                    if disc[v] == -1:
+                        parent[v] = u
+                        disc[v] = low[v] = timer
+                        timer += 1
+                        stack_u.append(u)
+                        stack_v.append(v)
+                        dfs.append(v)
+                        if u == root:
+                            root_children += 1
+                    elif v == parent[u] and not skipped[u]:
+                        skipped[u] = 1
+                    elif disc[v] < disc[u]:  # back edge (self-loops ignored)
+                        if disc[v] < low[u]:
+                            low[u] = disc[v]
+                        stack_u.append(u)
+                        stack_v.append(v)
+                    continue
+
+                # Post-order: all children of u are done
+                dfs.pop()
+                if not dfs:
+                    break
+                w = dfs[-1]
+                if low[u] < low[w]:
+                    low[w] = low[u]
+                if low[u] >= disc[w]:
+                    if w != root:
+                        is_cut[w] = 1
+                    if low[u] > disc[w]:
+                        self.bridges.append((w, u) if w < u else (u, w))
+                    while True:
+                        a, b = stack_u.pop(), stack_v.pop()
+                        edges_u.append(a)
+                        edges_v.append(b)
+                        if a == w and b == u:
+                            break
+                    block_end.append(len(edges_u))
+            if root_children > 1:
+                is_cut[root] = 1
+
+        self._edges_u, self._edges_v = edges_u, edges_v
+        self.num_blocks = len(block_end) - 1
+        self.articulation_points = [v for v in range(n) if is_cut[v]]
+
+    def block_edges(self, block: int) -> List[Tuple[int, int]]:
+        """Edges (u, v) of one biconnected component."""
+        lo, hi = self._block_end[block], self._block_end[block + 1]
+        return list(zip(self._edges_u[lo:hi], self._edges_v[lo:hi]))
+
+    def block_vertices(self, block: int) -> List[int]:
+        """Sorted vertices of one biconnected component."""
+        lo, hi = self._block_end[block], self._block_end[block + 1]
+        return sorted(set(self._edges_u[lo:hi]) | set(self._edges_v[lo:hi]))
+
+    def components(self) -> List[List[Tuple[int, int]]]:
+        """All biconnected components, each as a list of edges."""
+        return [self.block_edges(b) for b in range(self.num_blocks)]
+
+    def block_cut_tree(self) -> CSRGraph:
+        """
+        The block-cut tree (forest) as an undirected CSRGraph.
+
+        Node b < num_blocks is block b; node num_blocks + i is
+        articulation_points[i].
+        """
+        first = self.num_blocks
+        cut_node = {v: first + i for i, v in enumerate(self.articulation_points)}
+        seen = [-1] * self.num_vertices  # last block that linked vertex v
+        sources, targets = array("i"), array("i")
+        edges_u, edges_v, block_end = self._edges_u, self._edges_v, self._block_end
+        for b in range(self.num_blocks):
+            for i in range(block_end[b], block_end[b + 1]):
+                for v in (edges_u[i], edges_v[i]):
+                    if seen[v] != b and v in cut_node:
+                        seen[v] = b
+                        sources.append(b)
+                        targets.append(cut_node[v])
+        num_nodes = self.num_blocks + len(self.articulation_points)
+        return CSRGraph.from_arrays(num_nodes, sources, targets, directed=False)
+
+
+def biconnectivity(num_vertices: int, edges: List[List[int]]) -> Biconnectivity:
+    """
+    One low-link pass over an undirected edge list.
+
+    Args:
+        num_vertices: Number of vertices (0 to V-1)
+        edges: List of undirected edges; parallel edges allowed
+
+    Returns:
+        Biconnectivity with bridges, articulation points and blocks
+    """
+    return Biconnectivity(CSRGraph.from_edges(num_vertices, edges, directed=False))
+
+
+if __name__ == "__main__":
+    import time
+
+    # Example 1: Two triangles joined by the bridge 1-3, and a tail 5-6
+    edges1 = [[0, 1], [1, 2], [2, 0], [1, 3], [3, 4], [4, 5], [5, 3], [5, 6]]
+    result = biconnectivity(7, edges1)
+    print("Biconnectivity - Example 1")
+    print("=" * 50)
+    print(f"Bridges: {result.bridges}")  # Output: [(5, 6), (1, 3)]
+    print(f"Articulation points: {result.articulation_points}")  # Output: [1, 3, 5]
+    for b in range(result.num_blocks):
+        print(f"  Block {b}: vertices {result.block_vertices(b)}")
+    tree = result.block_cut_tree()
+    print(f"Block-cut tree: {[(u, v) for u, v, _ in tree.edges() if u < v]}")
+
+    # Example 2: A path of 200000 vertices (far past the recursion limit)
+    n = 200_000
+    path = CSRGraph.from_edges(n, [(i, i + 1) for i in range(n - 1)], directed=False)
+    start = time.perf_counter()
+    result = Biconnectivity(path)
+    elapsed = time.perf_counter() - start
+    print(f"\nExample 2 - path of {n} vertices")
+    print("=" * 50)
+    print(f"  bridges: {len(result.bridges)}, blocks: {result.num_blocks}")
+    print(f"  articulation points: {len(result.articulation_points)} ({elapsed:.2f}s)")
@@ -0,0 +1,339 @@
+"""
+Bitset Graph Coloring (DSATUR) and Maximum Clique (Tomita-style)
+
+graph_coloring.py and m_coloring.py test every color against every
+neighbor, one vertex at a time. Here the adjacency of vertex v is a
+Python int with bit u set for every neighbor u, so whole vertex sets are
+filtered with a single &, | or ~:
+
+- DSATUR: always color the vertex whose neighbors already use the most
+  distinct colors (its saturation, kept as a bitmask of colors), ties
+  broken by degree among the uncolored vertices. As a heuristic it gives
+  an upper bound on the chromatic number.
+- Exact m-coloring: DSATUR order backtracking. Assigning color c to v
+  adds c to the saturation mask of all uncolored neighbors at once; a
+  neighbor whose mask is full fails immediately (forward checking), and a
+  new color is only ever opened as the next unused index.
+- Maximum clique: branch and bound in the style of Tomita's MCQ/MCS. The
+  candidate set P is greedily colored with bitset color classes (a color
+  class is "P minus the neighbors of the vertices already in it"); a
+  vertex whose color number plus the clique size cannot beat the best
+  clique is never expanded. The clique size is a lower bound on the
+  chromatic number.
+- maximal_cliques(): Bron-Kerbosch with Tomita's pivot (the vertex of
+  P | X with most neighbors in P).
+
+chromatic_number() combines them: clique size <= chi <= DSATUR colors,
+and only the m in between are searched exactly.
+
+Time Complexity: O(V^2 / w) per DSATUR step on machine words of w bits;
+                 the exact searches are exponential in the worst case
+Space Complexity: O(V^2 / w)
+
+Reference: https://www.geeksforgeeks.org/dsatur-algorithm-for-graph-coloring/
+
+Run from the repository root: python -m graph.advanced.bitset_coloring
+"""
+
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+
+def bitset_adjacency(adj) -> List[int]:
+    """
+    Undirected bitset adjacency from an adjacency list or a CSRGraph.
+
+    Edges are made symmetric and self-loops are dropped.
+    """
+    n = len(adj)
+    bits = [0] * n
+    for u in range(n):
+        for v in adj[u]:
+            if u != v:
+                bits[u] |= 1 << v
+                bits[v] |= 1 << u
+    return bits
+
+
+def bitset_adjacency_from_matrix(matrix: Sequence[Sequence[int]]) -> List[int]:
+    """Undirected bitset adjacency from a 0/1 adjacency matrix."""
+    return bitset_adjacency([[j for j, x in enumerate(row) if x] for row in matrix])
+
+
+def _bits(mask: int) -> Iterator[int]:
+    """Indices of the set bits of mask, lowest first."""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+def dsatur_coloring(bits: List[int]) -> Tuple[List[int], int]:
+    """
+    DSATUR heuristic coloring.
+
+    Args:
+        bits: Bitset adjacency (see bitset_adjacency())
+
+    Returns:
+        Tuple of (coloring, num_colors) where coloring[i] = color of vertex i
+    """
+    n = len(bits)
+    color = [-1] * n
+    saturation = [0] * n  # bitmask of colors used by colored neighbors
+    degree = [b.bit_count() for b in bits]  # neighbors still uncolored
+    uncolored = (1 << n) - 1
+    num_colors = 0
+    for _ in range(n):
+        v = max(
+            _bits(uncolored),
+            key=lambda u: (saturation[u].bit_count(), degree[u]),
+        )
+        sat = saturation[v]
+        c = (~sat & (sat + 1)).bit_length() - 1  # lowest free color
+        color[v] = c
+        num_colors = max(num_colors, c + 1)
+        uncolored ^= 1 << v
+        for u in _bits(bits[v] & uncolored):
+            saturation[u] |= 1 << c
+            degree[u] -= 1
+    return color, num_colors
+
+
+def color_with_at_most(bits: List[int], m: int) -> Optional[List[int]]:
+    """
+    Exact m-coloring by DSATUR-order backtracking with forward checking.
+
+    Args:
+        bits: Bitset adjacency
+        m: Maximum number of colors
+
+    Returns:
+        Coloring with colors 0 to m-1, or None if m colors are not enough
+    """
+    n = len(bits)
+    if n == 0:
+        return []
+    if m <= 0:
+        return None
+    all_colors = (1 << m) - 1
+    color = [-1] * n
+    saturation = [0] * n
+
+    def search(uncolored: int, used: int) -> bool:
+        if not uncolored:
+            return True
+        v = max(
+            _bits(uncolored),
+            key=lambda u: (
+                saturation[u].bit_count(),
+                (bits[u] & uncolored).bit_count(),
+            ),
+        )
+        rest = uncolored ^ (1 << v)
+        neighbors = bits[v] & rest
+        # Colors 0..used-1 that v may take, then one new color (symmetry)
+        for c in range(min(used + 1, m)):
+            bit = 1 << c
+            if saturation[v] & bit:
+                continue
+            changed = [u for u in _bits(neighbors) if not saturation[u] & bit]
+            for u in changed:
+                saturation[u] |= bit
+            color[v] = c
+            if all(saturation[u] != all_colors for u in changed) and search(
+                rest, max(used, c + 1)
+            ):
+                return True
+            for u in changed:
+                saturation[u] ^= bit
+        color[v] = -1
+        return False
+
+    return color if search((1 << n) - 1, 0) else None
+
+
+def _greedy_color_classes(
+    bits: List[int], candidates: int, skip: int
+) -> Tuple[List[int], List[int]]:
+    """
+    Greedy coloring of a vertex set with bitset color classes.
+
+    Returns:
+        Parallel lists (vertices, colors) in non-decreasing color order;
+        vertices whose color is at most skip are left out, they can never
+        lead to a larger clique
+    """
+    order: List[int] = []
+    colors: List[int] = []
+    uncolored = candidates
+    k = 0
+    while uncolored:
+        k += 1
+        free = uncolored  # vertices that may still join color class k
+        while free:
+            low = free & -free
+            v = low.bit_length() - 1
+            uncolored ^= low
+            free &= ~bits[v] ^ low
+            if k > skip:
+                order.append(v)
+                colors.append(k)
+    return order, colors
+
+
+def max_clique(bits: List[int]) -> List[int]:
+    """
+    Maximum clique by coloring-bounded branch and bound (Tomita MCQ style).
+
+    Args:
+        bits: Bitset adjacency
+
+    Returns:
+        Sorted vertices of a maximum clique
+    """
+    n = len(bits)
+    # Relabel by non-increasing degree: the greedy color classes then give
+    # tighter bounds (MCQ's initial order)
+    order = sorted(range(n), key=lambda v: -bits[v].bit_count())
+    label = {v: i for i, v in enumerate(order)}
+    relabeled = [0] * n
+    for i, v in enumerate(order):
+        mask = 0
+        for u in _bits(bits[v]):
+            mask |= 1 << label[u]
+        relabeled[i] = mask
+
+    best: List[int] = []
+    clique: List[int] = []
+
+    def expand(candidates: int) -> None:
+        nonlocal best
+        vertices, colors = _greedy_color_classes(
+            relabeled, candidates, len(best) - len(clique)
+        )
+        for i in range(len(vertices) - 1, -1, -1):
+            if len(clique) + colors[i] <= len(best):
+                return
+            v = vertices[i]
+            clique.append(v)
+            rest = candidates & relabeled[v]
+            if rest:
+                expand(rest)
+            elif len(clique) > len(best):
+                best = clique[:]
+            clique.pop()
+            candidates &= ~(1 << v)
+
+    if n:
+        expand((1 << n) - 1)
+    return sorted(order[v] for v in best)
+
+
+def maximal_cliques(bits: List[int]) -> Iterator[List[int]]:
+    """
+    Every maximal clique (Bron-Kerbosch with Tomita pivoting).
+
+    Args:
+        bits: Bitset adjacency
+
+    Yields:
+        Sorted vertex lists of the maximal cliques
+    """
+    n = len(bits)
+    clique: List[int] = []
+    # Explicit stack of (P, X, branch vertices left); P and X are bitsets
+    stack = []
+
+    def branch(candidates: int, excluded: int) -> int:
+        union = candidates | excluded
+        pivot = max(_bits(union), key=lambda u: (candidates & bits[u]).bit_count())
+        return candidates & ~bits[pivot]
+
+    if n == 0:
+        return
+    full = (1 << n) - 1
+    stack.append((full, 0, branch(full, 0)))
+    while stack:
+        candidates, excluded, todo = stack[-1]
+        if not todo:
+            stack.pop()
+            if clique:
+                clique.pop()
+            continue
+        low = todo & -todo
+        v = low.bit_length() - 1
+        # Move v from P to X for the siblings that follow
+        stack[-1] = (candidates ^ low, excluded | low, todo ^ low)
+        clique.append(v)
+        p, x = candidates & bits[v], excluded & bits[v]
+        if not p and not x:
+            yield sorted(clique)
+            clique.pop()
+        elif not p:
+            clique.pop()  # not maximal: X can extend it
+        else:
+            stack.append((p, x, branch(p, x)))
+
+
+def chromatic_number(bits: List[int]) -> Tuple[int, List[int]]:
+    """
+    Exact chromatic number between the clique and DSATUR bounds.
+
+    Args:
+        bits: Bitset adjacency
+
+    Returns:
+        Tuple of (chromatic_number, coloring)
+    """
+    coloring, upper = dsatur_coloring(bits)
+    lower = len(max_clique(bits))
+    for m in range(lower, upper):
+        found = color_with_at_most(bits, m)
+        if found is not None:
+            return m, found
+    return upper, coloring
+
+
+if __name__ == "__main__":
+    import random
+    import time
+
+    # Example 1: The 5-vertex graph from graph_coloring.py
+    adj1 = [[1, 2], [0, 2, 3], [0, 1], [1, 4], [3]]
+    bits1 = bitset_adjacency(adj1)
+    print("Bitset coloring - Example 1")
+    print("=" * 50)
+    print(f"DSATUR: {dsatur_coloring(bits1)}")
+    print(f"Maximum clique: {max_clique(bits1)}")
+    print(f"Maximal cliques: {list(maximal_cliques(bits1))}")
+    print(f"Chromatic number: {chromatic_number(bits1)[0]}")  # Output: 3
+
+    # Example 2: Dense random graphs
+    print("\nExample 2 - random graphs")
+    print("=" * 50)
+    for n, p in ((200, 0.5), (300, 0.5), (150, 0.8)):
+        rng = random.Random(n)
+        adj = [[] for _ in range(n)]
+        for u in range(n):
+            for v in range(u + 1, n):
+                if rng.random() < p:
+                    adj[u].append(v)
+        bits = bitset_adjacency(adj)
+        start = time.perf_counter()
+        _, colors = dsatur_coloring(bits)
+        clique = max_clique(bits)
+        elapsed = time.perf_counter() - start
+        print(f"  n={n}, p={p}: {len(clique)} <= chi <= {colors} ({elapsed:.2f}s)")
+
+    # Example 3: Exact chromatic number of the Mycielski graph M4 (Groetzsch)
+    edges = [
+        (0, 1), (1, 2), (2, 3), (3, 4), (4, 0),
+        (5, 1), (5, 4), (6, 0), (6, 2), (7, 1), (7, 3), (8, 2), (8, 4), (9, 3), (9, 0),
+        (10, 5), (10, 6), (10, 7), (10, 8), (10, 9),
+    ]  # fmt: skip
+    adj3 = [[] for _ in range(11)]
+    for u, v in edges:
+        adj3[u].append(v)
+    bits3 = bitset_adjacency(adj3)
+    chi, _ = chromatic_number(bits3)
+    print(f"\nGroetzsch graph: clique {len(max_clique(bits3))}, chromatic number {chi}")
@@ -14,12 +14,20 @@ Interpretation:
 - low[v] > disc[u] means the subtree at v has no back edge to u or ancestors of u
 - Removing (u, v) disconnects v's subtree from the rest
 
+find_bridges() runs the single iterative low-link pass in biconnectivity.py,
+which also yields articulation points and blocks, so deep graphs no longer
+hit the recursion limit.
+
 Time Complexity: O(V + E)
 Space Complexity: O(V)
+
+Run from the repository root: python -m graph.advanced.bridges_in_graph
 """
 
 from typing import List, Tuple
 
+from graph.advanced.biconnectivity import biconnectivity
+
 
 def find_bridges(num_vertices: int, edges: List[List[int]]) -> List[Tuple[int, int]]:
     """
@@ -32,42 +40,7 @@ def find_bridges(num_vertices: int, edges: List[List[int]]) -> List[Tuple[int, i
     Returns:
         List of bridges as (u, v) tuples with u < v
     """
-    # Build adjacency list
-    adj: List[List[int]] = [[] for _ in range(num_vertices)]
-    for u, v in edges:
-        adj[u].append(v)
-        adj[v].append(u)
-
-    disc = [-1] * num_vertices
-    low = [-1] * num_vertices
-    parent = [-1] * num_vertices
-    bridges: List[Tuple[int, int]] = []
-    timer = [0]
-
-    def dfs(u: int) -> None:
-        disc[u] = low[u] = timer[0]
-        timer[0] += 1
-
-        for v in adj[u]:
-            if disc[v] == -1:  # v not visited
-                parent[v] = u
-                dfs(v)
-
-                # Update low value
-                low[u] = min(low[u], low[v])
-
-                # Check bridge condition
-                if low[v] > disc[u]:
-                    bridges.append((min(u, v), max(u, v)))
-
-            elif v != parent[u]:  # Back edge
-                low[u] = min(low[u], disc[v])
-
-    for i in range(num_vertices):
-        if disc[i] == -1:
-            dfs(i)
-
-    return bridges
+    return biconnectivity(num_vertices, edges).bridges
 
 
 class BridgeFinder:
@@ -19,14 +19,25 @@ Algorithm:
 4. Add the matched edges (duplicate them) to the graph
 5. Find Eulerian circuit in the augmented graph
 
+chinese_postman_route() also returns the walk: Dijkstra from every odd
+vertex instead of Floyd-Warshall, and the Eulerian circuit of the augmented
+multigraph from the streaming Hierholzer engine in eulerian_trail.py.
+
 Time Complexity: O(V^3 + 2^k * k^2) where k = number of odd vertices
 Space Complexity: O(V^2)
+
+Run from the repository root: python -m graph.advanced.chinese_postman
 """
 
+from itertools import pairwise
 from typing import List, Tuple, Dict, Optional
 from collections import defaultdict
 import sys
 
+from graph.advanced.eulerian_trail import eulerian_trail_list
+from graph.core.csr_graph import CSRGraph
+from graph.shortest_path.dijkstra import dijkstra, dijkstra_with_path
+
 
 def floyd_warshall(
     adj: Dict[Tuple[int, int], int], num_vertices: int
@@ -60,32 +71,29 @@ def floyd_warshall(
     return dist
 
 
-def min_weight_perfect_matching(dist: List[List[int]], odd_vertices: List[int]) -> int:
+def _min_weight_matching(
+    dist, odd_vertices: List[int]
+) -> Tuple[float, List[Tuple[int, int]]]:
     """
-    Find minimum weight perfect matching using dynamic programming.
+    Minimum weight perfect matching by bitmask DP, with the matched pairs.
 
     Args:
-        dist: All-pairs shortest path distances
-        odd_vertices: List of odd-degree vertex indices
+        dist: dist[u][v] = shortest distance, for u in odd_vertices
+        odd_vertices: Vertices to match (even count)
 
     Returns:
-        Minimum total weight of the matching
+        Tuple of (total_weight, pairs of matched vertices)
     """
     k = len(odd_vertices)
-    if k == 0:
-        return 0
-    if k % 2 != 0:
-        return -1  # Impossible
-
-    # DP with bitmask
     full_mask = (1 << k) - 1
-    memo: Dict[int, int] = {}
+    # memo[mask] = (cost to match the rest, partner of the first free vertex)
+    memo: Dict[int, Tuple[float, int]] = {}
 
-    def dp(mask: int) -> int:
+    def dp(mask: int) -> float:
         if mask == full_mask:
             return 0
         if mask in memo:
-            return memo[mask]
+            return memo[mask][0]
 
         # Find first unmatched vertex
         i = 0
@@ -93,17 +101,48 @@ def min_weight_perfect_matching(dist: List[List[int]], odd_vertices: List[int])
             i += 1
 
         # Try pairing i with any unmatched j
-        result = float("inf")
+        result, partner = float("inf"), -1
         for j in range(i + 1, k):
             if not (mask & (1 << j)):
                 new_mask = mask | (1 << i) | (1 << j)
-                cost = dist[odd_vertices[i]][odd_vertices[j]]
-                result = min(result, cost + dp(new_mask))
+                cost = dist[odd_vertices[i]][odd_vertices[j]] + dp(new_mask)
+                if cost < result:
+                    result, partner = cost, j
 
-        memo[mask] = result
+        memo[mask] = (result, partner)
         return result
 
-    return dp(0)
+    total = dp(0)
+    pairs = []
+    mask = 0
+    while mask != full_mask and memo[mask][1] >= 0:
+        i = 0
+        while mask & (1 << i):
+            i += 1
+        j = memo[mask][1]
+        pairs.append((odd_vertices[i], odd_vertices[j]))
+        mask |= (1 << i) | (1 << j)
+    return total, pairs
+
+
+def min_weight_perfect_matching(dist: List[List[int]], odd_vertices: List[int]) -> int:
+    """
+    Find minimum weight perfect matching using dynamic programming.
+
+    Args:
+        dist: All-pairs shortest path distances
+        odd_vertices: List of odd-degree vertex indices
+
+    Returns:
+        Minimum total weight of the matching
+    """
+    k = len(odd_vertices)
+    if k == 0:
+        return 0
+    if k % 2 != 0:
+        return -1  # Impossible
+
+    return _min_weight_matching(dist, odd_vertices)[0]
 
 
 def chinese_postman(num_vertices: int, edges: List[Tuple[int, int, int]]) -> Dict:
@@ -182,6 +221,43 @@ def solve_chinese_postman_simple(edges: List[Tuple[int, int, int]]) -> int:
     return chinese_postman(n, edges)["total_distance"]
 
 
+def chinese_postman_route(
+    num_vertices: int, edges: List[Tuple[int, int, int]], start: int = 0
+) -> Tuple[int, List[int]]:
+    """
+    Solve the Chinese Postman Problem and return the route itself.
+
+    The odd vertices are matched on Dijkstra distances (one run per odd
+    vertex instead of Floyd-Warshall over all V), the shortest path of
+    every matched pair is added as duplicate edges, and the closed walk is
+    the Eulerian circuit of the result (eulerian_trail.py).
+
+    Args:
+        num_vertices: Number of vertices
+        edges: List of (u, v, weight) tuples
+        start: Vertex the postman starts and ends at
+
+    Returns:
+        Tuple of (total_distance, route as a closed list of vertices); the
+        route is empty if the graph is disconnected or start has no edges
+    """
+    if not edges:
+        return 0, [start]
+
+    graph = CSRGraph.from_edges(num_vertices, edges, directed=False)
+    odd_vertices = [v for v in range(num_vertices) if graph.degree(v) % 2 == 1]
+    dist = {u: dijkstra(graph, u) for u in odd_vertices}
+    matching_cost, pairs = _min_weight_matching(dist, odd_vertices)
+
+    walk_edges = [(u, v) for u, v, _ in edges]
+    for u, v in pairs:
+        _, path = dijkstra_with_path(graph, u, v)
+        walk_edges.extend(pairwise(path))
+
+    route = eulerian_trail_list(num_vertices, walk_edges, start=start)
+    return sum(w for _, _, w in edges) + matching_cost, route
+
+
 if __name__ == "__main__":
     # Example 1: Eulerian graph (all even degrees)
     print("=== Example 1: Eulerian Graph ===")
@@ -215,3 +291,8 @@ if __name__ == "__main__":
     print("\n=== Example 3: Simple Function ===")
     result3 = solve_chinese_postman_simple(edges2)
     print(f"Minimum route: {result3}")
+
+    # Example 4: The route itself
+    print("\n=== Example 4: Postman Route ===")
+    distance, route = chinese_postman_route(4, edges2)
+    print(f"Route ({distance}): {' -> '.join(map(str, route))}")
@@ -9,9 +9,16 @@ Approach 2: Dynamic Programming - O(V^3 * K)
 Approach 3: Matrix Exponentiation - O(V^3 * log K)
 
 A walk can visit the same vertex/edge multiple times (unlike a path).
+
+Approach 3 runs on the flat-buffer engine in walk_counting.py, which also
+takes a modulus, so K = 10^18 is answered with about 120 matrix products.
+
+Run from the repository root: python -m graph.advanced.count_walks_with_k_edges
 """
 
-from typing import List
+from typing import List, Optional
+
+from graph.advanced.walk_counting import count_walks, walk_counts
 
 
 def count_walks_recursive(
@@ -123,31 +130,19 @@ def matrix_multiply(a: List[List[int]], b: List[List[int]]) -> List[List[int]]:
 
 
 def matrix_power(matrix: List[List[int]], k: int) -> List[List[int]]:
-    """Compute matrix^k using binary exponentiation."""
-    n = len(matrix)
-    result = [[0] * n for _ in range(n)]
-    for i in range(n):
-        result[i][i] = 1
-
-    base = [row[:] for row in matrix]
-
-    while k > 0:
-        if k % 2 == 1:
-            result = matrix_multiply(result, base)
-        base = matrix_multiply(base, base)
-        k //= 2
-
-    return result
+    """Compute matrix^k (k >= 0) using binary exponentiation."""
+    return walk_counts(matrix, k, method="python")
 
 
 def count_walks_matrix_exponentiation(
-    adj_matrix: List[List[int]], src: int, dest: int, k: int
+    adj_matrix: List[List[int]], src: int, dest: int, k: int, mod: Optional[int] = None
 ) -> int:
     """
     Count walks using matrix exponentiation.
 
     The (src, dest) entry of adj_matrix^k gives the number of walks
-    from src to dest with exactly k edges.
+    from src to dest with exactly k edges. Only row src of the power is
+    carried along, on flat buffers (see walk_counting.py).
 
     Time Complexity: O(V^3 * log K)
     Space Complexity: O(V^2)
@@ -157,15 +152,15 @@ def count_walks_matrix_exponentiation(
         src: Source vertex
         dest: Destination vertex
         k: Exact number of edges
+        mod: Optional modulus for the count (needed for huge k)
 
     Returns:
-        Number of walks with exactly k edges
-    """
-    if k == 0:
-        return 1 if src == dest else 0
+        Number of walks with exactly k edges (modulo mod)
 
-    result_matrix = matrix_power(adj_matrix, k)
-    return result_matrix[src][dest]
+    Raises:
+        ValueError: If k is negative
+    """
+    return count_walks(adj_matrix, src, dest, k, mod)
 
 
 if __name__ == "__main__":
@@ -206,3 +201,9 @@ if __name__ == "__main__":
     r2 = count_walks_matrix_exponentiation(adj2, 0, 0, k2)
     print(f"Walks from 0 to 0 with {k2} edges (DP): {r1}")
     print(f"Walks from 0 to 0 with {k2} edges (Matrix): {r2}")
+
+    # Example 5: Huge k, modulo 10^9 + 7
+    print("\n=== Example 5: k = 10^18, mod 10^9 + 7 ===")
+    adj3 = [[1, 1, 0], [1, 0, 1], [0, 1, 1]]
+    r3 = count_walks_matrix_exponentiation(adj3, 0, 2, 10**18, 10**9 + 7)
+    print(f"Walks from 0 to 2 with 10^18 edges (mod 10^9 + 7): {r3}")
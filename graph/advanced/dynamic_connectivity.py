@@ -0,0 +1,382 @@
+"""
+Dynamic Connectivity - Incremental (Union-Find) and Fully Dynamic (Offline)
+
+Support these operations on an undirected graph over n vertices:
+1. Union / add_edge(u, v): Connect u and v
+2. remove_edge(u, v): Delete an edge again (fully dynamic version only)
+3. Connected(u, v): Check if u and v are in the same component
+
+Incremental version (UnionFind): only unions are added (no deletions).
+
+Optimizations:
+- Path Compression: Flatten the tree during find operations
+- Union by Rank/Size: Attach shorter tree under taller tree
+
+Time Complexity (with both optimizations):
+- Find: O(alpha(n)) ~ O(1) amortized
+- Union: O(alpha(n)) ~ O(1) amortized
+- Connected: O(alpha(n)) ~ O(1) amortized
+
+where alpha is the inverse Ackermann function
+
+Fully dynamic version (OfflineDynamicConnectivity): edges can also be
+deleted, e.g. when network links fail. Union-find cannot split a set, so
+the operation stream is solved offline with divide and conquer over time:
+- Every edge is alive on an interval of queries [first, last). The
+  interval is inserted into a segment tree over the query indices, so it
+  is stored in O(log Q) nodes.
+- A DFS over the segment tree unions the edges of a node on the way down
+  and undoes them on the way back up. ArrayDisjointSet(n, rollback=True)
+  uses union by size without path compression, so undo is just popping
+  a log.
+- Each leaf is one query and is answered with the unions of all nodes on
+  its root path, i.e. exactly the edges alive at that moment.
+
+Time Complexity (fully dynamic): O(m log Q log n) for m edge operations and
+Q queries, i.e. polylog per operation
+Space Complexity: O(n + m log Q)
+
+Run from the repository root: python -m graph.advanced.dynamic_connectivity
+"""
+
+from typing import Dict, List, Tuple
+
+from graph.disjoint_set.union_by_rank_path_compression import ArrayDisjointSet
+
+
+class UnionFind:
+    """Union-Find (Disjoint Set Union) with path compression and union by rank."""
+
+    def __init__(self, n: int):
+        """
+        Initialize Union-Find with n elements (0 to n-1).
+
+        Args:
+            n: Number of elements
+        """
+        self.parent = list(range(n))
+        self.rank = [0] * n
+        self.size = [1] * n
+        self.num_components = n
+
+    def find(self, x: int) -> int:
+        """
+        Find the representative of the set containing x with path compression.
+
+        Args:
+            x: Element to find
+
+        Returns:
+            Representative (root) of the set
+        """
+        if self.parent[x] != x:
+            self.parent[x] = self.find(self.parent[x])  # Path compression
+        return self.parent[x]
+
+    def union(self, x: int, y: int) -> bool:
+        """
+        Union the sets containing x and y by rank.
+
+        Args:
+            x: First element
+            y: Second element
+
+        Returns:
+            True if union was performed (different sets), False if already same set
+        """
+        root_x = self.find(x)
+        root_y = self.find(y)
+
+        if root_x == root_y:
+            return False  # Already in same set
+
+        # Union by rank
+        if self.rank[root_x] < self.rank[root_y]:
+            root_x, root_y = root_y, root_x
+
+        self.parent[root_y] = root_x
+        if self.rank[root_x] == self.rank[root_y]:
+            self.rank[root_x] += 1
+
+        self.size[root_x] += self.size[root_y]
+        self.num_components -= 1
+
+        return True
+
+    def connected(self, x: int, y: int) -> bool:
+        """Check if x and y are in the same set."""
+        return self.find(x) == self.find(y)
+
+    def get_size(self, x: int) -> int:
+        """Get the size of the set containing x."""
+        return self.size[self.find(x)]
+
+    def get_components(self) -> Dict[int, List[int]]:
+        """
+        Get all connected components.
+
+        Returns:
+            Dictionary mapping root -> list of elements in that component
+        """
+        components: Dict[int, List[int]] = {}
+        for i in range(len(self.parent)):
+            root = self.find(i)
+            if root not in components:
+                components[root] = []
+            components[root].append(i)
+        return components
+
+
+class UnionFindByName:
+    """Union-Find for elements identified by names/labels instead of integers."""
+
+    def __init__(self):
+        self.parent: Dict[str, str] = {}
+        self.rank: Dict[str, int] = {}
+        self.size: Dict[str, int] = {}
+
+    def _make_set(self, x: str) -> None:
+        """Create a new set for element x if it doesn't exist."""
+        if x not in self.parent:
+            self.parent[x] = x
+            self.rank[x] = 0
+            self.size[x] = 1
+
+    def find(self, x: str) -> str:
+        """Find representative with path compression."""
+        self._make_set(x)
+        if self.parent[x] != x:
+            self.parent[x] = self.find(self.parent[x])
+        return self.parent[x]
+
+    def union(self, x: str, y: str) -> bool:
+        """Union by rank."""
+        self._make_set(x)
+        self._make_set(y)
+
+        root_x = self.find(x)
+        root_y = self.find(y)
+
+        if root_x == root_y:
+            return False
+
+        if self.rank[root_x] < self.rank[root_y]:
+            root_x, root_y = root_y, root_x
+
+        self.parent[root_y] = root_x
+        if self.rank[root_x] == self.rank[root_y]:
+            self.rank[root_x] += 1
+        self.size[root_x] += self.size[root_y]
+
+        return True
+
+    def connected(self, x: str, y: str) -> bool:
+        """Check connectivity."""
+        return self.find(x) == self.find(y)
+
+
+def count_connected_components(n: int, edges: List[List[int]]) -> int:
+    """
+    Count the number of connected components in an undirected graph.
+
+    Args:
+        n: Number of vertices
+        edges: List of edges
+
+    Returns:
+        Number of connected components
+    """
+    dsu = ArrayDisjointSet(n)
+    dsu.union_many(edges)
+    return dsu.num_sets
+
+
+class OfflineDynamicConnectivity:
+    """
+    Fully dynamic connectivity over a recorded operation stream.
+
+    Record edge insertions, deletions and queries in order, then call
+    solve() once to get every query answer.
+    """
+
+    def __init__(self, n: int):
+        """
+        Args:
+            n: Number of vertices (0 to n-1)
+        """
+        self.n = n
+        self.queries: List[Tuple[int, int]] = []  # (u, v), or (-1, -1) = count
+        self.intervals: List[Tuple[int, int, int, int]] = []  # (u, v, lo, hi)
+        self._open: Dict[Tuple[int, int], List[int]] = {}
+
+    def add_edge(self, u: int, v: int) -> None:
+        """Insert edge u - v (parallel copies are counted separately)."""
+        key = (u, v) if u < v else (v, u)
+        self._open.setdefault(key, []).append(len(self.queries))
+
+    def remove_edge(self, u: int, v: int) -> None:
+        """
+        Delete one copy of edge u - v.
+
+        Raises:
+            KeyError: If the edge is not present
+        """
+        key = (u, v) if u < v else (v, u)
+        starts = self._open.get(key)
+        if not starts:
+            raise KeyError(f"edge {key} is not present")
+        start = starts.pop()
+        if start < len(self.queries):
+            self.intervals.append((key[0], key[1], start, len(self.queries)))
+
+    def connected(self, u: int, v: int) -> int:
+        """Record the query connected(u, v); returns its answer index."""
+        self.queries.append((u, v))
+        return len(self.queries) - 1
+
+    def count_components(self) -> int:
+        """Record a component-count query; returns its answer index."""
+        self.queries.append((-1, -1))
+        return len(self.queries) - 1
+
+    def solve(self) -> list:
+        """
+        Answer every recorded query.
+
+        Returns:
+            List indexed by query index: bool for connected(), int for
+            count_components()
+        """
+        q = len(self.queries)
+        answers: list = [None] * q
+        if q == 0:
+            return answers
+
+        # Segment tree over query indices; node k covers [lo, hi)
+        nodes: Dict[int, List[Tuple[int, int]]] = {}
+
+        def insert(k: int, lo: int, hi: int, a: int, b: int, edge) -> None:
+            if a <= lo and hi <= b:
+                nodes.setdefault(k, []).append(edge)
+                return
+            mid = (lo + hi) // 2
+            if a < mid:
+                insert(2 * k, lo, mid, a, b, edge)
+            if b > mid:
+                insert(2 * k + 1, mid, hi, a, b, edge)
+
+        intervals = list(self.intervals)
+        for (u, v), starts in self._open.items():
+            intervals.extend((u, v, start, q) for start in starts if start < q)
+        for u, v, a, b in intervals:
+            insert(1, 0, q, a, b, (u, v))
+
+        dsu = ArrayDisjointSet(self.n, rollback=True)
+
+        def dfs(k: int, lo: int, hi: int) -> None:
+            checkpoint = dsu.checkpoint()
+            for u, v in nodes.get(k, ()):
+                dsu.union(u, v)
+            if hi - lo == 1:
+                u, v = self.queries[lo]
+                if u == -1:
+                    answers[lo] = dsu.num_sets
+                else:
+                    answers[lo] = dsu.find(u) == dsu.find(v)
+            else:
+                mid = (lo + hi) // 2
+                dfs(2 * k, lo, mid)
+                dfs(2 * k + 1, mid, hi)
+            dsu.rollback(checkpoint)
+
+        dfs(1, 0, q)
+        return answers
+
+
+def dynamic_connectivity(n: int, operations: List[Tuple]) -> list:
+    """
+    Answer a mixed stream of edge insertions, deletions and queries.
+
+    Args:
+        n: Number of vertices
+        operations: ("add", u, v), ("remove", u, v), ("connected", u, v)
+                    or ("count",) tuples in time order
+
+    Returns:
+        Answers of the connected/count operations, in order
+    """
+    solver = OfflineDynamicConnectivity(n)
+    for op in operations:
+        if op[0] == "add":
+            solver.add_edge(op[1], op[2])
+        elif op[0] == "remove":
+            solver.remove_edge(op[1], op[2])
+        elif op[0] == "connected":
+            solver.connected(op[1], op[2])
+        elif op[0] == "count":
+            solver.count_components()
+        else:
+            raise ValueError(f"unknown operation: {op[0]!r}")
+    return solver.solve()
+
+
+if __name__ == "__main__":
+    # Example 1: Basic Union-Find operations
+    print("=== Example 1: Basic Operations ===")
+    uf = UnionFind(10)
+    uf.union(0, 1)
+    uf.union(2, 3)
+    uf.union(4, 5)
+    uf.union(6, 7)
+    uf.union(8, 9)
+    uf.union(1, 3)
+
+    print(f"Components: {uf.num_components}")
+    print(f"0 and 2 connected: {uf.connected(0, 2)}")
+    print(f"0 and 1 connected: {uf.connected(0, 1)}")
+    print(f"Size of component containing 0: {uf.get_size(0)}")
+
+    # Example 2: Get all components
+    print("\n=== Example 2: All Components ===")
+    uf2 = UnionFind(8)
+    uf2.union(0, 1)
+    uf2.union(1, 2)
+    uf2.union(3, 4)
+    uf2.union(5, 6)
+    uf2.union(6, 7)
+
+    components = uf2.get_components()
+    for root, members in components.items():
+        print(f"  Component {root}: {members}")
+
+    # Example 3: Count connected components
+    print("\n=== Example 3: Count Components ===")
+    edges = [[0, 1], [1, 2], [3, 4], [5, 6]]
+    count = count_connected_components(7, edges)
+    print(f"Connected components: {count}")  # 7 vertices, 3 edges -> 4 components
+
+    # Example 4: Union-Find by name
+    print("\n=== Example 4: Named Elements ===")
+    uf3 = UnionFindByName()
+    uf3.union("Alice", "Bob")
+    uf3.union("Bob", "Charlie")
+    uf3.union("Dave", "Eve")
+
+    print(f"Alice connected to Charlie: {uf3.connected('Alice', 'Charlie')}")
+    print(f"Alice connected to Dave: {uf3.connected('Alice', 'Dave')}")
+
+    # Example 5: Fully dynamic - links fail and come back
+    print("\n=== Example 5: Fully Dynamic (Link Failures) ===")
+    ops = [
+        ("add", 0, 1),
+        ("add", 1, 2),
+        ("add", 2, 3),
+        ("connected", 0, 3),  # True
+        ("remove", 1, 2),  # link 1-2 fails
+        ("connected", 0, 3),  # False
+        ("count",),  # {0, 1}, {2, 3} -> 2
+        ("add", 0, 3),  # backup link
+        ("connected", 1, 2),  # True via 1-0-3-2
+        ("count",),  # 1
+    ]
+    print(f"Answers: {dynamic_connectivity(4, ops)}")
@@ -13,13 +13,33 @@ Properties of G(n, p):
 - When p > ln(n)/n: graph is almost surely connected
 - When p = c/n (c > 1): giant component emerges
 
-Time Complexity: O(n^2) for G(n, p), O(M) for G(n, M)
-Space Complexity: O(n^2) or O(M) depending on representation
+Both generators number the vertex pairs and sample pair indices with the
+skipping samplers of graph/core/random_graphs.py, so G(n, p) no longer
+draws a random number for every one of the n(n-1)/2 pairs. They use the
+global random module (random.seed() reproduces a graph); for
+million-vertex CSR fixtures use gnp_random_graph() / gnm_random_graph()
+there.
+
+Time Complexity: O(n + M) expected for both (M = number of edges)
+Space Complexity: O(n + M)
+
+Run from the repository root: python -m graph.advanced.erdos_renyi_model
 """
 
 import random
 from typing import List, Tuple, Set, Dict
 
+from graph.core.random_graphs import decode_pairs, pair_count, sample_pairs, skip_sample
+
+
+def _adjacency(n: int, indices) -> List[List[int]]:
+    """Undirected adjacency list of the sampled pair indices."""
+    adj: List[List[int]] = [[] for _ in range(n)]
+    for u, v in zip(*decode_pairs(indices, n)):
+        adj[u].append(v)
+        adj[v].append(u)
+    return adj
+
 
 def erdos_renyi_gnm(n: int, m: int) -> List[List[int]]:
     """
@@ -35,22 +55,8 @@ def erdos_renyi_gnm(n: int, m: int) -> List[List[int]]:
     Raises:
         ValueError: If m > n*(n-1)/2
     """
-    max_edges = n * (n - 1) // 2
-    if m > max_edges:
-        raise ValueError(
-            f"Cannot have {m} edges in graph with {n} vertices (max: {max_edges})"
-        )
-
-    # Select m unique edges
-    all_edges = [(i, j) for i in range(n) for j in range(i + 1, n)]
-    selected = random.sample(all_edges, m)
-
-    adj: List[List[int]] = [[] for _ in range(n)]
-    for u, v in selected:
-        adj[u].append(v)
-        adj[v].append(u)
-
-    return adj
+    # Select m unique pair indices (raises ValueError if m is too large)
+    return _adjacency(n, sample_pairs(n, m, rng=random))
 
 
 def erdos_renyi_gnp(n: int, p: float) -> List[List[int]]:
@@ -67,15 +73,8 @@ def erdos_renyi_gnp(n: int, p: float) -> List[List[int]]:
     if not 0.0 <= p <= 1.0:
         raise ValueError("p must be between 0 and 1")
 
-    adj: List[List[int]] = [[] for _ in range(n)]
-
-    for i in range(n):
-        for j in range(i + 1, n):
-            if random.random() < p:
-                adj[i].append(j)
-                adj[j].append(i)
-
-    return adj
+    # Geometric skipping: jump straight to the next chosen pair
+    return _adjacency(n, skip_sample(pair_count(n), p, random))
 
 
 def count_edges(adj: List[List[int]]) -> int:
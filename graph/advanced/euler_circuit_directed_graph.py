@@ -10,11 +10,15 @@ and degree comparison for the Eulerian circuit condition.
 
 Time Complexity: O(V + E)
 Space Complexity: O(V)
+
+Run from the repository root: python -m graph.advanced.euler_circuit_directed_graph
 """
 
 from typing import List
 from collections import defaultdict
 
+from graph.advanced.eulerian_trail import eulerian_trail_list
+
 
 class DirectedEulerGraph:
     """Directed graph with Eulerian circuit detection."""
@@ -30,11 +34,15 @@ class DirectedEulerGraph:
         self.in_degree[v] += 1
 
     def _dfs(self, v: int, visited: List[bool]) -> None:
-        """DFS traversal."""
+        """DFS traversal (explicit stack, no recursion limit)."""
         visited[v] = True
-        for neighbor in self.adj[v]:
-            if not visited[neighbor]:
-                self._dfs(neighbor, visited)
+        stack = [v]
+        while stack:
+            u = stack.pop()
+            for neighbor in self.adj[u]:
+                if not visited[neighbor]:
+                    visited[neighbor] = True
+                    stack.append(neighbor)
 
     def _get_transpose(self) -> "DirectedEulerGraph":
         """Get the transpose (reversed) graph."""
@@ -129,6 +137,18 @@ class DirectedEulerGraph:
 
         return plus_one <= 1 and minus_one <= 1
 
+    def find_eulerian_trail(self) -> List[int]:
+        """
+        Find the Eulerian circuit, or else an Eulerian path.
+
+        Runs the iterative Hierholzer engine in eulerian_trail.py.
+
+        Returns:
+            List of vertices in order, or empty if neither exists
+        """
+        edges = [(u, v) for u in range(self.num_vertices) for v in self.adj[u]]
+        return eulerian_trail_list(self.num_vertices, edges, directed=True)
+
 
 def check_eulerian_directed(num_vertices: int, edges: List[List[int]]) -> str:
     """
@@ -164,6 +184,7 @@ if __name__ == "__main__":
     g1.add_edge(4, 0)
 
     print(f"Has Eulerian Cycle: {g1.is_eulerian_cycle()}")
+    print(f"Circuit: {g1.find_eulerian_trail()}")
 
     # Example 2: Not Eulerian
     print("\n=== Example 2: Not Eulerian ===")
@@ -17,13 +17,19 @@ Conditions for Directed Graph:
   at most one vertex has (in_degree - out_degree) = 1, all others have
   equal in/out degree, and underlying undirected graph is connected
 
+Finding the path: eulerian_trail.py (iterative Hierholzer on CSR).
+
 Time Complexity: O(V + E)
 Space Complexity: O(V)
+
+Run from the repository root: python -m graph.advanced.eulerian_path_and_circuit
 """
 
 from typing import List
 from collections import defaultdict
 
+from graph.advanced.eulerian_trail import eulerian_trail_list
+
 
 def is_eulerian_undirected(num_vertices: int, adj: List[List[int]]) -> int:
     """
@@ -39,12 +45,6 @@ def is_eulerian_undirected(num_vertices: int, adj: List[List[int]]) -> int:
         0 if neither
     """
 
-    def dfs(node: int, visited: List[bool]) -> None:
-        visited[node] = True
-        for neighbor in adj[node]:
-            if not visited[neighbor]:
-                dfs(neighbor, visited)
-
     # Find first vertex with non-zero degree
     start = -1
     for i in range(num_vertices):
@@ -58,7 +58,14 @@ def is_eulerian_undirected(num_vertices: int, adj: List[List[int]]) -> int:
 
     # Check connectivity of non-zero degree vertices
     visited = [False] * num_vertices
-    dfs(start, visited)
+    visited[start] = True
+    stack = [start]
+    while stack:
+        node = stack.pop()
+        for neighbor in adj[node]:
+            if not visited[neighbor]:
+                visited[neighbor] = True
+                stack.append(neighbor)
 
     for i in range(num_vertices):
         if len(adj[i]) > 0 and not visited[i]:
@@ -88,11 +95,6 @@ class EulerianGraphUndirected:
         self.graph[v].append(u)
         self.edges_count[(min(u, v), max(u, v))] += 1
 
-    def _remove_edge(self, u: int, v: int) -> None:
-        """Remove one instance of edge u-v."""
-        self.graph[u].remove(v)
-        self.graph[v].remove(u)
-
     def _is_connected(self) -> bool:
         """Check if all non-zero degree vertices are connected."""
         visited = {node: False for node in self.graph}
@@ -115,7 +117,7 @@ class EulerianGraphUndirected:
                     visited[neighbor] = True
                     stack.append(neighbor)
 
-        return all(not visited[node] or len(self.graph[node]) == 0 for node in visited)
+        return all(visited[node] or len(self.graph[node]) == 0 for node in visited)
 
     def is_eulerian(self) -> str:
         """
@@ -135,27 +137,12 @@ class EulerianGraphUndirected:
             return "Eulerian Path"
         return "Not Eulerian"
 
-    def _is_bridge(self, u: int, v: int) -> bool:
-        """Check if edge (u, v) is a bridge."""
-        self._remove_edge(u, v)
-        visited = {node: False for node in self.graph}
-        visited[u] = True
-        stack = [u]
-        while stack:
-            node = stack.pop()
-            for neighbor in self.graph[node]:
-                if not visited[neighbor]:
-                    visited[neighbor] = True
-                    stack.append(neighbor)
-
-        self.graph[u].append(v)
-        self.graph[v].append(u)
-
-        return not visited[v]
-
     def find_eulerian_path(self) -> List[int]:
         """
-        Find an Eulerian path using Fleury's algorithm.
+        Find an Eulerian path (or circuit) with Hierholzer's algorithm.
+
+        Uses the streaming engine in eulerian_trail.py instead of Fleury's
+        bridge test before every step (O(E^2)). The graph is not modified.
 
         Returns:
             List of vertices in the Eulerian path
@@ -165,32 +152,23 @@ class EulerianGraphUndirected:
             return []
 
         # Find start vertex
-        start = next(iter(self.graph))
-        for node in self.graph:
+        nodes = [node for node in self.graph if self.graph[node]]
+        if not nodes:
+            return []
+        start = nodes[0]
+        for node in nodes:
             if len(self.graph[node]) % 2 != 0:
                 start = node
                 break
 
-        path = [start]
-        current = start
-
-        while self.graph[current]:
-            next_vertex = None
-            if len(self.graph[current]) == 1:
-                next_vertex = self.graph[current][0]
-            else:
-                for neighbor in self.graph[current]:
-                    if not self._is_bridge(current, neighbor):
-                        next_vertex = neighbor
-                        break
-                if next_vertex is None:
-                    next_vertex = self.graph[current][0]
-
-            path.append(next_vertex)
-            self._remove_edge(current, next_vertex)
-            current = next_vertex
-
-        return path
+        index = {node: i for i, node in enumerate(nodes)}
+        edges = [
+            (index[u], index[v])
+            for (u, v), count in self.edges_count.items()
+            for _ in range(count)
+        ]
+        trail = eulerian_trail_list(len(nodes), edges, start=index[start])
+        return [nodes[i] for i in trail]
 
 
 if __name__ == "__main__":
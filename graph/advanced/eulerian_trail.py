@@ -0,0 +1,230 @@
+"""
+Streaming Eulerian Trail (Iterative Hierholzer on CSR)
+
+hierholzers_algorithm.py copies the adjacency lists and pops neighbors,
+fleurys_algorithm.py re-checks bridges before every step (O(E^2)) and
+recurses once per edge, so neither gets far past Python's recursion limit
+or a few thousand edges. This engine handles multigraphs with millions of
+edges:
+
+- The edges are stored once in a CSRGraph (graph/core/csr_graph.py) whose
+  arc weights are edge ids, so both arcs of an undirected edge share one id
+  and a bytearray marks used edges.
+- Every vertex keeps a pointer to its first arc that may still be unused;
+  pointers only move forward, so all arc scans together take O(E).
+- Hierholzer's stack lives in two flat arrays (vertices and the edge ids
+  used to reach them). A vertex is final when it is popped.
+
+Popping gives the trail back to front. For a directed graph the walk is
+therefore done on the transpose, starting at the trail's end: its pop
+order is the trail of the original graph from front to back. An undirected
+trail read backwards is a trail, so the walk starts at the far end. Either
+way vertices are yielded in trail order as soon as they are final.
+
+Degree conditions are checked before the first vertex is yielded; a
+disconnected edge set can only be detected when the walk gets stuck, so
+ValueError is raised at the end of the stream then.
+
+Time Complexity: O(V + E)
+Space Complexity: O(V + E) machine words
+
+Reference: https://www.geeksforgeeks.org/hierholzers-algorithm-directed-graph/
+
+Run from the repository root: python -m graph.advanced.eulerian_trail
+"""
+
+from array import array
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+from graph.core.csr_graph import CSRGraph
+
+
+def _trail_graph(
+    num_vertices: int, edges: Sequence[Tuple[int, int]], directed: bool
+) -> CSRGraph:
+    """CSR adjacency whose arc weights are the edge indices."""
+    typecode = "i" if len(edges) <= 2**31 - 1 else "q"
+    sources = array(typecode, [e[0] for e in edges])
+    targets = array(typecode, [e[1] for e in edges])
+    if directed:
+        # Walked backwards, see the module docstring
+        sources, targets = targets, sources
+    return CSRGraph.from_arrays(
+        num_vertices, sources, targets, array("q", range(len(edges))), directed
+    )
+
+
+def _walk_start(
+    num_vertices: int, edges: Sequence[Tuple[int, int]], directed: bool, start
+) -> Tuple[int, int]:
+    """
+    Check the degree conditions and choose where the trail starts and ends.
+
+    Raises:
+        ValueError: If no Eulerian trail (from start) can exist
+    """
+    if start is not None and not 0 <= start < num_vertices:
+        raise ValueError(f"start vertex {start} is out of range")
+    degree = [0] * num_vertices  # out-degree, or the degree when undirected
+    balance = [0] * num_vertices  # out - in
+    for u, v in edges:
+        degree[u] += 1
+        if directed:
+            balance[u] += 1
+            balance[v] -= 1
+        else:
+            degree[v] += 1
+    if directed:
+        heads = [v for v in range(num_vertices) if balance[v] == 1]
+        tails = [v for v in range(num_vertices) if balance[v] == -1]
+        if len(heads) > 1 or len(heads) != len(tails) or any(
+            abs(b) > 1 for b in balance
+        ):
+            raise ValueError("in- and out-degrees do not allow an Eulerian trail")
+        ends = (heads[0], tails[0]) if heads else None
+    else:
+        odd = [v for v in range(num_vertices) if degree[v] % 2]
+        if len(odd) > 2:
+            raise ValueError("more than two vertices of odd degree")
+        ends = (odd[0], odd[1]) if odd else None
+
+    if ends is None:  # a circuit: start anywhere on an edge
+        if start is None:
+            start = edges[0][0] if edges else 0
+        elif edges and not degree[start]:
+            raise ValueError(f"vertex {start} has no edges")
+        return start, start
+    if start is None or start == ends[0]:
+        return ends
+    if not directed and start == ends[1]:
+        return ends[1], ends[0]
+    raise ValueError(f"an Eulerian trail cannot start at vertex {start}")
+
+
+def _hierholzer(graph: CSRGraph, walk_from: int, num_edges: int, directed: bool):
+    """Pop order of Hierholzer's walk as (vertex, id of the edge to the next)."""
+    offsets, targets, ids = graph.offsets, graph.targets, graph.weights
+    pointer = array("q", offsets)
+    used = None if directed else bytearray(num_edges)
+    vertices = array("q", [walk_from])
+    via = array("q", [-1])
+    while vertices:
+        u = vertices[-1]
+        p, end = pointer[u], offsets[u + 1]
+        if used is not None:
+            while p < end and used[ids[p]]:
+                p += 1
+        if p < end:
+            pointer[u] = p + 1
+            if used is not None:
+                used[ids[p]] = 1
+            vertices.append(targets[p])
+            via.append(ids[p])
+        else:
+            pointer[u] = p
+            # via[-1] reached u in the walk: it leaves u in the trail
+            yield vertices.pop(), via.pop()
+
+
+def eulerian_trail(
+    num_vertices: int,
+    edges: Sequence[Tuple[int, int]],
+    directed: bool = False,
+    start: Optional[int] = None,
+    edge_ids: bool = False,
+) -> Iterator[int]:
+    """
+    Stream an Eulerian trail (or circuit) of a multigraph.
+
+    Args:
+        num_vertices: Number of vertices (labeled 0 to num_vertices-1)
+        edges: List of (u, v) edges; parallel edges and self-loops allowed
+        directed: Whether edges go from u to v only
+        start: First vertex of the trail (default: an odd / out > in vertex,
+               or the first edge's tail for a circuit)
+        edge_ids: Yield the index in edges of every traversed edge instead
+                  of the vertices
+
+    Returns:
+        Iterator over the E + 1 vertices of the trail (or its E edge ids);
+        empty when there are no vertices
+
+    Raises:
+        ValueError: At the call when the degrees rule out a trail (from
+                    start); while iterating when the edges are not connected
+    """
+    _, trail_end = _walk_start(num_vertices, edges, directed, start)
+    if not num_vertices:  # nothing to walk: the empty trail
+        return iter(())
+    graph = _trail_graph(num_vertices, edges, directed)
+    steps = _hierholzer(graph, trail_end, len(edges), directed)
+
+    def stream() -> Iterator[int]:
+        count = 0
+        for vertex, edge in steps:
+            count += 1
+            if edge_ids:
+                if edge >= 0:
+                    yield edge
+            else:
+                yield vertex
+        if count != len(edges) + 1:
+            raise ValueError("edges are not connected: no Eulerian trail")
+
+    return stream()
+
+
+def eulerian_trail_list(
+    num_vertices: int,
+    edges: Sequence[Tuple[int, int]],
+    directed: bool = False,
+    start: Optional[int] = None,
+) -> List[int]:
+    """
+    Eulerian trail as a list, or [] when there is none.
+
+    Args:
+        num_vertices: Number of vertices
+        edges: List of (u, v) edges
+        directed: Whether edges go from u to v only
+        start: First vertex of the trail (see eulerian_trail())
+
+    Returns:
+        Vertices of the trail in order, or empty list if none exists
+    """
+    try:
+        return list(eulerian_trail(num_vertices, edges, directed, start))
+    except ValueError:
+        return []
+
+
+if __name__ == "__main__":
+    import random
+    import time
+
+    # Example 1: Directed graph from hierholzers_algorithm.py (0 -> ... -> 1)
+    edges1 = [(0, 1), (0, 2), (1, 2), (2, 3), (2, 4), (3, 0), (4, 1)]
+    print("Eulerian trail - Example 1")
+    print("=" * 50)
+    trail = eulerian_trail_list(5, edges1, directed=True)
+    print(f"Directed trail: {' -> '.join(map(str, trail))}")
+
+    # Example 2: Undirected trail between the two odd vertices
+    edges2 = [(0, 1), (1, 2), (2, 3), (3, 4), (4, 2)]
+    print(f"Undirected trail: {eulerian_trail_list(5, edges2)}")
+    print(f"Reversed (start=2): {eulerian_trail_list(5, edges2, start=2)}")
+    print(f"Edge ids: {list(eulerian_trail(5, edges2, edge_ids=True))}")
+    print(f"Empty graph: {eulerian_trail_list(0, [])}")  # Output: []
+
+    # Example 3: Random Eulerian multigraph, streamed
+    n, m = 100_000, 1_000_000
+    rng = random.Random(1)
+    walk = [rng.randrange(n) for _ in range(m)]
+    edges3 = list(zip(walk, walk[1:] + walk[:1]))  # one closed random walk
+    rng.shuffle(edges3)
+    print(f"\nExample 3 - {n} vertices, {m} edges (directed multigraph)")
+    print("=" * 50)
+    start = time.perf_counter()
+    count = sum(1 for _ in eulerian_trail(n, edges3, directed=True))
+    elapsed = time.perf_counter() - start
+    print(f"  streamed {count} vertices in {elapsed:.2f}s")
@@ -16,12 +16,21 @@ the chain.
 Approach 2 (Topological Sort): Since this forms a linear chain, topological
 sort also works.
 
+Approach 3 (Eulerian Trail): Without the assumptions (cities visited more
+than once, round trips, repeated tickets) an itinerary that uses every
+ticket exactly once is an Eulerian trail of the directed multigraph of
+tickets; eulerian_trail.py streams it with iterative Hierholzer.
+
 Time Complexity: O(N) where N is number of tickets
 Space Complexity: O(N)
+
+Run from the repository root: python -m graph.advanced.find_itinerary_from_tickets
 """
 
 from typing import List, Dict, Tuple, Optional
 
+from graph.advanced.eulerian_trail import eulerian_trail
+
 
 def find_itinerary_hashing(tickets: List[List[str]]) -> List[List[str]]:
     """
@@ -148,6 +157,39 @@ def find_itinerary_topological(tickets: List[List[str]]) -> List[str]:
     return stack[::-1]
 
 
+def find_itinerary_eulerian(
+    tickets: List[List[str]], start_city: Optional[str] = None
+) -> List[str]:
+    """
+    Find an itinerary that uses every ticket exactly once.
+
+    Cities may repeat and the trip may return to its start; the start city
+    is found from the ticket counts unless given.
+
+    Args:
+        tickets: List of [from, to] ticket pairs
+        start_city: Optional known starting city
+
+    Returns:
+        List of cities in itinerary order, or empty if no such itinerary
+    """
+    ids: Dict[str, int] = {}
+    edges = [
+        (ids.setdefault(src, len(ids)), ids.setdefault(dst, len(ids)))
+        for src, dst in tickets
+    ]
+    cities = list(ids)
+    if start_city is not None and start_city not in ids:
+        return [start_city] if not tickets else []
+
+    start = ids[start_city] if start_city is not None else None
+    try:
+        trail = eulerian_trail(len(cities), edges, directed=True, start=start)
+        return [cities[v] for v in trail]
+    except ValueError:
+        return []
+
+
 if __name__ == "__main__":
     # Example 1: Basic itinerary
     print("=== Example 1: Hashing approach ===")
@@ -176,3 +218,15 @@ if __name__ == "__main__":
     print("\n=== Example 4: Topological sort approach ===")
     route2 = find_itinerary_topological(tickets)
     print(" -> ".join(route2))
+
+    # Example 5: Round trip with repeated cities
+    print("\n=== Example 5: Eulerian itinerary ===")
+    trips = [
+        ["JFK", "SFO"],
+        ["SFO", "ATL"],
+        ["ATL", "JFK"],
+        ["JFK", "ATL"],
+        ["ATL", "SFO"],
+    ]
+    print(" -> ".join(find_itinerary_eulerian(trips, "JFK")))
+    print(f"No tickets: {find_itinerary_eulerian([])}")  # Output: []
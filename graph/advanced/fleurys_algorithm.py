@@ -12,13 +12,22 @@ Algorithm:
 
 A bridge is an edge whose removal increases the number of connected components.
 
-Time Complexity: O((V + E)^2) due to bridge detection at each step
+Testing every candidate edge for being a bridge costs O((V + E)^2), and
+walking one recursion level per edge hits Python's recursion limit. The
+functions below keep Fleury's interface (same start vertex, same edge-list
+output) but build the trail with the iterative Hierholzer engine in
+eulerian_trail.py, which splices sub-circuits instead of avoiding bridges.
+
+Time Complexity: O(V + E)
 Space Complexity: O(V + E)
+
+Run from the repository root: python -m graph.advanced.fleurys_algorithm
 """
 
+from itertools import pairwise
 from typing import List, Tuple
-from collections import defaultdict
-import copy
+
+from graph.advanced.eulerian_trail import eulerian_trail_list
 
 
 class FleuryEulerian:
@@ -27,60 +36,13 @@ class FleuryEulerian:
     def __init__(self, num_vertices: int):
         self.num_vertices = num_vertices
         self.adj: List[List[int]] = [[] for _ in range(num_vertices)]
+        self.edges: List[Tuple[int, int]] = []
 
     def add_edge(self, u: int, v: int) -> None:
         """Add undirected edge."""
         self.adj[u].append(v)
         self.adj[v].append(u)
-
-    def _remove_edge(self, u: int, v: int) -> None:
-        """Remove edge u-v from adjacency list."""
-        self.adj[u].remove(v)
-        self.adj[v].remove(u)
-
-    def _count_reachable(self, start: int) -> int:
-        """Count vertices reachable from start using DFS."""
-        visited = [False] * self.num_vertices
-        stack = [start]
-        visited[start] = True
-        count = 0
-
-        while stack:
-            node = stack.pop()
-            count += 1
-            for neighbor in self.adj[node]:
-                if not visited[neighbor]:
-                    visited[neighbor] = True
-                    stack.append(neighbor)
-
-        return count
-
-    def _is_valid_next_edge(self, u: int, v: int) -> bool:
-        """
-        Check if edge (u, v) is a valid next edge (not a bridge).
-
-        An edge is a bridge if removing it reduces the number of
-        reachable vertices from u.
-        """
-        # If only one edge, it's always valid
-        if len(self.adj[u]) == 1:
-            return True
-
-        # Count reachable vertices before removing edge
-        count_before = self._count_reachable(u)
-
-        # Remove edge temporarily
-        self._remove_edge(u, v)
-
-        # Count reachable vertices after removing edge
-        count_after = self._count_reachable(u)
-
-        # Restore edge
-        self.adj[u].append(v)
-        self.adj[v].append(u)
-
-        # If counts are same, edge is not a bridge
-        return count_before == count_after
+        self.edges.append((u, v))
 
     def _get_odd_degree_vertex(self) -> int:
         """Find a vertex with odd degree, or return 0."""
@@ -91,25 +53,14 @@ class FleuryEulerian:
 
     def find_euler_tour(self) -> List[Tuple[int, int]]:
         """
-        Find Eulerian tour/path using Fleury's algorithm.
+        Find Eulerian tour/path starting where Fleury's algorithm would.
 
         Returns:
-            List of edges (u, v) in the Eulerian tour
+            List of edges (u, v) in the Eulerian tour, empty if none exists
         """
         start = self._get_odd_degree_vertex()
-        edges = []
-        self._get_euler_util(start, edges)
-        return edges
-
-    def _get_euler_util(self, u: int, edges: List[Tuple[int, int]]) -> None:
-        """Recursive helper to find Eulerian path."""
-        for i in range(len(self.adj[u])):
-            next_v = self.adj[u][i]
-            if self._is_valid_next_edge(u, next_v):
-                edges.append((u, next_v))
-                self._remove_edge(u, next_v)
-                self._get_euler_util(next_v, edges)
-                break
+        trail = eulerian_trail_list(self.num_vertices, self.edges, start=start)
+        return list(pairwise(trail))
 
 
 def fleury_eulerian_path(
@@ -125,65 +76,20 @@ def fleury_eulerian_path(
     Returns:
         List of edges in Eulerian path order
     """
-    adj = defaultdict(list)
+    degree = [0] * num_vertices
     for u, v in edges:
-        adj[u].append(v)
-        adj[v].append(u)
-
-    def remove_edge(u, v):
-        adj[u].remove(v)
-        adj[v].remove(u)
-
-    def count_reachable(start):
-        visited = set()
-        stack = [start]
-        visited.add(start)
-        while stack:
-            node = stack.pop()
-            for neighbor in adj[node]:
-                if neighbor not in visited:
-                    visited.add(neighbor)
-                    stack.append(neighbor)
-        return len(visited)
-
-    def is_bridge(u, v):
-        if len(adj[u]) == 1:
-            return True
-        count_before = count_reachable(u)
-        remove_edge(u, v)
-        count_after = count_reachable(u)
-        adj[u].append(v)
-        adj[v].append(u)
-        return count_before != count_after
+        degree[u] += 1
+        degree[v] += 1
 
     # Find start vertex
     start = 0
-    all_vertices = set()
-    for u, v in edges:
-        all_vertices.add(u)
-        all_vertices.add(v)
-    for v in all_vertices:
-        if len(adj[v]) % 2 != 0:
+    for v in range(num_vertices):
+        if degree[v] % 2 != 0:
             start = v
             break
 
-    euler_path = []
-    current = start
-
-    while adj[current]:
-        next_v = None
-        for neighbor in adj[current]:
-            if not is_bridge(current, neighbor):
-                next_v = neighbor
-                break
-        if next_v is None:
-            next_v = adj[current][0]
-
-        euler_path.append((current, next_v))
-        remove_edge(current, next_v)
-        current = next_v
-
-    return euler_path
+    trail = eulerian_trail_list(num_vertices, edges, start=start)
+    return list(pairwise(trail))
 
 
 if __name__ == "__main__":
@@ -216,3 +122,8 @@ if __name__ == "__main__":
     print("Eulerian path:")
     print(" -> ".join(f"{u}-{v}" for u, v in path3))
     print(f"Start: {path3[0][0]}, End: {path3[-1][1]}")
+
+    # Example 4: Empty graph
+    print("\n=== Example 4: Empty graph ===")
+    print(f"Eulerian path: {fleury_eulerian_path(0, [])}")  # Output: []
+    print(f"Eulerian tour: {FleuryEulerian(0).find_euler_tour()}")  # Output: []
@@ -13,6 +13,8 @@ Algorithms:
 2. Backtracking (M-Coloring): Try all color assignments
    - Time: O(m^V) where m = number of colors
    - Always finds optimal if enough colors available
+   - Runs on the bitset DSATUR engine in bitset_coloring.py, with the
+     maximum clique as lower bound for the chromatic number
 
 3. Welsh-Powell: Order vertices by degree descending, then greedy
    - Better results than basic greedy in practice
@@ -23,11 +25,19 @@ Applications:
 - Map coloring
 - Sudoku solving
 - Frequency assignment in mobile networks
+
+Run from the repository root: python -m graph.advanced.graph_coloring
 """
 
 from typing import List, Dict, Optional, Tuple
 from collections import defaultdict
 
+from graph.advanced.bitset_coloring import (
+    bitset_adjacency,
+    chromatic_number as exact_chromatic_number,
+    color_with_at_most,
+)
+
 
 def greedy_coloring(adj: List[List[int]]) -> Tuple[List[int], int]:
     """
@@ -107,40 +117,25 @@ def m_coloring_backtracking(adj: List[List[int]], m: int) -> Optional[List[int]]
     """
     Find a valid coloring using at most m colors via backtracking.
 
+    Backtracks in DSATUR order over bitset adjacency (bitset_coloring.py)
+    instead of trying the vertices 0, 1, 2, ... in index order.
+
     Args:
         adj: Adjacency list
         m: Maximum number of colors
 
     Returns:
-        Valid coloring, or None if not possible with m colors
+        Valid coloring (0-indexed), or None if not possible with m colors
     """
-    n = len(adj)
-    color = [0] * n
-
-    def backtrack(v: int) -> bool:
-        if v == n:
-            return True
-
-        for c in range(1, m + 1):
-            if is_safe_coloring(adj, color, v, c):
-                color[v] = c
-                if backtrack(v + 1):
-                    return True
-                color[v] = 0
-
-        return False
-
-    if backtrack(0):
-        # Convert to 0-indexed
-        return [c - 1 for c in color]
-    return None
+    return color_with_at_most(bitset_adjacency(adj), m)
 
 
 def chromatic_number(adj: List[List[int]]) -> int:
     """
     Find the chromatic number (minimum colors needed).
 
-    Uses binary search + backtracking for efficiency.
+    The maximum clique is a lower bound and DSATUR an upper bound; only
+    the color counts in between are searched exactly.
 
     Args:
         adj: Adjacency list
@@ -148,25 +143,7 @@ def chromatic_number(adj: List[List[int]]) -> int:
     Returns:
         Chromatic number
     """
-    n = len(adj)
-    if n == 0:
-        return 0
-
-    max_degree = max(len(neighbors) for neighbors in adj)
-
-    # Binary search for minimum m
-    low, high = 1, max_degree + 1
-    result = high
-
-    while low <= high:
-        mid = (low + high) // 2
-        if m_coloring_backtracking(adj, mid) is not None:
-            result = mid
-            high = mid - 1
-        else:
-            low = mid + 1
-
-    return result
+    return exact_chromatic_number(bitset_adjacency(adj))[0]
 
 
 def is_bipartite(adj: List[List[int]]) -> bool:
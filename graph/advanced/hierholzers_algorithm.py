@@ -14,13 +14,25 @@ Implementation uses a stack-based approach:
 - If current vertex has unused edges, push to stack and move forward
 - If no unused edges, add vertex to circuit and backtrack
 
+The walk itself runs on the streaming engine in eulerian_trail.py (flat
+CSR arrays with per-vertex edge pointers, no copies of the adjacency).
+
 Time Complexity: O(V + E)
 Space Complexity: O(V + E)
+
+Run from the repository root: python -m graph.advanced.hierholzers_algorithm
 """
 
-from typing import List
+from typing import List, Tuple
 from collections import defaultdict
 
+from graph.advanced.eulerian_trail import eulerian_trail_list
+
+
+def _edge_list(adj: List[List[int]]) -> List[Tuple[int, int]]:
+    """Directed (u, v) edges of an adjacency list."""
+    return [(u, v) for u in range(len(adj)) for v in adj[u]]
+
 
 def find_eulerian_circuit(adj: List[List[int]]) -> List[int]:
     """
@@ -30,34 +42,16 @@ def find_eulerian_circuit(adj: List[List[int]]) -> List[int]:
     in-degree and out-degree, and graph is strongly connected).
 
     Args:
-        adj: Adjacency list of directed graph (will be modified)
+        adj: Adjacency list of directed graph
 
     Returns:
-        List of vertices in the Eulerian circuit
+        List of vertices in the Eulerian circuit, or empty if none exists
     """
     n = len(adj)
     if n == 0:
         return []
 
-    # Make a copy to avoid modifying input
-    adj_copy = [list(neighbors) for neighbors in adj]
-
-    curr_path = [0]  # Start from vertex 0
-    circuit = []
-
-    while curr_path:
-        curr = curr_path[-1]
-
-        if adj_copy[curr]:
-            # Follow an unused edge
-            next_v = adj_copy[curr].pop()
-            curr_path.append(next_v)
-        else:
-            # No more edges from this vertex, add to circuit
-            circuit.append(curr_path.pop())
-
-    circuit.reverse()
-    return circuit
+    return eulerian_trail_list(n, _edge_list(adj), directed=True, start=0)
 
 
 def find_eulerian_circuit_from(adj: List[List[int]], start: int) -> List[int]:
@@ -65,27 +59,13 @@ def find_eulerian_circuit_from(adj: List[List[int]], start: int) -> List[int]:
     Find Eulerian circuit starting from a specific vertex.
 
     Args:
-        adj: Adjacency list (will be modified)
+        adj: Adjacency list
         start: Starting vertex
 
     Returns:
-        Eulerian circuit starting from 'start'
+        Eulerian circuit starting from 'start', or empty if none exists
     """
-    adj_copy = [list(neighbors) for neighbors in adj]
-
-    curr_path = [start]
-    circuit = []
-
-    while curr_path:
-        curr = curr_path[-1]
-        if adj_copy[curr]:
-            next_v = adj_copy[curr].pop()
-            curr_path.append(next_v)
-        else:
-            circuit.append(curr_path.pop())
-
-    circuit.reverse()
-    return circuit
+    return eulerian_trail_list(len(adj), _edge_list(adj), directed=True, start=start)
 
 
 def has_eulerian_circuit_directed(adj: List[List[int]]) -> bool:
@@ -164,7 +144,7 @@ def find_eulerian_path_directed(adj: List[List[int]]) -> List[int]:
     Find Eulerian path (not necessarily a circuit) in directed graph.
 
     Args:
-        adj: Adjacency list (will be modified)
+        adj: Adjacency list
 
     Returns:
         List of vertices in Eulerian path, or empty if none exists
@@ -173,30 +153,9 @@ def find_eulerian_path_directed(adj: List[List[int]]) -> List[int]:
     if n == 0:
         return []
 
-    in_degree = [0] * n
-    for u in range(n):
-        for v in adj[u]:
-            in_degree[v] += 1
-
-    # Find start vertex
-    # Start = vertex with out_degree - in_degree = 1
-    # If no such vertex, start from any vertex with non-zero degree
-    start = 0
-    found_start = False
-    for i in range(n):
-        diff = len(adj[i]) - in_degree[i]
-        if diff == 1:
-            start = i
-            found_start = True
-            break
-
-    if not found_start:
-        for i in range(n):
-            if len(adj[i]) > 0:
-                start = i
-                break
-
-    return find_eulerian_circuit_from(adj, start)
+    # Start = vertex with out_degree - in_degree = 1, or any vertex with
+    # non-zero degree; eulerian_trail() picks it and checks the degrees
+    return eulerian_trail_list(n, _edge_list(adj), directed=True)
 
 
 def format_circuit(circuit: List[int]) -> str:
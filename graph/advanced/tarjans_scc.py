@@ -11,6 +11,9 @@ Pop all vertices from stack until u to get one SCC.
 
 Time Complexity: O(V + E)
 Space Complexity: O(V)
+
+SCCs of a graph that only gains edges can be maintained incrementally with
+graph/topological_sort/incremental_topological_order.py.
 """
 
 from typing import List
@@ -22,7 +25,7 @@ def tarjan_scc(num_vertices: int, adj: List[List[int]]) -> List[List[int]]:
 
     Args:
         num_vertices: Number of vertices (0 to V-1)
-        adj: Adjacency list of directed graph
+        adj: Adjacency list of directed graph (or a CSRGraph)
 
     Returns:
         List of SCCs, each SCC is a list of vertices
@@ -88,35 +91,32 @@ def tarjan_scc_iterative(num_vertices: int, adj: List[List[int]]) -> List[List[i
         if disc[start] != -1:
             continue
 
-        # Iterative DFS with post-order processing
-        dfs_stack = [(start, iter(adj[start]), False)]
+        # Iterative DFS; each frame keeps its neighbor iterator so the scan
+        # resumes where it stopped after a child finishes
+        dfs_stack = [(start, iter(adj[start]))]
         disc[start] = low[start] = timer
         timer += 1
         stack.append(start)
         on_stack[start] = True
 
         while dfs_stack:
-            u, children, post_order = dfs_stack[-1]
+            u, children = dfs_stack[-1]
 
-            if not post_order:
-                dfs_stack[-1] = (u, children, True)
+            descended = False
+            for v in children:
+                if disc[v] == -1:
+                    disc[v] = low[v] = timer
+                    timer += 1
+                    stack.append(v)
+                    on_stack[v] = True
+                    dfs_stack.append((v, iter(adj[v])))
+                    descended = True
+                    break
+                elif on_stack[v]:
+                    low[u] = min(low[u], disc[v])
 
-                try:
-                    while True:
-                        v = next(children)
-                        if disc[v] == -1:
-                            disc[v] = low[v] = timer
-                            timer += 1
-                            stack.append(v)
-                            on_stack[v] = True
-                            dfs_stack.append((v, iter(adj[v]), False))
-                            break
-                        elif on_stack[v]:
-                            low[u] = min(low[u], disc[v])
-                except StopIteration:
-                    pass
-            else:
-                # Post-order: process after all children
+            if not descended:
+                # Post-order: all children of u are done
                 dfs_stack.pop()
 
                 if disc[u] == low[u]:
@@ -19,13 +19,22 @@ Algorithm:
 1. Build the complement graph
 2. Check if complement is bipartite using BFS/DFS 2-coloring
 
-Time Complexity: O(V^2) for complement + O(V + E') for bipartite check
-Space Complexity: O(V^2)
+The complement is kept as bitset rows (bitset_coloring.py): row v is all
+vertices minus the neighbors of v and v itself, and the BFS picks up all
+unvisited neighbors of a vertex with one &.
+
+Time Complexity: O(V + E) to build the rows + O(V^2 / w) for the bipartite
+                 check on machine words of w bits
+Space Complexity: O(V^2 / w)
+
+Run from the repository root: python -m graph.advanced.two_clique_problem
 """
 
 from typing import List, Tuple, Optional
 from collections import deque
 
+from graph.advanced.bitset_coloring import bitset_adjacency
+
 
 def is_bipartite(num_vertices: int, adj: List[List[int]]) -> Tuple[bool, List[int]]:
     """
@@ -71,20 +80,52 @@ def build_complement(num_vertices: int, adj: List[List[int]]) -> List[List[int]]
     Returns:
         Adjacency list of complement graph
     """
-    # Convert to set for O(1) lookup
-    edge_set = set()
-    for u in range(num_vertices):
-        for v in adj[u]:
-            edge_set.add((u, v))
+    return [
+        [v for v in range(num_vertices) if row >> v & 1]
+        for row in _complement_bits(num_vertices, adj)
+    ]
 
-    complement: List[List[int]] = [[] for _ in range(num_vertices)]
-    for i in range(num_vertices):
-        for j in range(i + 1, num_vertices):
-            if (i, j) not in edge_set and (j, i) not in edge_set:
-                complement[i].append(j)
-                complement[j].append(i)
 
-    return complement
+def _complement_bits(num_vertices: int, adj: List[List[int]]) -> List[int]:
+    """Complement as bitset rows: everything but the neighbors and v itself."""
+    full = (1 << num_vertices) - 1
+    return [full ^ row ^ (1 << v) for v, row in enumerate(bitset_adjacency(adj))]
+
+
+def _two_color_bits(num_vertices: int, rows: List[int]) -> Optional[List[int]]:
+    """
+    BFS 2-coloring over bitset rows.
+
+    Each step takes all unvisited neighbors of u with one & instead of
+    scanning a complement adjacency list of up to V entries.
+
+    Returns:
+        coloring[i] = 0 or 1, or None if the graph is not bipartite
+    """
+    color = [-1] * num_vertices
+    side = [0, 0]  # bitsets of the vertices colored 0 and 1
+    unvisited = (1 << num_vertices) - 1
+    while unvisited:
+        start = (unvisited & -unvisited).bit_length() - 1
+        unvisited ^= 1 << start
+        color[start] = 0
+        side[0] |= 1 << start
+        queue = deque([start])
+        while queue:
+            u = queue.popleft()
+            c = color[u]
+            if rows[u] & side[c]:
+                return None
+            fresh = rows[u] & unvisited
+            unvisited ^= fresh
+            side[1 - c] |= fresh
+            while fresh:
+                low = fresh & -fresh
+                v = low.bit_length() - 1
+                fresh ^= low
+                color[v] = 1 - c
+                queue.append(v)
+    return color
 
 
 def can_divide_into_two_cliques(num_vertices: int, edges: List[List[int]]) -> bool:
@@ -104,12 +145,9 @@ def can_divide_into_two_cliques(num_vertices: int, edges: List[List[int]]) -> bo
         adj[u].append(v)
         adj[v].append(u)
 
-    # Build complement
-    complement = build_complement(num_vertices, adj)
-
-    # Check if complement is bipartite
-    is_bip, _ = is_bipartite(num_vertices, complement)
-    return is_bip
+    # Two-color the complement directly on its bitset rows
+    complement = _complement_bits(num_vertices, adj)
+    return _two_color_bits(num_vertices, complement) is not None
 
 
 def find_two_cliques(
@@ -130,10 +168,8 @@ def find_two_cliques(
         adj[u].append(v)
         adj[v].append(u)
 
-    complement = build_complement(num_vertices, adj)
-    is_bip, coloring = is_bipartite(num_vertices, complement)
-
-    if not is_bip:
+    coloring = _two_color_bits(num_vertices, _complement_bits(num_vertices, adj))
+    if coloring is None:
         return None
 
     clique1 = [i for i in range(num_vertices) if coloring[i] == 0]
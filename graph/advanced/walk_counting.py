@@ -0,0 +1,376 @@
+"""
+Walk Counting by Repeated Squaring on Flat Buffers
+
+The number of walks from i to j with exactly k edges is entry (i, j) of
+A^k, where A[i][j] counts the edges i -> j. count_walks_with_k_edges.py
+and Queue/count_paths_k_edges.py build the answer one edge at a time
+(O(V^3 * k) or worse), which is hopeless for k = 10^18. Here A^k comes
+from about 2 * log2(k) matrix products:
+
+- Matrices are stored row-major in one flat buffer of V*V entries: an
+  array('q') when the counts are taken modulo mod (every entry < mod), a
+  list of Python ints when the exact, unbounded counts are wanted.
+- "python" packs every row of the right operand into one big integer
+  with a fixed-width slot per entry (wide enough for a full dot product),
+  so a whole row of the product is sum(map(mul, a_row, packed_rows)): N
+  big-int multiplications in C instead of N^2 Python-level products. The
+  slots are cut apart with int.to_bytes/from_bytes and reduced modulo mod
+  right away. Matrices with negative entries (possible only without a
+  modulus) fall back to one sum(map(mul, row, column)) per entry.
+- "numpy" views the int64 buffer as a V x V ndarray and multiplies with @.
+  A product of two reduced matrices can overflow 64 bits, so the right
+  operand is split into limbs of s bits, with s chosen such that
+  V * mod * 2^s < 2^63; every limb product is reduced modulo mod and the
+  limbs are recombined by Horner's rule, again reducing after each step.
+  Nothing is ever an object array. NumPy is optional; "auto" picks it
+  when it is installed and a modulus is given.
+- For a single source only row src of A^k is needed: the row vector is
+  multiplied by the squares A, A^2, A^4, ... for the set bits of k, which
+  halves the number of full matrix products.
+
+Time Complexity: O(V^3 * log K)
+Space Complexity: O(V^2)
+
+Reference: https://www.geeksforgeeks.org/count-possible-paths-source-destination-exactly-k-edges/
+
+Run from the repository root: python -m graph.advanced.walk_counting
+"""
+
+from array import array
+from operator import mul
+from typing import Callable, List, Mapping, Optional, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; the pure-Python backend still works
+    np = None
+
+_INT64_MAX = 2**63 - 1
+
+
+def _buffer(values, mod: Optional[int]):
+    """Flat buffer for values: array('q') when reduced modulo mod, else list."""
+    if mod is not None and mod - 1 <= _INT64_MAX:
+        return array("q", values)
+    return list(values)
+
+
+def flat_matrix(adj_matrix: Sequence[Sequence[int]], mod: Optional[int] = None):
+    """
+    Copy an N x N matrix of edge counts into a flat row-major buffer.
+
+    Args:
+        adj_matrix: N x N matrix, adj_matrix[i][j] = number of edges i -> j
+        mod: Optional modulus the entries are reduced by
+
+    Returns:
+        Flat buffer of N*N entries (array('q') if mod is given, else list)
+    """
+    values = (x for row in adj_matrix for x in row)
+    return _buffer(values if mod is None else (x % mod for x in values), mod)
+
+
+def _adjacency_rows(adj):
+    """(u, out-neighbors of u) pairs of an adjacency list, dict or CSRGraph."""
+    if isinstance(adj, Mapping):  # e.g. a defaultdict: adj[u] would insert u
+        return list(adj.items())
+    return [(u, adj[u]) for u in range(len(adj))]
+
+
+def _num_vertices(rows, *vertices: int) -> int:
+    """Smallest N with every vertex of rows (and vertices) below N."""
+    top = max(vertices, default=-1)
+    for u, neighbors in rows:
+        top = max(top, u, max(neighbors, default=-1))
+    return max(len(rows), top + 1)
+
+
+def flat_adjacency(
+    adj, mod: Optional[int] = None, num_vertices: Optional[int] = None
+):
+    """
+    Flat edge-count matrix of an adjacency list or CSRGraph.
+
+    Parallel edges are counted, so A^k counts walks in the multigraph.
+
+    Args:
+        adj: Adjacency list (adj[u] = out-neighbors of u), dict of such
+             lists (vertices without a key have no out-edges) or CSRGraph
+        mod: Optional modulus the entries are reduced by
+        num_vertices: Matrix dimension N (default: one past the largest
+                      vertex in adj, at least len(adj))
+
+    Returns:
+        Flat buffer of N*N entries (array('q') if mod is given, else list)
+    """
+    rows = _adjacency_rows(adj)
+    n = _num_vertices(rows) if num_vertices is None else num_vertices
+    counts = [0] * (n * n)
+    for u, neighbors in rows:
+        row = u * n
+        for v in neighbors:
+            counts[row + v] += 1
+    return _buffer(counts if mod is None else (x % mod for x in counts), mod)
+
+
+def flat_matmul(a, b, n: int, mod: Optional[int] = None):
+    """
+    Product of flat row-major matrices (pure Python).
+
+    Non-negative matrices use big-int row packing; any negative entry
+    switches to plain dot products over strided columns.
+
+    Args:
+        a: Flat R x N buffer (R = 1 for a row vector)
+        b: Flat N x N buffer
+        n: Matrix dimension N
+        mod: Optional modulus every entry of the product is reduced by
+
+    Returns:
+        Flat R x N buffer of a * b
+    """
+    if min(a, default=0) < 0 or min(b, default=0) < 0:
+        columns = [b[j::n] for j in range(n)]
+        out = []
+        for lo in range(0, len(a), n):
+            row = a[lo : lo + n]
+            dots = (sum(map(mul, row, col)) for col in columns)
+            out.extend(dots if mod is None else (x % mod for x in dots))
+        return _buffer(out, mod)
+
+    # Slot width in bytes: every dot product is at most n * max(a) * max(b),
+    # and every entry of b must fit as well
+    bound = n * max(1, max(a, default=0)) * max(b, default=0)
+    width = bound.bit_length() // 8 + 1
+    size = n * width
+    packed = [
+        int.from_bytes(
+            b"".join(x.to_bytes(width, "little") for x in b[lo : lo + n]), "little"
+        )
+        for lo in range(0, len(b), n)
+    ]
+    slots = range(0, size, width)
+    out = []
+    for lo in range(0, len(a), n):
+        raw = sum(map(mul, a[lo : lo + n], packed)).to_bytes(size, "little")
+        row = (int.from_bytes(raw[j : j + width], "little") for j in slots)
+        out.extend(row if mod is None else (x % mod for x in row))
+    return _buffer(out, mod)
+
+
+def _limb_bits(n: int, mod: int) -> int:
+    """Largest s with N * mod * 2^s < 2^63 (< 1: mod too large for int64)."""
+    return 63 - n.bit_length() - (mod - 1).bit_length()
+
+
+def numpy_matmul_mod(a, b, mod: int):
+    """
+    Product a @ b modulo mod of int64 ndarrays with entries in [0, mod).
+
+    Splits b into limbs so that no int64 sum overflows (see module
+    docstring); requires N * mod < 2^62.
+
+    Args:
+        a: N x N (or length-N) int64 ndarray
+        b: N x N int64 ndarray
+        mod: Modulus
+
+    Returns:
+        int64 ndarray a @ b modulo mod
+    """
+    bits = (mod - 1).bit_length()
+    shift = _limb_bits(b.shape[0], mod)
+    if shift < 1:
+        raise ValueError(f"modulus {mod} is too large for int64 products")
+    if shift >= bits:
+        return (a @ b) % mod
+    mask = (1 << shift) - 1
+    result = None
+    for low in range((bits - 1) // shift * shift, -1, -shift):  # high limb first
+        part = (a @ ((b >> low) & mask)) % mod
+        result = part if result is None else ((result << shift) + part) % mod
+    return result
+
+
+def _resolve_method(method: str, n: int, mod: Optional[int]) -> str:
+    """Pick the backend for method='auto' and validate the others."""
+    if mod is not None and mod < 1:
+        raise ValueError("mod must be a positive integer")
+    int64_ok = mod is not None and _limb_bits(max(n, 1), mod) >= 1
+    if method == "auto":
+        return "numpy" if np is not None and int64_ok else "python"
+    if method == "numpy":
+        if np is None:
+            raise ImportError("method='numpy' requires NumPy")
+        if not int64_ok:
+            raise ValueError("method='numpy' needs a modulus with N * mod < 2^62")
+    elif method != "python":
+        raise ValueError(f"Unknown method: {method!r}")
+    return method
+
+
+def _power(base, vector, k: int, multiply: Callable):
+    """vector * base^k (or base^k when vector is None) by repeated squaring."""
+    result = vector
+    while k:
+        if k & 1:
+            result = base if result is None else multiply(result, base)
+        k >>= 1
+        if k:
+            base = multiply(base, base)
+    return result
+
+
+def _walks(flat, n: int, k: int, mod: Optional[int], method: str, src=None):
+    """Flat A^k, or row src of it, as a list of ints."""
+    if k < 0:
+        raise ValueError("k must be a non-negative integer")
+    method = _resolve_method(method, n, mod)
+    one = 1 if mod is None else 1 % mod
+    if src is None:
+        identity = [0] * (n * n)
+        identity[:: n + 1] = [one] * n
+        start = None
+    else:
+        identity = [0] * n
+        identity[src] = one
+        start = identity
+    if k == 0:
+        return identity
+
+    if method == "numpy":
+        base = np.frombuffer(flat, dtype=np.int64).reshape(n, n)
+        if start is not None:
+            start = np.array(start, dtype=np.int64)
+        result = _power(base, start, k, lambda a, b: numpy_matmul_mod(a, b, mod))
+        return result.ravel().tolist()
+
+    if start is not None:
+        start = _buffer(start, mod)
+    result = _power(flat, start, k, lambda a, b: flat_matmul(a, b, n, mod))
+    return list(result)
+
+
+def walk_counts(
+    adj_matrix: Sequence[Sequence[int]],
+    k: int,
+    mod: Optional[int] = None,
+    method: str = "auto",
+) -> List[List[int]]:
+    """
+    Matrix of walk counts A^k.
+
+    Args:
+        adj_matrix: N x N matrix, adj_matrix[i][j] = number of edges i -> j
+        k: Exact number of edges (k >= 0, may be huge when mod is given)
+        mod: Optional modulus for the counts
+        method: "python" (flat buffers), "numpy" (int64 ndarrays, needs mod)
+                or "auto"
+
+    Returns:
+        N x N matrix whose (i, j) entry is the number of walks from i to j
+        with exactly k edges (modulo mod)
+
+    Raises:
+        ValueError: If k is negative
+    """
+    n = len(adj_matrix)
+    flat = _walks(flat_matrix(adj_matrix, mod), n, k, mod, method)
+    return [flat[i * n : (i + 1) * n] for i in range(n)]
+
+
+def count_walks(
+    adj_matrix: Sequence[Sequence[int]],
+    src: int,
+    dest: int,
+    k: int,
+    mod: Optional[int] = None,
+    method: str = "auto",
+) -> int:
+    """
+    Number of walks from src to dest with exactly k edges.
+
+    Args:
+        adj_matrix: N x N matrix, adj_matrix[i][j] = number of edges i -> j
+        src: Source vertex
+        dest: Destination vertex
+        k: Exact number of edges (k >= 0, may be huge when mod is given)
+        mod: Optional modulus for the count
+        method: "python", "numpy" or "auto" (see walk_counts())
+
+    Returns:
+        Number of walks (modulo mod)
+
+    Raises:
+        ValueError: If k is negative
+    """
+    n = len(adj_matrix)
+    return _walks(flat_matrix(adj_matrix, mod), n, k, mod, method, src)[dest]
+
+
+def count_walks_adjacency(
+    adj,
+    src: int,
+    dest: int,
+    k: int,
+    mod: Optional[int] = None,
+    method: str = "auto",
+    num_vertices: Optional[int] = None,
+) -> int:
+    """
+    Number of walks from src to dest with exactly k edges.
+
+    Args:
+        adj: Adjacency list, dict of lists or CSRGraph; parallel edges
+             count separately
+        src: Source vertex
+        dest: Destination vertex
+        k: Exact number of edges (k >= 0)
+        mod: Optional modulus for the count
+        method: "python", "numpy" or "auto" (see walk_counts())
+        num_vertices: Number of vertices (default: one past the largest
+                      vertex in adj, src or dest)
+
+    Returns:
+        Number of walks (modulo mod)
+
+    Raises:
+        ValueError: If k is negative
+    """
+    if num_vertices is None:
+        num_vertices = _num_vertices(_adjacency_rows(adj), src, dest)
+    flat = flat_adjacency(adj, mod, num_vertices)
+    return _walks(flat, num_vertices, k, mod, method, src)[dest]
+
+
+if __name__ == "__main__":
+    import random
+    import time
+
+    MOD = 10**9 + 7
+
+    # Example 1: The graph from count_walks_with_k_edges.py
+    adj = [[0, 1, 1, 1], [0, 0, 0, 1], [0, 0, 0, 1], [0, 0, 0, 0]]
+    print("Walk counting - Example 1")
+    print("=" * 50)
+    print(f"Walks 0 -> 3 with 2 edges: {count_walks(adj, 0, 3, 2)}")  # Output: 2
+
+    # Example 2: Exact counts grow like Fibonacci numbers
+    fib = [[1, 1], [1, 0]]
+    print(f"Walks 0 -> 1 with 90 edges: {count_walks(fib, 0, 1, 90)}")  # F(90)
+
+    # Example 3: k = 10^18 modulo 10^9 + 7
+    print(f"... with 10^18 edges mod 10^9+7: {count_walks(fib, 0, 1, 10**18, MOD)}")
+
+    # Example 4: Random multigraph, full matrix power
+    n = 120
+    rng = random.Random(1)
+    lists = [[rng.randrange(n) for _ in range(8)] for _ in range(n)]
+    print(f"\nExample 4 - {n} vertices, k = 10^18, mod 10^9+7")
+    print("=" * 50)
+    methods = ["python"] + (["numpy"] if np is not None else [])
+    for method in methods:
+        start = time.perf_counter()
+        walks = count_walks_adjacency(lists, 0, n - 1, 10**18, MOD, method)
+        elapsed = time.perf_counter() - start
+        print(f"  {method:<6}: {walks} ({elapsed:.2f}s)")
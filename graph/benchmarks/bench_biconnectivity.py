@@ -0,0 +1,79 @@
+"""
+Benchmark: one iterative low-link pass vs the per-question DFS finders.
+
+Road-like networks (road_grid_graph() in graph/core/random_graphs.py): a
+side x side grid in which every street segment is kept with probability
+0.7, so the graph has dead ends, bridges and cut vertices, and DFS trees
+with depths in the hundreds of thousands. The
+recursive finders previously in bridges_in_graph.py, articulation_points.py
+and biconnected_components.py cannot run on these at all (recursion limit);
+the baseline is BridgeFinder.find_bridges_iterative(), the iterator-frame
+DFS on adjacency lists, which only answers the bridge question.
+
+- Biconnectivity (CSR): bridges, articulation points and blocks together
+- + block-cut tree: the same pass plus building the block-cut forest
+
+Run from the repository root:
+    python -m graph.benchmarks.bench_biconnectivity
+"""
+
+from __future__ import annotations
+
+import time
+
+from graph.advanced.biconnectivity import Biconnectivity
+from graph.advanced.bridges_in_graph import BridgeFinder
+from graph.core.random_graphs import road_grid_graph
+
+
+def run(sides: tuple[int, ...] = (300, 1000), seed: int = 0) -> list[dict]:
+    rows = []
+    for side in sides:
+        graph = road_grid_graph(side, keep=0.7, seed=seed)
+        base = {"vertices": len(graph), "edges": graph.num_edges // 2}
+
+        finder = BridgeFinder(len(graph))
+        finder.adj = graph.to_adjacency_list()
+        start = time.perf_counter()
+        bridges = finder.find_bridges_iterative()
+        rows.append(
+            {**base, "method": "BridgeFinder (bridges only)",
+             "seconds": time.perf_counter() - start, "bridges": len(bridges),
+             "cut_vertices": None, "blocks": None}
+        )  # fmt: skip
+
+        start = time.perf_counter()
+        result = Biconnectivity(graph)
+        one_pass = time.perf_counter() - start
+        rows.append(
+            {**base, "method": "Biconnectivity (CSR)", "seconds": one_pass,
+             "bridges": len(result.bridges),
+             "cut_vertices": len(result.articulation_points),
+             "blocks": result.num_blocks}
+        )  # fmt: skip
+
+        start = time.perf_counter()
+        result.block_cut_tree()
+        rows.append(
+            {**base, "method": "+ block-cut tree",
+             "seconds": one_pass + time.perf_counter() - start,
+             "bridges": len(result.bridges),
+             "cut_vertices": len(result.articulation_points),
+             "blocks": result.num_blocks}
+        )  # fmt: skip
+    return rows
+
+
+if __name__ == "__main__":
+    header = f"{'vertices':>9} {'edges':>9} {'method':<28} {'seconds':>8}"
+    print(f"{header} {'bridges':>8} {'cut':>8} {'blocks':>8}")
+
+    def show(value) -> str:
+        return "-" if value is None else str(value)
+
+    for row in run():
+        print(
+            f"{row['vertices']:>9} {row['edges']:>9} {row['method']:<28} "
+            f"{row['seconds']:>8.2f} {show(row['bridges']):>8} "
+            f"{show(row['cut_vertices']):>8} {show(row['blocks']):>8}"
+        )
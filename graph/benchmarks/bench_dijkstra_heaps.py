@@ -0,0 +1,65 @@
+"""
+Benchmark: Dijkstra with lazy-deletion heapq vs indexed d-ary decrease-key heap.
+
+Builds random sparse G(n, m) digraphs with weights in [1, 1000] as
+CSRGraph instances (graph/core/random_graphs.py) and times dijkstra()
+(heapq with stale entries) against dijkstra_indexed() for several heap
+arities. Dense graphs produce many improvements per vertex, which is where
+the lazy heap grows towards O(E) entries.
+
+Run from the repository root:
+    python -m graph.benchmarks.bench_dijkstra_heaps
+"""
+
+from __future__ import annotations
+
+import time
+
+from graph.core.random_graphs import gnm_random_graph
+from graph.shortest_path.dijkstra import dijkstra, dijkstra_indexed
+
+
+def run(
+    sizes: list[tuple[int, int]], arities: tuple[int, ...] = (2, 4, 8), seed: int = 0
+) -> list[dict]:
+    """Time every heap strategy on each (num_vertices, avg_degree) size.
+
+    Returns:
+        One row per (size, strategy) with elapsed seconds.
+    """
+    rows = []
+    for n, degree in sizes:
+        graph = gnm_random_graph(
+            n, n * degree, seed=seed, directed=True, weights=(1, 1000)
+        )
+
+        start = time.perf_counter()
+        expected = dijkstra(graph, 0)
+        elapsed = time.perf_counter() - start
+        rows.append(
+            {"V": n, "E": graph.num_edges, "heap": "heapq (lazy)", "seconds": elapsed}
+        )
+
+        for arity in arities:
+            start = time.perf_counter()
+            result = dijkstra_indexed(graph, 0, arity)
+            elapsed = time.perf_counter() - start
+            if result != expected:
+                raise AssertionError(f"{arity}-ary heap disagrees with heapq")
+            rows.append(
+                {
+                    "V": n,
+                    "E": graph.num_edges,
+                    "heap": f"indexed {arity}-ary",
+                    "seconds": elapsed,
+                }
+            )
+    return rows
+
+
+if __name__ == "__main__":
+    print("Dijkstra heap benchmark")
+    print("=" * 56)
+    print(f"{'V':>8} {'E':>9}  {'heap':<18} {'seconds':>9}")
+    for row in run([(10_000, 4), (10_000, 32), (50_000, 16)]):
+        print(f"{row['V']:>8} {row['E']:>9}  {row['heap']:<18} {row['seconds']:>9.3f}")
@@ -0,0 +1,113 @@
+"""
+Benchmark: offline fully dynamic connectivity vs rebuilding union-find.
+
+Stress stream of random edge insertions, deletions (link failures) and
+connectivity queries. Compares:
+- OfflineDynamicConnectivity (segment tree over time + rollback DSU)
+- DisjointSet from union_by_rank_path_compression.py, updated with
+  union() on insertions and rebuilt from the live edge set at the first
+  query after any deletion
+
+Both answer lists are checked to be equal.
+
+Run from the repository root:
+    python -m graph.benchmarks.bench_dynamic_connectivity
+"""
+
+from __future__ import annotations
+
+import random
+import time
+
+from graph.advanced.dynamic_connectivity import dynamic_connectivity
+from graph.disjoint_set.union_by_rank_path_compression import DisjointSet
+
+
+def random_operations(
+    n: int, num_ops: int, delete_ratio: float, query_ratio: float, seed: int = 0
+) -> list[tuple]:
+    """Mixed add/remove/connected stream over n vertices."""
+    rng = random.Random(seed)
+    live: list[tuple[int, int]] = []
+    ops: list[tuple] = []
+    for _ in range(num_ops):
+        r = rng.random()
+        if r < query_ratio:
+            ops.append(("connected", rng.randrange(n), rng.randrange(n)))
+        elif r < query_ratio + delete_ratio and live:
+            i = rng.randrange(len(live))
+            live[i], live[-1] = live[-1], live[i]
+            u, v = live.pop()
+            ops.append(("remove", u, v))
+        else:
+            u, v = rng.randrange(n), rng.randrange(n)
+            live.append((u, v))
+            ops.append(("add", u, v))
+    return ops
+
+
+def rebuild_baseline(n: int, ops: list[tuple]) -> list[bool]:
+    """Answer the stream with DisjointSet, rebuilding after deletions."""
+    live: dict[tuple[int, int], int] = {}
+    dsu = DisjointSet(n)
+    dirty = False
+    answers = []
+    for op in ops:
+        if op[0] == "add":
+            key = (min(op[1], op[2]), max(op[1], op[2]))
+            live[key] = live.get(key, 0) + 1
+            if not dirty:
+                dsu.union(op[1], op[2])
+        elif op[0] == "remove":
+            key = (min(op[1], op[2]), max(op[1], op[2]))
+            live[key] -= 1
+            if live[key] == 0:
+                del live[key]
+            dirty = True
+        else:
+            if dirty:
+                dsu = DisjointSet(n)
+                for u, v in live:
+                    dsu.union(u, v)
+                dirty = False
+            answers.append(dsu.is_connected(op[1], op[2]))
+    return answers
+
+
+def run(
+    n: int = 5000, num_ops: int = 20000, query_ratio: float = 0.3, seed: int = 0
+) -> list[dict]:
+    """Time both methods for several deletion rates."""
+    results = []
+    for delete_ratio in (0.0, 0.05, 0.2, 0.35):
+        ops = random_operations(n, num_ops, delete_ratio, query_ratio, seed)
+
+        start = time.perf_counter()
+        offline = dynamic_connectivity(n, ops)
+        offline_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        rebuilt = rebuild_baseline(n, ops)
+        rebuild_seconds = time.perf_counter() - start
+
+        assert offline == rebuilt
+        results.append(
+            {
+                "delete_ratio": delete_ratio,
+                "offline": offline_seconds,
+                "rebuild": rebuild_seconds,
+            }
+        )
+    return results
+
+
+if __name__ == "__main__":
+    n, num_ops = 5000, 20000
+    print(f"Dynamic connectivity - {n} vertices, {num_ops} operations, 30% queries")
+    print("=" * 60)
+    print(f"{'deletes':>8}{'offline D&C (s)':>20}{'DSU rebuild (s)':>20}")
+    for row in run(n, num_ops):
+        print(
+            f"{row['delete_ratio']:>8.0%}"
+            f"{row['offline']:>20.3f}{row['rebuild']:>20.3f}"
+        )
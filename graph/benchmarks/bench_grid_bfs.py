@@ -0,0 +1,125 @@
+"""
+Benchmark: flat-buffer grid BFS engine vs nested-list BFS with tuple queues.
+
+Generates a random side x side raster and times two workloads:
+- island count (8-connectivity components), as in number_of_islands.py
+- multi-source distances from every source cell, as in rotten_oranges.py
+
+The baseline is the previous style of the grid modules: nested lists, a
+deque of (row, col) tuples and four bounds checks per neighbor.
+
+Run from the repository root:
+    python -m graph.benchmarks.bench_grid_bfs
+"""
+
+from __future__ import annotations
+
+import random
+import time
+from collections import deque
+
+from graph.bfs_applications.grid_bfs import EIGHT_DIRECTIONS, FOUR_DIRECTIONS, GridBFS
+
+
+def random_raster(side: int, density: float, seed: int = 0) -> bytes:
+    """Row-major raster with one byte per cell: 1 with probability density."""
+    rng = random.Random(seed)
+    return bytes(rng.random() < density for _ in range(side * side))
+
+
+def nested_islands(grid: list[list[int]]) -> int:
+    """Island count with nested lists and a tuple deque."""
+    rows, cols = len(grid), len(grid[0])
+    visited = [[False] * cols for _ in range(rows)]
+    count = 0
+    for sr in range(rows):
+        for sc in range(cols):
+            if grid[sr][sc] != 1 or visited[sr][sc]:
+                continue
+            count += 1
+            visited[sr][sc] = True
+            queue = deque([(sr, sc)])
+            while queue:
+                r, c = queue.popleft()
+                for dr, dc in EIGHT_DIRECTIONS:
+                    nr, nc = r + dr, c + dc
+                    if (
+                        0 <= nr < rows
+                        and 0 <= nc < cols
+                        and grid[nr][nc] == 1
+                        and not visited[nr][nc]
+                    ):
+                        visited[nr][nc] = True
+                        queue.append((nr, nc))
+    return count
+
+
+def nested_distances(
+    grid: list[list[int]], sources: list[tuple[int, int]]
+) -> list[list[int]]:
+    """Multi-source BFS distances with nested lists and a tuple deque."""
+    rows, cols = len(grid), len(grid[0])
+    dist = [[-1] * cols for _ in range(rows)]
+    queue = deque()
+    for r, c in sources:
+        dist[r][c] = 0
+        queue.append((r, c, 0))
+    while queue:
+        r, c, d = queue.popleft()
+        for dr, dc in FOUR_DIRECTIONS:
+            nr, nc = r + dr, c + dc
+            if 0 <= nr < rows and 0 <= nc < cols:
+                if grid[nr][nc] == 1 and dist[nr][nc] == -1:
+                    dist[nr][nc] = d + 1
+                    queue.append((nr, nc, d + 1))
+    return dist
+
+
+def run(side: int = 1000, density: float = 0.6, seed: int = 0) -> list[dict]:
+    """Time both workloads with both implementations."""
+    raster = random_raster(side, density, seed)
+    grid = [list(raster[r * side : (r + 1) * side]) for r in range(side)]
+    rng = random.Random(seed + 1)
+    sources = [(rng.randrange(side), rng.randrange(side)) for _ in range(side // 10)]
+    results = []
+
+    start = time.perf_counter()
+    expected = nested_islands(grid)
+    results.append(("islands", "nested lists", time.perf_counter() - start, expected))
+
+    engine8 = GridBFS(side, side, connectivity=8)
+    start = time.perf_counter()
+    count = engine8.components(engine8.mask_from_raster(raster, (1,)))
+    results.append(("islands", "GridBFS", time.perf_counter() - start, count))
+
+    start = time.perf_counter()
+    dist = nested_distances(grid, sources)
+    reached = sum(d != -1 for row in dist for d in row)
+    results.append(
+        ("distances", "nested lists", time.perf_counter() - start, reached)
+    )
+
+    engine4 = GridBFS(side, side)
+    start = time.perf_counter()
+    flat_sources = [engine4.index(r, c) for r, c in sources]
+    flat = engine4.distances(engine4.mask_from_raster(raster, (1,)), flat_sources)
+    reached = len(flat) - flat.count(-1)
+    results.append(("distances", "GridBFS", time.perf_counter() - start, reached))
+
+    return [
+        {"workload": w, "method": m, "seconds": s, "result": r}
+        for w, m, s, r in results
+    ]
+
+
+if __name__ == "__main__":
+    for side in (300, 1000):
+        print(f"Grid BFS benchmark - {side}x{side} raster, 60% open")
+        print("=" * 60)
+        print(f"{'workload':<12}{'method':<16}{'seconds':>10}{'result':>14}")
+        for row in run(side):
+            print(
+                f"{row['workload']:<12}{row['method']:<16}"
+                f"{row['seconds']:>10.3f}{row['result']:>14}"
+            )
+        print()
@@ -0,0 +1,93 @@
+"""
+Benchmark: incremental topological order / SCCs vs recompute per batch.
+
+Streams random edges into a dependency-style graph (mostly consistent with
+a hidden order, a few back edges that close cycles). After every batch the
+current order and SCCs must be available. Compares:
+- IncrementalTopologicalOrder.add_edges() (Pearce-Kelly with SCC merging)
+- recomputing with kahns_algorithm() (DAG stream) or
+  tarjan_scc_iterative() (stream with cycles) after each batch
+
+Run from the repository root:
+    python -m graph.benchmarks.bench_incremental_topo
+"""
+
+from __future__ import annotations
+
+import random
+import time
+
+from graph.advanced.tarjans_scc import tarjan_scc_iterative
+from graph.topological_sort.incremental_topological_order import (
+    IncrementalTopologicalOrder,
+)
+from graph.topological_sort.kahns_algorithm import kahns_algorithm
+
+
+def edge_stream(
+    n: int, m: int, back_fraction: float, seed: int = 0
+) -> list[tuple[int, int]]:
+    """m edges that follow a hidden random order, except back_fraction."""
+    rng = random.Random(seed)
+    rank = list(range(n))
+    rng.shuffle(rank)
+    edges = []
+    while len(edges) < m:
+        a, b = rng.randrange(n), rng.randrange(n)
+        if a == b:
+            continue
+        if (rank[a] < rank[b]) == (rng.random() >= back_fraction):
+            edges.append((a, b))
+        else:
+            edges.append((b, a))
+    return edges
+
+
+def run(
+    n: int = 2000, m: int = 6000, batch_sizes=(10, 100, 1000), seed: int = 0
+) -> list[dict]:
+    """Time both strategies on a DAG stream and on a stream with cycles."""
+    results = []
+    for label, back in (("DAG", 0.0), ("cyclic", 0.002)):
+        edges = edge_stream(n, m, back, seed)
+        for batch in batch_sizes:
+            start = time.perf_counter()
+            inc = IncrementalTopologicalOrder(n, strict=False)
+            for i in range(0, m, batch):
+                inc.add_edges(edges[i : i + batch])
+            inc_seconds = time.perf_counter() - start
+
+            start = time.perf_counter()
+            adj: list[list[int]] = [[] for _ in range(n)]
+            for i in range(0, m, batch):
+                for u, v in edges[i : i + batch]:
+                    adj[u].append(v)
+                if back:
+                    sccs = tarjan_scc_iterative(n, adj)
+                else:
+                    kahns_algorithm(adj)
+            re_seconds = time.perf_counter() - start
+
+            if back:
+                assert len(sccs) == inc.num_components
+            results.append(
+                {
+                    "stream": label,
+                    "batch": batch,
+                    "incremental_eps": m / inc_seconds,
+                    "recompute_eps": m / re_seconds,
+                }
+            )
+    return results
+
+
+if __name__ == "__main__":
+    n, m = 2000, 6000
+    print(f"Incremental topological order - {n} vertices, {m} edge insertions")
+    print("=" * 64)
+    print(f"{'stream':<8}{'batch':>7}{'incremental e/s':>20}{'recompute e/s':>18}")
+    for row in run(n, m):
+        print(
+            f"{row['stream']:<8}{row['batch']:>7}"
+            f"{row['incremental_eps']:>20,.0f}{row['recompute_eps']:>18,.0f}"
+        )
@@ -0,0 +1,138 @@
+"""
+Benchmark: Ford-Fulkerson vs Dinic vs highest-label push-relabel.
+
+Three generated network families, all with integer capacities:
+- layered: source -> k layers of w vertices -> sink, each vertex linked to
+  d random vertices of the next layer
+- random: n vertices with m uniform random arcs
+- assignment: source -> w workers -> w jobs -> sink with dense
+  worker-job arcs (every worker qualifies for half of the jobs)
+
+ford_fulkerson() works on an adjacency matrix with an O(V^2) BFS per
+augmenting path, so it only runs on the networks with at most
+matrix_limit vertices. Dinic and PushRelabel run on all of them; the
+times include adding the arcs. All flow values are checked to be equal.
+
+Run from the repository root:
+    python -m graph.benchmarks.bench_max_flow
+"""
+
+from __future__ import annotations
+
+import random
+import time
+
+from graph.max_flow.dinics_algorithm import Dinic
+from graph.max_flow.ford_fulkerson import ford_fulkerson
+from graph.max_flow.push_relabel import PushRelabel
+
+
+def layered_network(
+    layers: int, width: int, degree: int, seed: int = 0
+) -> tuple[int, list[tuple[int, int, int]]]:
+    """Arcs of a layered network; source 0, sink n - 1."""
+    rng = random.Random(seed)
+    n = layers * width + 2
+    sink = n - 1
+    arcs = [(0, 1 + i, rng.randint(50, 100)) for i in range(width)]
+    for layer in range(layers - 1):
+        base = 1 + layer * width
+        for i in range(width):
+            for j in rng.sample(range(width), degree):
+                arcs.append((base + i, base + width + j, rng.randint(1, 100)))
+    last = 1 + (layers - 1) * width
+    arcs += [(last + i, sink, rng.randint(50, 100)) for i in range(width)]
+    return n, arcs
+
+
+def random_network(
+    n: int, m: int, seed: int = 0
+) -> tuple[int, list[tuple[int, int, int]]]:
+    """m random arcs; source 0, sink n - 1."""
+    rng = random.Random(seed)
+    arcs = []
+    while len(arcs) < m:
+        u, v = rng.randrange(n), rng.randrange(n)
+        if u != v:
+            arcs.append((u, v, rng.randint(1, 100)))
+    return n, arcs
+
+
+def assignment_network(
+    width: int, seed: int = 0
+) -> tuple[int, list[tuple[int, int, int]]]:
+    """Dense bipartite assignment network; source 0, sink n - 1."""
+    rng = random.Random(seed)
+    n = 2 * width + 2
+    arcs = [(0, 1 + i, 1) for i in range(width)]
+    for i in range(width):
+        for j in rng.sample(range(width), width // 2):
+            arcs.append((1 + i, 1 + width + j, 1))
+    arcs += [(1 + width + j, n - 1, 1) for j in range(width)]
+    return n, arcs
+
+
+def _time_solver(cls, n: int, arcs) -> tuple[int, float]:
+    start = time.perf_counter()
+    network = cls(n)
+    for u, v, c in arcs:
+        network.add_edge(u, v, c)
+    flow = network.max_flow(0, n - 1)
+    return flow, time.perf_counter() - start
+
+
+def _time_matrix(n: int, arcs) -> tuple[int, float]:
+    start = time.perf_counter()
+    matrix = [[0] * n for _ in range(n)]
+    for u, v, c in arcs:
+        matrix[u][v] += c
+    flow = ford_fulkerson(matrix, 0, n - 1)
+    return flow, time.perf_counter() - start
+
+
+def run(seed: int = 0, matrix_limit: int = 500) -> list[dict]:
+    """Time the solvers on small and large networks of each family."""
+    networks = [
+        ("layered 8x50, d=5", layered_network(8, 50, 5, seed)),
+        ("layered 40x40, d=4", layered_network(40, 40, 4, seed)),
+        ("random n=400, m=4000", random_network(400, 4000, seed)),
+        ("random n=2000, m=40000", random_network(2000, 40000, seed)),
+        ("assignment 150x150", assignment_network(150, seed)),
+        ("assignment 800x800", assignment_network(800, seed)),
+    ]
+    results = []
+    for label, (n, arcs) in networks:
+        dinic_flow, dinic_seconds = _time_solver(Dinic, n, arcs)
+        pr_flow, pr_seconds = _time_solver(PushRelabel, n, arcs)
+        assert dinic_flow == pr_flow
+        ff_seconds = None
+        if n <= matrix_limit:
+            ff_flow, ff_seconds = _time_matrix(n, arcs)
+            assert ff_flow == pr_flow
+        results.append(
+            {
+                "network": label,
+                "arcs": len(arcs),
+                "flow": pr_flow,
+                "ford_fulkerson": ff_seconds,
+                "dinic": dinic_seconds,
+                "push_relabel": pr_seconds,
+            }
+        )
+    return results
+
+
+if __name__ == "__main__":
+    print("Max flow solvers (seconds)")
+    print("=" * 80)
+    print(
+        f"{'network':<24}{'arcs':>8}{'flow':>8}"
+        f"{'Ford-Fulkerson':>16}{'Dinic':>10}{'push-relabel':>14}"
+    )
+    for row in run():
+        ff = row["ford_fulkerson"]
+        print(
+            f"{row['network']:<24}{row['arcs']:>8}{row['flow']:>8}"
+            f"{'-' if ff is None else f'{ff:.3f}':>16}{row['dinic']:>10.3f}"
+            f"{row['push_relabel']:>14.3f}"
+        )
@@ -0,0 +1,88 @@
+"""
+Benchmark: process-pool Boruvka on shared edge shards vs Kruskal.
+
+Generates a random connected sparse graph as flat edge arrays (a random
+spanning tree plus uniform random edges) and times:
+- kruskals_mst() from kruskals_mst.py on the same edges as tuples
+- parallel_boruvka_mst_arrays() with 1 worker (inline) and with a pool
+
+The speedup of the pool grows with the number of cores; with one core it
+only adds the shared memory and pickling overhead. The 50M-edge setting,
+run(5_000_000, 50_000_000), needs about 2 GB for the edge arrays (input
+plus shared copy); the tuple list kruskals_mst() sorts adds several GB
+more, so pass kruskal=False there on smaller machines.
+
+Run from the repository root:
+    python -m graph.benchmarks.bench_parallel_mst
+"""
+
+from __future__ import annotations
+
+import os
+import random
+import time
+from array import array
+
+from graph.minimum_spanning_tree.kruskals_mst import kruskals_mst
+from graph.minimum_spanning_tree.parallel_boruvka_mst import (
+    parallel_boruvka_mst_arrays,
+)
+
+
+def random_edge_arrays(
+    n: int, m: int, max_weight: int = 1_000_000, seed: int = 0
+) -> tuple[array, array, array]:
+    """src, dst, weight arrays of a connected graph with m >= n - 1 edges."""
+    rng = random.Random(seed)
+    randrange = rng.randrange
+    src = array("i", range(1, n))
+    dst = array("i", [randrange(v) for v in range(1, n)])
+    src.extend(randrange(n) for _ in range(m - (n - 1)))
+    dst.extend(randrange(n) for _ in range(m - (n - 1)))
+    weights = array("q", [randrange(1, max_weight) for _ in range(m)])
+    return src, dst, weights
+
+
+def run(
+    n: int = 200_000,
+    m: int = 2_000_000,
+    worker_counts=None,
+    kruskal: bool = True,
+    seed: int = 0,
+) -> list[dict]:
+    """Time Kruskal and Boruvka with each worker count on one graph."""
+    src, dst, weights = random_edge_arrays(n, m, seed=seed)
+    if worker_counts is None:
+        worker_counts = sorted({1, os.cpu_count() or 1})
+
+    results = []
+    expected = None
+    if kruskal:
+        edges = list(zip(src, dst, weights))
+        start = time.perf_counter()
+        expected = sum(w for _, _, w in kruskals_mst(n, edges))
+        results.append(
+            {"method": "kruskals_mst", "seconds": time.perf_counter() - start}
+        )
+        del edges
+
+    for workers in worker_counts:
+        start = time.perf_counter()
+        _, total = parallel_boruvka_mst_arrays(n, src, dst, weights, workers)
+        seconds = time.perf_counter() - start
+        assert expected is None or total == expected
+        expected = total
+        results.append({"method": f"boruvka workers={workers}", "seconds": seconds})
+    return results
+
+
+if __name__ == "__main__":
+    n, m = 200_000, 2_000_000
+    print(f"Parallel MST - {n} vertices, {m} edges, {os.cpu_count()} CPUs")
+    print("=" * 50)
+    print(f"{'method':<26}{'seconds':>10}{'edges/s':>14}")
+    for row in run(n, m):
+        print(
+            f"{row['method']:<26}{row['seconds']:>10.2f}"
+            f"{m / row['seconds']:>14,.0f}"
+        )
@@ -0,0 +1,87 @@
+"""
+Benchmark: point-to-point queries vs full single-source Dijkstra.
+
+Generates a road-like grid (weights >= Euclidean edge length so the
+straight-line heuristic is admissible), runs random source-target queries
+and reports average settled vertices and query time for:
+full dijkstra(), early-exit Dijkstra, bidirectional Dijkstra and A*.
+
+Run from the repository root:
+    python -m graph.benchmarks.bench_point_to_point
+"""
+
+from __future__ import annotations
+
+import random
+import time
+
+from graph.core.csr_graph import CSRGraph
+from graph.core.random_graphs import road_grid_graph
+from graph.shortest_path.dijkstra import dijkstra
+from graph.shortest_path.point_to_point import (
+    astar,
+    bidirectional_dijkstra,
+    euclidean_heuristic,
+    point_to_point_dijkstra,
+)
+
+
+def grid_graph(
+    side: int, seed: int = 0
+) -> tuple[CSRGraph, list[tuple[float, float]]]:
+    """Undirected side x side grid with weights in [1, 4] and unit spacing."""
+    graph = road_grid_graph(side, seed=seed, weights=(1, 4))
+    coords = [(float(v % side), float(v // side)) for v in range(side * side)]
+    return graph, coords
+
+
+def run(side: int = 150, queries: int = 30, seed: int = 0) -> list[dict]:
+    """Run random queries and return per-method averages."""
+    graph, coords = grid_graph(side, seed)
+    reverse = graph.reverse()
+    rng = random.Random(seed + 1)
+    n = len(graph)
+    pairs = [(rng.randrange(n), rng.randrange(n)) for _ in range(queries)]
+
+    def full(s: int, t: int) -> tuple:
+        dist = dijkstra(graph, s)
+        return dist[t], [], sum(1 for d in dist if d != float("inf"))
+
+    methods = {
+        "full dijkstra()": full,
+        "early-exit": lambda s, t: point_to_point_dijkstra(graph, s, t),
+        "bidirectional": lambda s, t: bidirectional_dijkstra(graph, s, t, reverse),
+        "A* (Euclidean)": lambda s, t: astar(
+            graph, s, t, euclidean_heuristic(coords, t)
+        ),
+    }
+
+    rows = []
+    for name, query in methods.items():
+        settled_total = 0
+        start = time.perf_counter()
+        for s, t in pairs:
+            settled_total += query(s, t)[2]
+        elapsed = time.perf_counter() - start
+        rows.append(
+            {
+                "method": name,
+                "avg_settled": settled_total / queries,
+                "avg_ms": 1000 * elapsed / queries,
+            }
+        )
+    return rows
+
+
+if __name__ == "__main__":
+    side = 150
+    print(f"Point-to-point benchmark: {side}x{side} grid, 30 random queries")
+    print("=" * 56)
+    print(f"{'method':<18} {'avg settled':>12} {'avg ms':>10} {'vs full':>8}")
+    rows = run(side)
+    full = rows[0]["avg_settled"]
+    for row in rows:
+        print(
+            f"{row['method']:<18} {row['avg_settled']:>12.0f} "
+            f"{row['avg_ms']:>10.1f} {full / row['avg_settled']:>7.1f}x"
+        )
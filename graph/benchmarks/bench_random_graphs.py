@@ -0,0 +1,85 @@
+"""
+Benchmark: bulk random graph generators vs a per-pair G(n, p) loop.
+
+The baseline is the loop erdos_renyi_model.py used to run: one
+random.random() call per vertex pair and an adjacency list of Python
+lists, O(n^2) whatever the edge count. The generators of
+graph/core/random_graphs.py are timed end to end, up to a finished
+CSRGraph, at the average degrees used by the other benchmarks.
+
+Run from the repository root:
+    python -m graph.benchmarks.bench_random_graphs
+"""
+
+from __future__ import annotations
+
+import random
+import time
+
+from graph.core.random_graphs import (
+    barabasi_albert_graph,
+    gnm_random_graph,
+    gnp_random_graph,
+    random_regular_graph,
+    road_grid_graph,
+)
+
+
+def per_pair_gnp(n: int, p: float, seed: int = 0) -> list[list[int]]:
+    """G(n, p) with one random number per vertex pair (the old loop)."""
+    rng = random.Random(seed)
+    adj: list[list[int]] = [[] for _ in range(n)]
+    for i in range(n):
+        for j in range(i + 1, n):
+            if rng.random() < p:
+                adj[i].append(j)
+                adj[j].append(i)
+    return adj
+
+
+def run(
+    baseline_sizes: tuple[int, ...] = (2000, 5000),
+    sizes: tuple[int, ...] = (100_000, 1_000_000),
+    degree: int = 4,
+    seed: int = 0,
+) -> list[dict]:
+    rows = []
+    for n in baseline_sizes:
+        start = time.perf_counter()
+        adj = per_pair_gnp(n, degree / n, seed)
+        elapsed = time.perf_counter() - start
+        edges = sum(map(len, adj)) // 2
+        rows.append(
+            {"n": n, "generator": "per-pair G(n, p) loop", "edges": edges,
+             "seconds": elapsed}
+        )  # fmt: skip
+
+    generators = {
+        "G(n, p) skipping": lambda n: gnp_random_graph(n, degree / n, seed),
+        "G(n, m)": lambda n: gnm_random_graph(n, n * degree // 2, seed),
+        "Barabasi-Albert": lambda n: barabasi_albert_graph(n, degree // 2, seed),
+        "random regular": lambda n: random_regular_graph(n, degree, seed),
+        "road grid (keep 0.7)": lambda n: road_grid_graph(
+            round(n**0.5), keep=0.7, seed=seed
+        ),
+    }
+    for n in baseline_sizes + sizes:
+        for name, build in generators.items():
+            start = time.perf_counter()
+            graph = build(n)
+            elapsed = time.perf_counter() - start
+            rows.append(
+                {"n": len(graph), "generator": name,
+                 "edges": graph.num_edges // 2, "seconds": elapsed}
+            )  # fmt: skip
+    return rows
+
+
+if __name__ == "__main__":
+    print(f"{'n':>9} {'generator':<24} {'edges':>9} {'seconds':>8} {'edges/s':>10}")
+    for row in run():
+        rate = row["edges"] / row["seconds"] if row["seconds"] else float("inf")
+        print(
+            f"{row['n']:>9} {row['generator']:<24} {row['edges']:>9} "
+            f"{row['seconds']:>8.2f} {rate:>10.0f}"
+        )
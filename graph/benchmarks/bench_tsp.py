@@ -0,0 +1,112 @@
+"""
+Benchmark: TSP heuristics (quality vs time) against the exact Held-Karp.
+
+Random uniform cities in the unit square, Euclidean distances.
+
+- Small instances (exact_sizes): every heuristic configuration is compared
+  with the Held-Karp optimum; the table shows the mean and worst gap in
+  percent and the mean time.
+- Large instances (large_sizes): no optimum is known, so the gap is given
+  against the best tour any configuration found for that instance.
+
+The configurations build up the pipeline of tsp_local_search():
+construction only, + 2-opt, + Or-opt, Lin-Kernighan chains, and
+iterated local search with a time budget.
+
+Run from the repository root:
+    python -m graph.benchmarks.bench_tsp
+"""
+
+from __future__ import annotations
+
+import math
+import random
+import time
+
+from graph.np_hard.held_karp import held_karp
+from graph.np_hard.tsp_local_search import tsp_local_search
+
+CONFIGS: dict[str, dict] = {
+    "nearest": {"construction": "nearest", "lk_depth": 0, "or_opt": False},
+    "greedy": {"lk_depth": 0, "or_opt": False},
+    "greedy + 2-opt": {"or_opt": False},
+    "greedy + 2-opt + Or-opt": {},
+    "LK (depth 5) + Or-opt": {"lk_depth": 5},
+    "LK + Or-opt + ILS": {"lk_depth": 5, "time_limit": None},  # budget set per n
+}
+
+
+def random_points(n: int, seed: int = 0) -> list[tuple[float, float]]:
+    rng = random.Random(seed)
+    return [(rng.random(), rng.random()) for _ in range(n)]
+
+
+def _ils_budget(n: int) -> float:
+    """Time budget for the iterated local search row."""
+    return 0.05 if n <= 20 else n / 1000
+
+
+def _run_configs(points) -> dict[str, tuple[float, float]]:
+    """Length and seconds of every configuration on one instance."""
+    results = {}
+    for name, options in CONFIGS.items():
+        options = dict(options)
+        if "time_limit" in options:
+            options["time_limit"] = _ils_budget(len(points))
+        start = time.perf_counter()
+        length, _ = tsp_local_search(points, seed=0, **options)
+        results[name] = (length, time.perf_counter() - start)
+    return results
+
+
+def run(
+    exact_sizes: tuple[int, ...] = (10, 13, 16),
+    large_sizes: tuple[int, ...] = (1000, 5000),
+    instances: int = 5,
+) -> list[dict]:
+    rows = []
+    for n in exact_sizes:
+        gaps: dict[str, list[float]] = {name: [] for name in CONFIGS}
+        times: dict[str, list[float]] = {name: [] for name in CONFIGS}
+        exact_time = 0.0
+        for seed in range(instances):
+            points = random_points(n, seed)
+            matrix = [[math.dist(p, q) for q in points] for p in points]
+            start = time.perf_counter()
+            optimum, _ = held_karp(matrix, workers=1)
+            exact_time += time.perf_counter() - start
+            for name, (length, elapsed) in _run_configs(points).items():
+                # max(): a heuristic only "beats" the optimum by rounding
+                gaps[name].append(max(0.0, 100 * (length / optimum - 1)))
+                times[name].append(elapsed)
+        rows.append(
+            {"n": n, "solver": "Held-Karp (exact)", "mean_gap": 0.0, "max_gap": 0.0,
+             "seconds": exact_time / instances}
+        )  # fmt: skip
+        for name in CONFIGS:
+            rows.append(
+                {"n": n, "solver": name, "mean_gap": sum(gaps[name]) / instances,
+                 "max_gap": max(gaps[name]), "seconds": sum(times[name]) / instances}
+            )  # fmt: skip
+
+    for n in large_sizes:
+        results = _run_configs(random_points(n, 1))
+        best = min(length for length, _ in results.values())
+        for name, (length, elapsed) in results.items():
+            gap = 100 * (length / best - 1)
+            rows.append(
+                {"n": n, "solver": name, "mean_gap": gap, "max_gap": gap,
+                 "seconds": elapsed}
+            )  # fmt: skip
+    return rows
+
+
+if __name__ == "__main__":
+    header = f"{'n':>6} {'solver':<26} {'mean gap %':>11} {'max gap %':>10}"
+    print(f"{header} {'time (s)':>9}")
+    for row in run():
+        print(
+            f"{row['n']:>6} {row['solver']:<26} {row['mean_gap']:>11.2f} "
+            f"{row['max_gap']:>10.2f} {row['seconds']:>9.3f}"
+        )
+    print("Gaps for n >= 1000 are relative to the best tour found, not the optimum.")
@@ -12,12 +12,16 @@ Algorithm: BFS from starting pixel
 - Get the original color of starting pixel
 - BFS to all adjacent pixels with the same color
 - Change their color to the new color
+- Uses the flat-buffer engine in grid_bfs.py: pixels of the original color
+  form one bytearray mask, so neighbors need no bounds checks
 
 Time Complexity: O(rows * cols)
 Space Complexity: O(rows * cols)
+
+Run from the repository root: python -m graph.bfs_applications.flood_fill
 """
 
-from collections import deque
+from graph.bfs_applications.grid_bfs import GridBFS
 
 
 def flood_fill(
@@ -38,27 +42,19 @@ def flood_fill(
     if not image or not image[0]:
         return image
 
-    rows, cols = len(image), len(image[0])
     original_color = image[sr][sc]
 
     # If the new color is the same as original, no changes needed
     if original_color == new_color:
         return image
 
-    directions = [(-1, 0), (1, 0), (0, -1), (0, 1)]
-
-    queue = deque()
-    queue.append((sr, sc))
-    image[sr][sc] = new_color
-
-    while queue:
-        r, c = queue.popleft()
+    engine = GridBFS(len(image), len(image[0]))
+    same_color = engine.mask(image, (original_color,))
+    width = engine.width
 
-        for dr, dc in directions:
-            nr, nc = r + dr, c + dc
-            if 0 <= nr < rows and 0 <= nc < cols and image[nr][nc] == original_color:
-                image[nr][nc] = new_color
-                queue.append((nr, nc))
+    for frontier in engine.levels(same_color, (engine.index(sr, sc),)):
+        for i in frontier:
+            image[i // width - 1][i % width - 1] = new_color
 
     return image
 
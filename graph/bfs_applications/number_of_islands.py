@@ -8,12 +8,16 @@ An island is a group of adjacent 'L' cells connected horizontally, vertically, o
 Algorithm: BFS on each unvisited land cell
 - Traverse the grid; when an unvisited 'L' is found, start BFS to mark entire island
 - Each BFS initiation counts as one island
+- Uses the flat-buffer engine in grid_bfs.py: the land mask is one bytearray
+  and the next unvisited land cell is found with bytearray.find
 
 Time Complexity: O(rows * cols)
-Space Complexity: O(rows * cols) for visited array
+Space Complexity: O(rows * cols) bytes for the land mask
+
+Run from the repository root: python -m graph.bfs_applications.number_of_islands
 """
 
-from collections import deque
+from graph.bfs_applications.grid_bfs import GridBFS
 
 
 def count_islands(grid: list[list[str]]) -> int:
@@ -29,44 +33,9 @@ def count_islands(grid: list[list[str]]) -> int:
     if not grid or not grid[0]:
         return 0
 
-    rows, cols = len(grid), len(grid[0])
-    visited = [[False] * cols for _ in range(rows)]
-    island_count = 0
-
     # 8 directions: horizontal, vertical, diagonal
-    directions = [
-        (-1, -1),
-        (-1, 0),
-        (-1, 1),
-        (0, -1),
-        (0, 1),
-        (1, -1),
-        (1, 0),
-        (1, 1),
-    ]
-
-    def bfs(start_r: int, start_c: int) -> None:
-        """Perform BFS to mark all cells of an island as visited."""
-        queue = deque()
-        queue.append((start_r, start_c))
-        visited[start_r][start_c] = True
-
-        while queue:
-            r, c = queue.popleft()
-            for dr, dc in directions:
-                nr, nc = r + dr, c + dc
-                if 0 <= nr < rows and 0 <= nc < cols:
-                    if grid[nr][nc] == "L" and not visited[nr][nc]:
-                        visited[nr][nc] = True
-                        queue.append((nr, nc))
-
-    for r in range(rows):
-        for c in range(cols):
-            if grid[r][c] == "L" and not visited[r][c]:
-                bfs(r, c)
-                island_count += 1
-
-    return island_count
+    engine = GridBFS(len(grid), len(grid[0]), connectivity=8)
+    return engine.components(engine.mask(grid, "L"))
 
 
 if __name__ == "__main__":
@@ -15,12 +15,17 @@ Algorithm: Reverse BFS/DFS from ocean edges
 - Find all cells reachable from Pacific edges
 - Find all cells reachable from Atlantic edges
 - Return cells that are reachable from both
+- pacific_atlantic() uses the flat-buffer engine in grid_bfs.py with a
+  multi-source frontier per ocean and an uphill step rule
 
 Time Complexity: O(m * n)
 Space Complexity: O(m * n)
+
+Run from the repository root:
+    python -m graph.bfs_applications.pacific_atlantic_water_flow
 """
 
-from collections import deque
+from graph.bfs_applications.grid_bfs import GridBFS
 
 
 def pacific_atlantic(heights: list[list[int]]) -> list[list[int]]:
@@ -37,50 +42,30 @@ def pacific_atlantic(heights: list[list[int]]) -> list[list[int]]:
         return []
 
     rows, cols = len(heights), len(heights[0])
-
-    def bfs_from_ocean(ocean_cells: set[tuple[int, int]]) -> set[tuple[int, int]]:
-        """BFS from ocean edge cells, flowing uphill."""
-        reachable = set(ocean_cells)
-        queue = deque(ocean_cells)
-
-        while queue:
-            r, c = queue.popleft()
-
-            for dr, dc in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-                nr, nc = r + dr, c + dc
-
-                if (
-                    0 <= nr < rows
-                    and 0 <= nc < cols
-                    and (nr, nc) not in reachable
-                    and heights[nr][nc] >= heights[r][c]
-                ):
-                    reachable.add((nr, nc))
-                    queue.append((nr, nc))
-
-        return reachable
+    engine = GridBFS(rows, cols)
+    flat_heights = engine.values(heights)
+    land = bytearray(engine.size)
+    for i in engine.cells():
+        land[i] = 1
 
     # Pacific: top row and left column
-    pacific_cells = set()
-    for r in range(rows):
-        pacific_cells.add((r, 0))
-    for c in range(cols):
-        pacific_cells.add((0, c))
+    pacific_cells = [engine.index(0, c) for c in range(cols)]
+    pacific_cells += [engine.index(r, 0) for r in range(rows)]
 
     # Atlantic: bottom row and right column
-    atlantic_cells = set()
-    for r in range(rows):
-        atlantic_cells.add((r, cols - 1))
-    for c in range(cols):
-        atlantic_cells.add((rows - 1, c))
-
-    # Find reachable cells from each ocean
-    pacific_reachable = bfs_from_ocean(pacific_cells)
-    atlantic_reachable = bfs_from_ocean(atlantic_cells)
-
-    # Cells reachable from both oceans
-    result = sorted(list(pacific_reachable & atlantic_reachable))
-    return [list(cell) for cell in result]
+    atlantic_cells = [engine.index(rows - 1, c) for c in range(cols)]
+    atlantic_cells += [engine.index(r, cols - 1) for r in range(rows)]
+
+    # Multi-source BFS from each whole coast, flowing uphill
+    pacific_reachable = engine.reach(land[:], pacific_cells, flat_heights)
+    atlantic_reachable = engine.reach(land, atlantic_cells, flat_heights)
+
+    # Cells reachable from both oceans, in row-major order
+    return [
+        list(engine.coords(i))
+        for i in engine.cells()
+        if pacific_reachable[i] and atlantic_reachable[i]
+    ]
 
 
 def pacific_atlantic_dfs(heights: list[list[int]]) -> list[list[int]]:
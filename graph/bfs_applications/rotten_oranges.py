@@ -14,12 +14,16 @@ Algorithm: Multi-source BFS
 - Start BFS from all rotten oranges simultaneously
 - Each level of BFS represents one minute
 - Track fresh oranges; if any remain after BFS, return -1
+- Uses the flat-buffer engine in grid_bfs.py: the fresh oranges form one
+  bytearray mask and each frontier is a list of flat cell indices
 
 Time Complexity: O(rows * cols)
 Space Complexity: O(rows * cols)
+
+Run from the repository root: python -m graph.bfs_applications.rotten_oranges
 """
 
-from collections import deque
+from graph.bfs_applications.grid_bfs import GridBFS
 
 
 def rot_oranges(grid: list[list[int]]) -> int:
@@ -27,7 +31,7 @@ def rot_oranges(grid: list[list[int]]) -> int:
     Find the minimum time to rot all oranges.
 
     Args:
-        grid: 2D list where 0=empty, 1=fresh, 2=rotten
+        grid: 2D list where 0=empty, 1=fresh, 2=rotten (left unchanged)
 
     Returns:
         Minimum minutes to rot all oranges, or -1 if impossible
@@ -35,35 +39,23 @@ def rot_oranges(grid: list[list[int]]) -> int:
     if not grid or not grid[0]:
         return 0
 
-    rows, cols = len(grid), len(grid[0])
-    queue = deque()
-    fresh_count = 0
-
-    # Initialize queue with all rotten oranges and count fresh oranges
-    for r in range(rows):
-        for c in range(cols):
-            if grid[r][c] == 2:
-                queue.append((r, c))
-            elif grid[r][c] == 1:
-                fresh_count += 1
-
+    engine = GridBFS(len(grid), len(grid[0]))
+    fresh = engine.mask(grid, (1,))
+    fresh_count = fresh.count(1)
     if fresh_count == 0:
         return 0
 
-    directions = [(-1, 0), (1, 0), (0, -1), (0, 1)]
-    minutes = 0
+    values = engine.values(grid)
+    rotten = [i for i in engine.cells() if values[i] == 2]
+    if not rotten:
+        return -1
 
-    while queue and fresh_count > 0:
-        minutes += 1
-        for _ in range(len(queue)):
-            r, c = queue.popleft()
-
-            for dr, dc in directions:
-                nr, nc = r + dr, c + dc
-                if 0 <= nr < rows and 0 <= nc < cols and grid[nr][nc] == 1:
-                    grid[nr][nc] = 2
-                    fresh_count -= 1
-                    queue.append((nr, nc))
+    # Level 0 holds every rotten orange; level k rots at minute k
+    levels = engine.levels(fresh, rotten)
+    next(levels)
+    minutes = 0
+    for minutes, frontier in enumerate(levels, 1):
+        fresh_count -= len(frontier)
 
     return minutes if fresh_count == 0 else -1
 
@@ -16,12 +16,17 @@ Algorithm: BFS with 8 directions
 - Start BFS from (0, 0) if it's 0
 - Explore all 8 directions from each cell
 - First time we reach (n-1, n-1) gives the shortest path
+- Uses the flat-buffer engine in grid_bfs.py; parents live in one flat
+  array instead of a path copy per queued cell
 
 Time Complexity: O(n^2)
 Space Complexity: O(n^2)
+
+Run from the repository root:
+    python -m graph.bfs_applications.shortest_path_binary_matrix
 """
 
-from collections import deque
+from graph.bfs_applications.grid_bfs import GridBFS
 
 
 def shortest_path_binary_matrix(grid: list[list[int]]) -> int:
@@ -34,61 +39,19 @@ def shortest_path_binary_matrix(grid: list[list[int]]) -> int:
     Returns:
         Length of shortest path, or -1 if no path exists
     """
-    if not grid or not grid[0]:
-        return -1
-
-    n = len(grid)
-
-    # If start or end is blocked, no path possible
-    if grid[0][0] == 1 or grid[n - 1][n - 1] == 1:
-        return -1
-
-    # Special case: 1x1 grid
-    if n == 1:
-        return 1
-
-    # 8 directions
-    directions = [
-        (-1, -1),
-        (-1, 0),
-        (-1, 1),
-        (0, -1),
-        (0, 1),
-        (1, -1),
-        (1, 0),
-        (1, 1),
-    ]
-
-    queue = deque()
-    queue.append((0, 0, 1))  # (row, col, path_length)
-    grid[0][0] = 1  # Mark as visited
-
-    while queue:
-        r, c, length = queue.popleft()
-
-        # Check all 8 directions
-        for dr, dc in directions:
-            nr, nc = r + dr, c + dc
-
-            if 0 <= nr < n and 0 <= nc < n and grid[nr][nc] == 0:
-                # Check if we reached the destination
-                if nr == n - 1 and nc == n - 1:
-                    return length + 1
-
-                grid[nr][nc] = 1  # Mark as visited
-                queue.append((nr, nc, length + 1))
-
-    return -1
+    length, _ = shortest_path_binary_matrix_with_path(grid, with_path=False)
+    return length
 
 
 def shortest_path_binary_matrix_with_path(
-    grid: list[list[int]],
+    grid: list[list[int]], with_path: bool = True
 ) -> tuple[int, list[tuple[int, int]]]:
     """
     Find shortest path and return the actual path taken.
 
     Args:
-        grid: n x n binary matrix
+        grid: n x n binary matrix (left unchanged)
+        with_path: Reconstruct the path from a flat parent array
 
     Returns:
         Tuple of (length, path) where path is list of (row, col) coordinates
@@ -98,51 +61,23 @@ def shortest_path_binary_matrix_with_path(
 
     n = len(grid)
 
+    # If start or end is blocked, no path possible
     if grid[0][0] == 1 or grid[n - 1][n - 1] == 1:
         return -1, []
 
-    if n == 1:
-        return 1, [(0, 0)]
-
-    directions = [
-        (-1, -1),
-        (-1, 0),
-        (-1, 1),
-        (0, -1),
-        (0, 1),
-        (1, -1),
-        (1, 0),
-        (1, 1),
-    ]
-
-    # Work on a copy to avoid modifying original
-    visited = [[False] * n for _ in range(n)]
-    visited[0][0] = True
-
-    queue = deque()
-    queue.append((0, 0, 1, [(0, 0)]))
-
-    while queue:
-        r, c, length, path = queue.popleft()
-
-        for dr, dc in directions:
-            nr, nc = r + dr, c + dc
-
-            if (
-                0 <= nr < n
-                and 0 <= nc < n
-                and not visited[nr][nc]
-                and grid[nr][nc] == 0
-            ):
-                new_path = path + [(nr, nc)]
-
-                if nr == n - 1 and nc == n - 1:
-                    return length + 1, new_path
-
-                visited[nr][nc] = True
-                queue.append((nr, nc, length + 1, new_path))
+    # 8 directions
+    engine = GridBFS(n, n, connectivity=8)
+    steps, cells = engine.shortest_path(
+        engine.mask(grid, (0,)),
+        engine.index(0, 0),
+        engine.index(n - 1, n - 1),
+        with_path,
+    )
+    if steps == -1:
+        return -1, []
 
-    return -1, []
+    # Path length counts cells, not steps
+    return steps + 1, [engine.coords(i) for i in cells]
 
 
 if __name__ == "__main__":
@@ -0,0 +1,426 @@
+"""
+Compressed Sparse Row (CSR) Graph
+
+A CSR graph stores every out-edge of the graph in two flat arrays:
+
+    offsets[u] .. offsets[u + 1]   ->  slice of targets/weights owned by u
+    targets[i]                     ->  head of the i-th arc
+    weights[i]                     ->  weight of the i-th arc (optional)
+
+Compared with ``List[List[Tuple[int, int]]]`` (one list object per vertex and
+one tuple per edge, ~100 bytes per edge), a CSR graph costs 4-8 bytes per arc
+for the target plus 8 bytes for the weight, and the arrays are contiguous.
+
+The class behaves like a read-only adjacency list, so it can be handed
+directly to the existing graph functions:
+
+    graph[u]                       ->  neighbors of u (memoryview of ints)
+    graph.weighted_neighbors(u)    ->  (v, weight) pairs of u
+    graph.edges()                  ->  re-iterable (u, v, weight) triples
+    len(graph)                     ->  number of vertices
+
+which is all that ``bfs``/``dfs``, ``kahns_algorithm``, ``tarjan_scc``,
+``dijkstra``, ``bellman_ford`` and ``Dinic.from_graph`` need.
+
+Building from an edge list is a two-pass counting sort: O(V + E) time and no
+per-edge Python objects are kept once construction finishes.
+
+Time Complexity: O(V + E) to build, O(1) to locate a vertex's arcs
+Space Complexity: O(V + E) machine words
+"""
+
+from __future__ import annotations
+
+from array import array
+from itertools import repeat
+from typing import Any, Iterable, Iterator, Sequence
+
+# Largest vertex id that still fits the 32-bit 'i' target array.
+_INT32_MAX = 2**31 - 1
+
+
+def _zeros(typecode: str, length: int) -> array:
+    """Return a zero-filled array without building an intermediate list."""
+    return array(typecode, bytes(array(typecode).itemsize * length))
+
+
+class CSREdgeView:
+    """Re-iterable view over all arcs of a CSR graph as (u, v, weight)."""
+
+    __slots__ = ("_graph",)
+
+    def __init__(self, graph: CSRGraph) -> None:
+        self._graph = graph
+
+    def __len__(self) -> int:
+        return self._graph.num_edges
+
+    def __iter__(self) -> Iterator[tuple[int, int, Any]]:
+        g = self._graph
+        offsets, targets, weights = g.offsets, g.targets, g.weights
+        for u in range(g.num_vertices):
+            for i in range(offsets[u], offsets[u + 1]):
+                yield u, targets[i], weights[i] if weights is not None else 1
+
+
+class CSRGraph:
+    """Static graph stored in compressed sparse row form.
+
+    Attributes:
+        num_vertices: Number of vertices (labeled 0 to num_vertices-1).
+        directed: Whether edges were inserted in one direction only.
+        offsets: array('q') of length num_vertices + 1.
+        targets: array('i') (or 'q' for huge graphs) of arc heads.
+        weights: array('q') / array('d') of arc weights, or None if unweighted.
+    """
+
+    __slots__ = (
+        "num_vertices",
+        "directed",
+        "offsets",
+        "targets",
+        "weights",
+        "_targets_view",
+        "_weights_view",
+    )
+
+    def __init__(
+        self,
+        num_vertices: int,
+        offsets: array,
+        targets: array,
+        weights: array | None = None,
+        directed: bool = True,
+    ) -> None:
+        """Wrap already-built CSR arrays.
+
+        Args:
+            num_vertices: Number of vertices.
+            offsets: Row offsets, length num_vertices + 1, non-decreasing.
+            targets: Arc heads, length offsets[-1].
+            weights: Optional arc weights aligned with targets.
+            directed: Whether the arrays describe a directed graph.
+
+        Raises:
+            ValueError: If the array lengths are inconsistent.
+        """
+        if len(offsets) != num_vertices + 1:
+            raise ValueError("offsets must have num_vertices + 1 entries")
+        if len(targets) != offsets[num_vertices]:
+            raise ValueError("targets length does not match offsets[-1]")
+        if weights is not None and len(weights) != len(targets):
+            raise ValueError("weights must be aligned with targets")
+
+        self.num_vertices = num_vertices
+        self.directed = directed
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+        self._targets_view = memoryview(targets)
+        self._weights_view = memoryview(weights) if weights is not None else None
+
+    # ------------------------------------------------------------------
+    # Construction
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def from_arrays(
+        cls,
+        num_vertices: int,
+        sources: Sequence[int],
+        targets: Sequence[int],
+        weights: Sequence[float] | None = None,
+        directed: bool = True,
+        weight_typecode: str = "q",
+    ) -> CSRGraph:
+        """Bulk-build a CSR graph from parallel source/target(/weight) arrays.
+
+        Uses a counting sort on the source vertex, so arcs of each vertex keep
+        their input order. For undirected graphs every edge is stored twice.
+
+        Args:
+            num_vertices: Number of vertices.
+            sources: Tail of each edge.
+            targets: Head of each edge.
+            weights: Optional weight of each edge.
+            directed: If False, add the reverse arc for every edge.
+            weight_typecode: array typecode for weights ('q' or 'd').
+
+        Returns:
+            A new CSRGraph.
+        """
+        m = len(sources)
+        if len(targets) != m or (weights is not None and len(weights) != m):
+            raise ValueError("sources, targets and weights must be aligned")
+
+        # Pass 1: out-degree of every vertex, shifted by one for prefix sums.
+        offsets = _zeros("q", num_vertices + 1)
+        for u in sources:
+            offsets[u + 1] += 1
+        if not directed:
+            for v in targets:
+                offsets[v + 1] += 1
+        for u in range(num_vertices):
+            offsets[u + 1] += offsets[u]
+
+        # Pass 2: scatter every arc into its row.
+        arcs = offsets[num_vertices]
+        target_code = "i" if num_vertices <= _INT32_MAX else "q"
+        out_targets = _zeros(target_code, arcs)
+        out_weights = _zeros(weight_typecode, arcs) if weights is not None else None
+        cursor = array("q", offsets)
+
+        for i in range(m):
+            u = sources[i]
+            v = targets[i]
+            p = cursor[u]
+            out_targets[p] = v
+            cursor[u] = p + 1
+            if out_weights is not None:
+                out_weights[p] = weights[i]
+            if not directed:
+                p = cursor[v]
+                out_targets[p] = u
+                cursor[v] = p + 1
+                if out_weights is not None:
+                    out_weights[p] = weights[i]
+
+        return cls(num_vertices, offsets, out_targets, out_weights, directed)
+
+    @classmethod
+    def from_edges(
+        cls,
+        num_vertices: int,
+        edges: Iterable[Sequence[Any]],
+        directed: bool = True,
+        weighted: bool | None = None,
+        weight_typecode: str = "q",
+    ) -> CSRGraph:
+        """Bulk-build a CSR graph from (u, v) or (u, v, weight) edges.
+
+        The iterable is consumed once into compact arrays, so it may be a
+        generator streaming edges from disk.
+
+        Args:
+            num_vertices: Number of vertices.
+            edges: Iterable of (u, v) or (u, v, weight) tuples.
+            directed: If False, add the reverse arc for every edge.
+            weighted: Whether edges carry a weight. Detected from the first
+                edge when None.
+            weight_typecode: array typecode for weights ('q' or 'd').
+
+        Returns:
+            A new CSRGraph.
+        """
+        target_code = "i" if num_vertices <= _INT32_MAX else "q"
+        sources = array(target_code)
+        targets = array(target_code)
+        weights = array(weight_typecode)
+
+        for edge in edges:
+            if weighted is None:
+                weighted = len(edge) >= 3
+            sources.append(edge[0])
+            targets.append(edge[1])
+            if weighted:
+                weights.append(edge[2])
+
+        return cls.from_arrays(
+            num_vertices,
+            sources,
+            targets,
+            weights if weighted else None,
+            directed,
+            weight_typecode,
+        )
+
+    @classmethod
+    def from_adjacency(
+        cls, adj: Sequence[Sequence[Any]], weight_typecode: str = "q"
+    ) -> CSRGraph:
+        """Convert an adjacency list into a directed CSR graph.
+
+        Accepts ``list[list[int]]``, ``list[list[tuple[int, weight]]]`` or the
+        ``adj`` dict of ``GraphAdjacencyList`` (keys 0..V-1).
+
+        Args:
+            adj: Adjacency list indexed by vertex.
+            weight_typecode: array typecode for weights ('q' or 'd').
+
+        Returns:
+            A new CSRGraph with the same arcs in the same order.
+        """
+        n = len(adj)
+        weighted = any(
+            adj[u] and isinstance(adj[u][0], (tuple, list)) for u in range(n)
+        )
+        offsets = _zeros("q", n + 1)
+        target_code = "i" if n <= _INT32_MAX else "q"
+        targets = array(target_code)
+        weights = array(weight_typecode) if weighted else None
+
+        for u in range(n):
+            for item in adj[u]:
+                if weighted:
+                    targets.append(item[0])
+                    weights.append(item[1])
+                else:
+                    targets.append(item)
+            offsets[u + 1] = len(targets)
+
+        return cls(n, offsets, targets, weights, directed=True)
+
+    # ------------------------------------------------------------------
+    # Adjacency-list protocol
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return self.num_vertices
+
+    def __getitem__(self, u: int) -> memoryview:
+        """Return the neighbors of u as a zero-copy memoryview of ints."""
+        return self._targets_view[self.offsets[u] : self.offsets[u + 1]]
+
+    def neighbors(self, u: int) -> memoryview:
+        """Return the neighbors of u (same as ``graph[u]``)."""
+        return self._targets_view[self.offsets[u] : self.offsets[u + 1]]
+
+    def weighted_neighbors(self, u: int) -> Iterator[tuple[int, Any]]:
+        """Return (v, weight) pairs for the arcs leaving u.
+
+        Unweighted graphs report weight 1 for every arc.
+        """
+        lo, hi = self.offsets[u], self.offsets[u + 1]
+        if self._weights_view is None:
+            return zip(self._targets_view[lo:hi], repeat(1))
+        return zip(self._targets_view[lo:hi], self._weights_view[lo:hi])
+
+    def degree(self, u: int) -> int:
+        """Return the out-degree of u."""
+        return self.offsets[u + 1] - self.offsets[u]
+
+    def edges(self) -> CSREdgeView:
+        """Return a re-iterable view of all arcs as (u, v, weight)."""
+        return CSREdgeView(self)
+
+    # ------------------------------------------------------------------
+    # Whole-graph helpers
+    # ------------------------------------------------------------------
+
+    @property
+    def num_edges(self) -> int:
+        """Number of stored arcs (twice the edge count when undirected)."""
+        return self.offsets[self.num_vertices]
+
+    @property
+    def weighted(self) -> bool:
+        """Whether arcs carry explicit weights."""
+        return self.weights is not None
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes used by the offset, target and weight buffers."""
+        total = len(self.offsets) * self.offsets.itemsize
+        total += len(self.targets) * self.targets.itemsize
+        if self.weights is not None:
+            total += len(self.weights) * self.weights.itemsize
+        return total
+
+    def reverse(self) -> CSRGraph:
+        """Return the transpose graph (every arc u -> v becomes v -> u)."""
+        n = self.num_vertices
+        offsets, targets, weights = self.offsets, self.targets, self.weights
+
+        rev_offsets = _zeros("q", n + 1)
+        for v in targets:
+            rev_offsets[v + 1] += 1
+        for u in range(n):
+            rev_offsets[u + 1] += rev_offsets[u]
+
+        rev_targets = _zeros(targets.typecode, len(targets))
+        rev_weights = (
+            _zeros(weights.typecode, len(weights)) if weights is not None else None
+        )
+        cursor = array("q", rev_offsets)
+        for u in range(n):
+            for i in range(offsets[u], offsets[u + 1]):
+                v = targets[i]
+                p = cursor[v]
+                rev_targets[p] = u
+                cursor[v] = p + 1
+                if rev_weights is not None:
+                    rev_weights[p] = weights[i]
+
+        return CSRGraph(n, rev_offsets, rev_targets, rev_weights, self.directed)
+
+    def to_adjacency_list(self, weighted: bool | None = None) -> list[list[Any]]:
+        """Expand back into a Python adjacency list (for small graphs only).
+
+        Args:
+            weighted: Emit (v, weight) tuples if True, plain ints if False.
+                Defaults to whether the graph has weights.
+
+        Returns:
+            List of per-vertex neighbor lists.
+        """
+        if weighted is None:
+            weighted = self.weighted
+        if weighted:
+            return [list(self.weighted_neighbors(u)) for u in range(self.num_vertices)]
+        return [list(self[u]) for u in range(self.num_vertices)]
+
+    def __repr__(self) -> str:
+        kind = "directed" if self.directed else "undirected"
+        return (
+            f"CSRGraph(V={self.num_vertices}, arcs={self.num_edges}, "
+            f"{kind}, weighted={self.weighted})"
+        )
+
+
+if __name__ == "__main__":
+    # Example 1: Weighted directed graph from an edge list
+    #     4       6
+    # 0 ----> 1 ----> 4
+    # |       |       ^
+    # 8       3       | 10
+    # v       v       |
+    # 2 ----> 3 ------+
+    #     2
+    edges = [(0, 1, 4), (0, 2, 8), (1, 4, 6), (1, 2, 3), (2, 3, 2), (3, 4, 10)]
+    g = CSRGraph.from_edges(5, edges)
+
+    print("CSR Graph - Weighted Directed")
+    print("=" * 40)
+    print(g)
+    print(f"offsets: {g.offsets.tolist()}")
+    print(f"targets: {g.targets.tolist()}")
+    print(f"weights: {g.weights.tolist()}")
+    for u in range(len(g)):
+        print(f"  {u} -> {list(g.weighted_neighbors(u))}")
+
+    print()
+
+    # Example 2: Undirected unweighted graph, used like list[list[int]]
+    g2 = CSRGraph.from_edges(5, [(0, 1), (0, 2), (1, 2), (2, 3), (2, 4)], directed=False)
+    print("CSR Graph - Undirected Unweighted")
+    print("=" * 40)
+    print(g2)
+    for u in range(len(g2)):
+        print(f"  {u} -> {list(g2[u])} (degree {g2.degree(u)})")
+
+    print()
+
+    # Example 3: Transpose and memory footprint
+    rev = g.reverse()
+    print("Transpose of Example 1:")
+    for u in range(len(rev)):
+        print(f"  {u} <- {list(rev.weighted_neighbors(u))}")
+
+    n, m = 1000, 20000
+    big = CSRGraph.from_arrays(
+        n,
+        array("i", (i % n for i in range(m))),
+        array("i", ((i * 7 + 3) % n for i in range(m))),
+        array("q", (i % 100 for i in range(m))),
+    )
+    print(f"\n{big}: {big.nbytes} bytes ({big.nbytes / m:.1f} bytes/arc)")
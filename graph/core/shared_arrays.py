@@ -0,0 +1,116 @@
+"""
+Shared-Memory Array Bundles for Worker Processes
+
+Process pools normally pickle every argument and send a private copy to
+each worker. For a CSR graph with millions of arcs that copy costs more
+than the work itself. SharedArrays packs several array.array buffers
+(offsets, targets, weights, ...) into one multiprocessing.shared_memory
+block once; workers attach to the block by name and read the buffers
+through typed memoryviews without copying.
+
+Only a small spec tuple (block name and layout) is sent to the workers.
+
+Time Complexity: O(total bytes) to create, O(number of arrays) to attach
+Space Complexity: O(total bytes), shared by all processes
+
+Run from the repository root: python -m graph.core.shared_arrays
+"""
+
+from __future__ import annotations
+
+from array import array
+from multiprocessing import shared_memory
+from typing import Dict, Tuple
+
+# (block name, ((array name, typecode, byte offset, length), ...))
+SharedSpec = Tuple[str, Tuple[Tuple[str, str, int, int], ...]]
+
+
+class SharedArrays:
+    """Named array.array buffers copied into one shared memory block.
+
+    Use as a context manager (or call close()) so the block is unlinked.
+
+    Attributes:
+        spec: Picklable description of the block, passed to attach()
+    """
+
+    def __init__(self, arrays: Dict[str, array]) -> None:
+        """
+        Args:
+            arrays: Name -> array.array to share (copied once)
+        """
+        layout = []
+        pos = 0
+        for name, arr in arrays.items():
+            pos = (pos + 7) & ~7  # keep every buffer 8-byte aligned
+            layout.append((name, arr.typecode, pos, len(arr)))
+            pos += len(arr) * arr.itemsize
+
+        self._shm = shared_memory.SharedMemory(create=True, size=max(pos, 1))
+        buf = self._shm.buf
+        for (_, _, offset, _), arr in zip(layout, arrays.values()):
+            data = memoryview(arr).cast("B")
+            buf[offset : offset + len(data)] = data
+        self.spec: SharedSpec = (self._shm.name, tuple(layout))
+
+    def close(self) -> None:
+        """Release and unlink the block (workers must have finished)."""
+        self._shm.close()
+        self._shm.unlink()
+
+    def __enter__(self) -> SharedArrays:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def attach(
+    spec: SharedSpec,
+) -> Tuple[shared_memory.SharedMemory, Dict[str, memoryview]]:
+    """
+    Attach to a block created by SharedArrays (call inside a worker).
+
+    Args:
+        spec: SharedArrays.spec
+
+    Returns:
+        Tuple of (handle, views). Keep the handle alive while the views are
+        used; views[name] is a memoryview cast to the original typecode.
+    """
+    name, layout = spec
+    try:
+        shm = shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:  # Python < 3.13 has no track argument
+        shm = shared_memory.SharedMemory(name=name)
+
+    views = {}
+    for key, typecode, offset, length in layout:
+        size = length * array(typecode).itemsize
+        views[key] = shm.buf[offset : offset + size].cast(typecode)
+    return shm, views
+
+
+def _demo_sums(spec: SharedSpec) -> Tuple[int, float]:
+    """Demo worker: sum the shared buffers without copying them."""
+    handle, views = attach(spec)
+    result = sum(views["ints"]), sum(views["floats"])
+    for view in views.values():
+        view.release()
+    handle.close()
+    return result
+
+
+if __name__ == "__main__":
+    from multiprocessing import Pool
+
+    ints = array("q", range(1_000_000))
+    floats = array("d", [0.5]) * 1000
+    with SharedArrays({"ints": ints, "floats": floats}) as shared:
+        print("Shared Arrays")
+        print("=" * 40)
+        print(f"Spec: {shared.spec}")
+        with Pool(2) as pool:
+            print(f"Worker sums: {pool.map(_demo_sums, [shared.spec] * 2)}")
+        print(f"Local sums:  {(sum(ints), sum(floats))}")
@@ -21,9 +21,22 @@ Time Complexity (with optimizations):
 
 Space Complexity: O(n) for parent and rank arrays.
 
+ArrayDisjointSet is the shared implementation used by the MST and
+connectivity modules. It keeps parent/size in array('i') buffers, finds
+roots iteratively with path halving (no recursion limit), offers a bulk
+union_many() loop, keeps the number of sets and the largest set size up to
+date on every union, and has a rollback mode (union by size, no path
+compression, undo log) for offline algorithms.
+
+Run from the repository root:
+    python -m graph.disjoint_set.union_by_rank_path_compression
+
 Reference: https://www.geeksforgeeks.org/problems/union-by-rank-and-path-compression/1
 """
 
+from array import array
+from typing import Iterable, Tuple
+
 
 class DisjointSet:
     """Optimized Disjoint Set with Union by Rank and Path Compression.
@@ -249,6 +262,191 @@ class UnionBySize:
         return sets
 
 
+class ArrayDisjointSet:
+    """Disjoint Set on array('i') buffers with bulk union and rollback.
+
+    Union by size. Without rollback, find() halves paths as it walks; with
+    rollback=True trees are never compressed, so every union can be undone
+    by resetting one parent entry (find is then O(log n)).
+
+    Attributes:
+        parent: array('i') where parent[i] is the parent of element i.
+        size:   array('i') where size[r] is the size of the set rooted at r.
+        num_sets: Current number of disjoint sets.
+        largest: Size of the largest set.
+        rollback_enabled: Whether unions are logged for rollback().
+    """
+
+    def __init__(self, n: int, rollback: bool = False) -> None:
+        """Initialize ArrayDisjointSet with n singleton sets.
+
+        Args:
+            n: Number of elements (indexed 0 to n-1).
+            rollback: Log unions so they can be undone with rollback().
+        """
+        self.parent = array("i", range(n))
+        self.size = array("i", [1]) * n
+        self.num_sets = n
+        self.largest = 1 if n else 0
+        self.rollback_enabled = rollback
+        # Undo log: attached root (or -1 for a no-op) and the previous largest
+        self._history = array("i")
+        self._history_largest = array("i")
+        self._sets_cache: dict[int, list[int]] | None = None
+
+    def __len__(self) -> int:
+        return len(self.parent)
+
+    def find(self, i: int) -> int:
+        """Find the representative of the set containing element i.
+
+        Args:
+            i: The element to find the representative for.
+
+        Returns:
+            The representative (root) of the set containing i.
+        """
+        parent = self.parent
+        if self.rollback_enabled:
+            while parent[i] != i:
+                i = parent[i]
+            return i
+        while parent[i] != i:
+            grandparent = parent[parent[i]]
+            parent[i] = grandparent
+            i = grandparent
+        return i
+
+    def union(self, x: int, y: int) -> bool:
+        """Merge the sets containing x and y using union by size.
+
+        Args:
+            x: First element.
+            y: Second element.
+
+        Returns:
+            True if two sets were merged, False if x and y were already in
+            the same set.
+        """
+        x_root = self.find(x)
+        y_root = self.find(y)
+        if x_root == y_root:
+            if self.rollback_enabled:
+                self._history.append(-1)
+                self._history_largest.append(self.largest)
+            return False
+
+        size = self.size
+        if size[x_root] < size[y_root]:
+            x_root, y_root = y_root, x_root
+        if self.rollback_enabled:
+            self._history.append(y_root)
+            self._history_largest.append(self.largest)
+
+        self.parent[y_root] = x_root
+        size[x_root] += size[y_root]
+        if size[x_root] > self.largest:
+            self.largest = size[x_root]
+        self.num_sets -= 1
+        self._sets_cache = None
+        return True
+
+    def union_many(self, pairs: Iterable[Tuple[int, int]]) -> int:
+        """Union every (x, y) pair in one tight loop.
+
+        Args:
+            pairs: Iterable of (x, y) element pairs, e.g. an edge list.
+
+        Returns:
+            Number of unions that merged two different sets.
+        """
+        if self.rollback_enabled:
+            return sum(self.union(x, y) for x, y in pairs)
+
+        parent, size = self.parent, self.size
+        largest = self.largest
+        merged = 0
+        for x, y in pairs:
+            while parent[x] != x:
+                parent[x] = parent[parent[x]]
+                x = parent[x]
+            while parent[y] != y:
+                parent[y] = parent[parent[y]]
+                y = parent[y]
+            if x == y:
+                continue
+            if size[x] < size[y]:
+                x, y = y, x
+            parent[y] = x
+            size[x] += size[y]
+            if size[x] > largest:
+                largest = size[x]
+            merged += 1
+
+        if merged:
+            self.largest = largest
+            self.num_sets -= merged
+            self._sets_cache = None
+        return merged
+
+    def is_connected(self, x: int, y: int) -> bool:
+        """Check if x and y belong to the same set."""
+        return self.find(x) == self.find(y)
+
+    def get_set_size(self, i: int) -> int:
+        """Get the size of the set containing element i."""
+        return self.size[self.find(i)]
+
+    def get_num_sets(self) -> int:
+        """Return the number of disjoint sets (maintained, O(1))."""
+        return self.num_sets
+
+    def get_sets(self) -> dict[int, list[int]]:
+        """Get a dictionary mapping each representative to its set members.
+
+        The dict is cached until the next successful union, so repeated calls
+        between unions cost nothing. Do not modify the returned lists.
+        """
+        if self._sets_cache is None:
+            sets: dict[int, list[int]] = {}
+            find = self.find
+            for i in range(len(self.parent)):
+                rep = find(i)
+                if rep in sets:
+                    sets[rep].append(i)
+                else:
+                    sets[rep] = [i]
+            self._sets_cache = sets
+        return self._sets_cache
+
+    def checkpoint(self) -> int:
+        """Return a marker for rollback() (rollback mode only)."""
+        if not self.rollback_enabled:
+            raise RuntimeError("checkpoint() needs ArrayDisjointSet(n, rollback=True)")
+        return len(self._history)
+
+    def rollback(self, checkpoint: int) -> None:
+        """Undo every union made after checkpoint was taken.
+
+        Args:
+            checkpoint: Value returned by checkpoint().
+        """
+        if not self.rollback_enabled:
+            raise RuntimeError("rollback() needs ArrayDisjointSet(n, rollback=True)")
+        history, history_largest = self._history, self._history_largest
+        parent, size = self.parent, self.size
+        while len(history) > checkpoint:
+            y_root = history.pop()
+            self.largest = history_largest.pop()
+            if y_root == -1:
+                continue
+            x_root = parent[y_root]
+            parent[y_root] = y_root
+            size[x_root] -= size[y_root]
+            self.num_sets += 1
+        self._sets_cache = None
+
+
 if __name__ == "__main__":
     print("=" * 60)
     print("Union by Rank and Path Compression")
@@ -304,3 +502,22 @@ if __name__ == "__main__":
         )
 
     print("\nSets:", ds_size.get_sets())
+
+    # --- Array-backed DSU with bulk union and rollback ---
+    print("\n" + "=" * 60)
+    print("ArrayDisjointSet (bulk union + rollback)")
+    print("=" * 60)
+
+    ads = ArrayDisjointSet(8, rollback=True)
+    merged = ads.union_many([(0, 1), (2, 3), (1, 3), (4, 5)])
+    print(f"\nunion_many merged {merged} pairs -> sets: {ads.get_num_sets()}")
+    print(f"Largest set: {ads.largest}, sets: {ads.get_sets()}")
+
+    mark = ads.checkpoint()
+    ads.union(5, 0)
+    ads.union(6, 7)
+    print(f"After 2 more unions -> sets: {ads.num_sets}, largest: {ads.largest}")
+
+    ads.rollback(mark)
+    print(f"After rollback      -> sets: {ads.num_sets}, largest: {ads.largest}")
+    print(f"Is 5 connected to 0? {ads.is_connected(5, 0)}")
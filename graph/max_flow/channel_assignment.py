@@ -3,11 +3,20 @@ Channel Assignment Problem.
 
 Assign M transmitters to N receivers to maximize packets sent in one time slot. Each transmitter sends one packet, each receiver receives one packet per slot.
 
+The matching is computed by Hopcroft-Karp (hopcroft_karp.py).
+
 Based on: https://www.geeksforgeeks.org/channel-assignment-problem/
+
+Run from the repository root: python -m graph.max_flow.channel_assignment
 """
 
 from typing import List
 
+from graph.max_flow.hopcroft_karp import (
+    bipartite_graph_from_matrix,
+    hopcroft_karp,
+)
+
 
 class ChannelAssignment:
     """Solves channel assignment using bipartite matching."""
@@ -21,27 +30,11 @@ class ChannelAssignment:
         self.num_senders = len(table)
         self.num_receivers = len(table[0]) if self.num_senders > 0 else 0
 
-    def _bpm(self, sender: int, match_r: List[int], seen: List[bool]) -> bool:
-        """DFS to find receiver for sender."""
-        for receiver in range(self.num_receivers):
-            if self.table[sender][receiver] > 0 and not seen[receiver]:
-                seen[receiver] = True
-                if match_r[receiver] == -1 or self._bpm(
-                    match_r[receiver], match_r, seen
-                ):
-                    match_r[receiver] = sender
-                    return True
-        return False
-
     def max_packets(self) -> int:
         """Compute maximum packets sent."""
-        match_r = [-1] * self.num_receivers
-        result = 0
-        for sender in range(self.num_senders):
-            seen = [False] * self.num_receivers
-            if self._bpm(sender, match_r, seen):
-                result += 1
-        return result
+        graph = bipartite_graph_from_matrix(self.table)
+        size, _, _ = hopcroft_karp(graph, self.num_receivers)
+        return size
 
 
 if __name__ == "__main__":
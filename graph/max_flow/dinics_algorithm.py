@@ -3,76 +3,179 @@ Dinic's Algorithm for Maximum Flow.
 
 Faster max flow algorithm using BFS for level graphs and DFS for blocking flows. Time complexity: O(EV²).
 
+Arcs are stored struct-of-arrays style: arc a goes to to[a], has residual
+capacity cap[a] and its reverse arc is rev[a]; adj[u] lists the arc ids
+leaving u. The blocking-flow DFS is iterative (an explicit path of arc ids
+plus a current-arc pointer per vertex), so deep level graphs do not hit
+Python's recursion limit.
+
+With scaling=True (integer capacities), phases only use arcs with residual
+capacity >= delta for delta = 2^k, ..., 2, 1, which needs fewer, fatter
+augmenting paths on networks with widely varying capacities:
+O(E^2 log C) for C = max capacity.
+
+After max_flow(), min_cut() returns the source side of a minimum cut.
+
 Based on: https://www.geeksforgeeks.org/dinics-algorithm-for-maximum-flow/
+
+Run from the repository root: python -m graph.max_flow.dinics_algorithm
 """
 
+from array import array
 from collections import deque
-from typing import List
-
-
-class Edge:
-    def __init__(self, to: int, rev: int, capacity: int):
-        self.to = to
-        self.rev = rev
-        self.capacity = capacity
-        self.flow = 0
+from typing import List, Set, Tuple
 
 
 class Dinic:
     def __init__(self, num_vertices: int):
         self.num_vertices = num_vertices
-        self.adj = [[] for _ in range(num_vertices)]
+        self.adj: List[List[int]] = [[] for _ in range(num_vertices)]
+        self.to = array("i")
+        self.rev = array("i")
+        self.cap: list = []  # residual capacities (int or float)
         self.level = [0] * num_vertices
+        self._source = -1
 
-    def add_edge(self, u: int, v: int, capacity: int) -> None:
-        forward = Edge(v, len(self.adj[v]), capacity)
-        backward = Edge(u, len(self.adj[u]), 0)
-        self.adj[u].append(forward)
-        self.adj[v].append(backward)
+    @classmethod
+    def from_graph(cls, graph) -> "Dinic":
+        """Build a flow network from a CSRGraph, using arc weights as capacities.
 
-    def _bfs(self, source: int, sink: int) -> bool:
-        self.level = [-1] * self.num_vertices
-        self.level[source] = 0
+        Unweighted graphs get capacity 1 on every arc.
+        """
+        network = cls(len(graph))
+        for u in range(len(graph)):
+            for v, capacity in graph.weighted_neighbors(u):
+                network.add_edge(u, v, capacity)
+        return network
+
+    def add_edge(self, u: int, v: int, capacity: int) -> int:
+        """Add arc u -> v; returns its arc id (the reverse arc is id + 1)."""
+        a = len(self.to)
+        self.to.append(v)
+        self.rev.append(a + 1)
+        self.cap.append(capacity)
+        self.adj[u].append(a)
+        self.to.append(u)
+        self.rev.append(a)
+        self.cap.append(0)
+        self.adj[v].append(a + 1)
+        return a
+
+    def _bfs(self, source: int, sink: int, low=0) -> bool:
+        """Level graph over arcs with residual capacity > low."""
+        to, cap, adj = self.to, self.cap, self.adj
+        level = [-1] * self.num_vertices
+        level[source] = 0
         queue = deque([source])
         while queue:
             u = queue.popleft()
-            for edge in self.adj[u]:
-                if self.level[edge.to] == -1 and edge.capacity - edge.flow > 0:
-                    self.level[edge.to] = self.level[u] + 1
-                    queue.append(edge.to)
-        return self.level[sink] != -1
-
-    def _dfs(self, u: int, sink: int, flow: int, start: List[int]) -> int:
-        if u == sink:
-            return flow
-        while start[u] < len(self.adj[u]):
-            edge = self.adj[u][start[u]]
-            if (
-                self.level[edge.to] == self.level[u] + 1
-                and edge.capacity - edge.flow > 0
-            ):
-                curr_flow = min(flow, edge.capacity - edge.flow)
-                temp_flow = self._dfs(edge.to, sink, curr_flow, start)
-                if temp_flow > 0:
-                    edge.flow += temp_flow
-                    self.adj[edge.to][edge.rev].flow -= temp_flow
-                    return temp_flow
-            start[u] += 1
-        return 0
-
-    def max_flow(self, source: int, sink: int) -> int:
+            next_level = level[u] + 1
+            for a in adj[u]:
+                v = to[a]
+                if level[v] == -1 and cap[a] > low:
+                    level[v] = next_level
+                    queue.append(v)
+        self.level = level
+        return level[sink] != -1
+
+    def _blocking_flow(self, source: int, sink: int, low=0) -> int:
+        """Augment along level-graph paths until none is left (iterative DFS)."""
+        to, rev, cap, adj, level = self.to, self.rev, self.cap, self.adj, self.level
+        start = [0] * self.num_vertices  # current arc of every vertex
+        path: List[int] = []  # arc ids from the source to u
+        total = 0
+        u = source
+        while True:
+            if u == sink:
+                flow = min(cap[a] for a in path)
+                for a in path:
+                    cap[a] -= flow
+                    cap[rev[a]] += flow
+                total += flow
+                # Retreat to the tail of the first arc that became too small
+                k = next(i for i, a in enumerate(path) if cap[a] <= low)
+                del path[k:]
+                u = to[path[-1]] if path else source
+                continue
+
+            arcs, i = adj[u], start[u]
+            next_level = level[u] + 1
+            while i < len(arcs):
+                a = arcs[i]
+                if cap[a] > low and level[to[a]] == next_level:
+                    break
+                i += 1
+            start[u] = i
+
+            if i < len(arcs):
+                path.append(arcs[i])
+                u = to[arcs[i]]
+            elif path:
+                # Dead end: drop u from the level graph and retreat
+                level[u] = -1
+                u = to[rev[path.pop()]]
+                start[u] += 1
+            else:
+                return total
+
+    def max_flow(self, source: int, sink: int, scaling: bool = False) -> int:
+        """
+        Maximum flow from source to sink (continues from the current flow).
+
+        Args:
+            source: Source vertex
+            sink: Sink vertex
+            scaling: Use capacity scaling (integer capacities only)
+
+        Returns:
+            Value of the flow added by this call
+        """
+        self._source = source
         if source == sink:
             return 0
         total_flow = 0
+        if scaling:
+            top = max(self.cap, default=0)
+            delta = 1 << (int(top).bit_length() - 1) if top > 0 else 0
+            while delta > 1:
+                while self._bfs(source, sink, delta - 1):
+                    total_flow += self._blocking_flow(source, sink, delta - 1)
+                delta >>= 1
         while self._bfs(source, sink):
-            start = [0] * self.num_vertices
-            while True:
-                flow = self._dfs(source, sink, float("inf"), start)
-                if flow == 0:
-                    break
-                total_flow += flow
+            total_flow += self._blocking_flow(source, sink)
         return total_flow
 
+    def min_cut(self) -> Set[int]:
+        """
+        Source side of a minimum cut, after max_flow().
+
+        Returns:
+            Vertices reachable from the source in the residual graph
+        """
+        if self._source < 0:
+            raise RuntimeError("call max_flow() before min_cut()")
+        to, cap, adj = self.to, self.cap, self.adj
+        side = {self._source}
+        queue = deque([self._source])
+        while queue:
+            u = queue.popleft()
+            for a in adj[u]:
+                v = to[a]
+                if cap[a] > 0 and v not in side:
+                    side.add(v)
+                    queue.append(v)
+        return side
+
+    def cut_edges(self) -> List[Tuple[int, int]]:
+        """Original arcs (u, v) crossing the minimum cut, after max_flow()."""
+        side = self.min_cut()
+        to, rev, cap = self.to, self.rev, self.cap
+        return [
+            (to[rev[a]], to[a])
+            for a in range(0, len(to), 2)  # forward arcs have even ids
+            if to[rev[a]] in side and to[a] not in side and cap[a] + cap[rev[a]] > 0
+        ]
+
 
 if __name__ == "__main__":
     dinic = Dinic(6)
@@ -87,3 +190,11 @@ if __name__ == "__main__":
     dinic.add_edge(4, 3, 7)
     dinic.add_edge(4, 5, 4)
     print(f"Maximum flow (Dinic's): {dinic.max_flow(0, 5)}")  # Output: 23
+    print(f"Source side of the min cut: {sorted(dinic.min_cut())}")
+
+    # A 5000-vertex path: too deep for a recursive DFS
+    n = 5000
+    chain = Dinic(n)
+    for u in range(n - 1):
+        chain.add_edge(u, u + 1, 1 + u % 7)
+    print(f"Path of {n} vertices (scaling): {chain.max_flow(0, n - 1, scaling=True)}")
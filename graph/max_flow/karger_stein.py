@@ -0,0 +1,296 @@
+"""
+Karger-Stein Minimum Cut with Parallel, Reproducible Trials
+
+One run of Karger's algorithm (kargers_algorithm.py) contracts random edges
+until 2 vertices remain and finds the minimum cut with probability only
+about 2 / n^2, so O(n^2 log n) full runs are needed. Karger-Stein observes
+that the early contractions rarely destroy the minimum cut:
+
+1. Contract the graph to t = ceil(1 + n / sqrt(2)) vertices - the cut
+   survives with probability >= 1/2.
+2. Do this twice independently and recurse on both contracted graphs;
+   keep the smaller cut.
+
+Near the bottom the ceiling in t removes only one vertex per level while
+the number of subproblems still doubles, so graphs of at most BASE_SIZE
+vertices are solved exactly with Stoer-Wagner instead.
+
+One such trial succeeds with probability Omega(1 / log n), so O(log^2 n)
+trials suffice.
+
+Parallel edges are merged into one edge whose weight is their count, so a
+contracted graph on t vertices has at most t^2 / 2 edges. A contraction
+draws one random key per edge (exponential with rate = weight), sorts the
+edges by key and unions them in that order (ArrayDisjointSet) until t
+components are left: the same random edge sequence as Karger's "pick a
+random edge, skip self-loops", without ever rejecting a self-loop. The
+surviving edges are then relabeled to 0..t-1 and merged in one pass.
+
+Trials are independent, so they are spread over a process pool; the edge
+arrays go to the workers once through graph/core/shared_arrays.py. Every
+trial gets its own seed drawn from a master seed, and results are consumed
+in trial order, so the cut (and the early stop after the best cut has
+been seen stop_after times) is the same for any number of workers.
+
+Time Complexity: O(n^2 log n) per trial, O(n^2 log^3 n) for the default
+                 trials (E <= n^2 for a simple graph)
+Space Complexity: O(n^2) per trial (one edge list per recursion level)
+
+Based on: https://www.geeksforgeeks.org/kargers-algorithm-for-minimum-cut-set-2-analysis-and-applications/
+
+Run from the repository root: python -m graph.max_flow.karger_stein
+"""
+
+import math
+import os
+import random
+from array import array
+from functools import partial
+from itertools import repeat
+from multiprocessing import Pool
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from graph.core.shared_arrays import SharedArrays, attach
+from graph.disjoint_set.union_by_rank_path_compression import ArrayDisjointSet
+
+INF = float("inf")
+
+# Graphs this small are solved exactly instead of recursing further
+BASE_SIZE = 16
+
+# Per-process views of the shared edge arrays
+_worker_views = None
+_worker_handle = None
+
+
+def _merge_parallel(
+    pairs, weights
+) -> Tuple[array, array, array]:
+    """Sum parallel edges into one weighted edge; drop self-loops."""
+    merged: Dict[Tuple[int, int], int] = {}
+    for (a, b), w in zip(pairs, weights):
+        if a != b:
+            key = (a, b) if a < b else (b, a)
+            merged[key] = merged.get(key, 0) + w
+    return (
+        array("i", [a for a, _ in merged]),
+        array("i", [b for _, b in merged]),
+        array("q", merged.values()),
+    )
+
+
+def _contract(
+    n: int, src, dst, weights, target: int, rng: random.Random
+) -> Tuple[array, array, array, array]:
+    """
+    Contract random edges until target vertices are left.
+
+    An edge of weight w stands for w parallel edges. Sorting by keys
+    Exp(w) gives a weighted random order without replacement, i.e. each
+    next edge is picked with probability proportional to its weight, as
+    in Karger's algorithm. The graph must be connected.
+
+    Returns:
+        Tuple of (mapping, src, dst, weights): mapping[v] is the new id
+        (0 to target-1) of vertex v; the arrays hold the merged edges
+    """
+    expovariate = rng.expovariate
+    keys = [expovariate(w) for w in weights]
+    dsu = ArrayDisjointSet(n)
+    union = dsu.union
+    for e in sorted(range(len(keys)), key=keys.__getitem__):
+        if union(src[e], dst[e]) and dsu.num_sets == target:
+            break
+
+    ids: Dict[int, int] = {}
+    mapping = array("i", [ids.setdefault(r, len(ids)) for r in map(dsu.find, range(n))])
+    pairs = zip(map(mapping.__getitem__, src), map(mapping.__getitem__, dst))
+    return (mapping, *_merge_parallel(pairs, weights))
+
+
+def _stoer_wagner(n: int, src, dst, weights) -> Tuple[int, List[bool]]:
+    """Exact minimum cut of a small graph (Stoer-Wagner, O(n^3))."""
+    w = [[0] * n for _ in range(n)]
+    for u, v, c in zip(src, dst, weights):
+        w[u][v] += c
+        w[v][u] += c
+    groups = [[v] for v in range(n)]  # original vertices merged into v
+    active = list(range(n))
+    best, best_group = INF, groups[0]
+    while len(active) > 1:
+        # Maximum adjacency order; the last two vertices are merged
+        conn = [0] * n
+        added = [False] * n
+        prev = last = active[0]
+        for _ in range(len(active)):
+            pick, most = -1, -1
+            for v in active:
+                if not added[v] and conn[v] > most:
+                    pick, most = v, conn[v]
+            added[pick] = True
+            prev, last = last, pick
+            row = w[pick]
+            for v in active:
+                if not added[v]:
+                    conn[v] += row[v]
+        if conn[last] < best:
+            best, best_group = conn[last], list(groups[last])
+        groups[prev].extend(groups[last])
+        row_prev, row_last = w[prev], w[last]
+        for v in active:
+            row_prev[v] += row_last[v]
+            w[v][prev] = row_prev[v]
+        row_prev[prev] = 0
+        active.remove(last)
+    side = [False] * n
+    for v in best_group:
+        side[v] = True
+    return best, side
+
+
+def _karger_stein(
+    n: int, src, dst, weights, rng: random.Random
+) -> Tuple[int, List[bool]]:
+    """
+    One Karger-Stein trial on a connected weighted graph.
+
+    Returns:
+        Tuple of (cut_size, side) where side[v] tells which side of the
+        cut vertex v is on
+    """
+    if n <= BASE_SIZE:
+        return _stoer_wagner(n, src, dst, weights)
+    t = math.ceil(1 + n / math.sqrt(2))
+    best: Tuple[int, List[bool]] = (INF, [])
+    for _ in range(2):
+        mapping, *contracted = _contract(n, src, dst, weights, t, rng)
+        cut, side = _karger_stein(t, *contracted, rng)
+        if cut < best[0]:
+            best = (cut, [side[c] for c in mapping])
+    return best
+
+
+def _trial(n: int, src, dst, weights, seed: int):
+    """One seeded trial; returns (cut_size, vertices on the True side)."""
+    cut, side = _karger_stein(n, src, dst, weights, random.Random(seed))
+    return cut, array("i", [v for v in range(n) if side[v]])
+
+
+def _init_worker(spec) -> None:
+    """Pool initializer: attach to the shared edge arrays once per process."""
+    global _worker_views, _worker_handle
+    _worker_handle, _worker_views = attach(spec)
+
+
+def _worker_trial(n: int, seed: int):
+    """Pool task: one trial over the attached shared edge arrays."""
+    views = _worker_views
+    return _trial(n, views["src"], views["dst"], views["weights"], seed)
+
+
+def karger_stein_min_cut(
+    num_vertices: int,
+    edges: Sequence[Tuple[int, int]],
+    trials: Optional[int] = None,
+    seed: Optional[int] = None,
+    workers: Optional[int] = None,
+    stop_after: Optional[int] = None,
+) -> Tuple[int, List[int]]:
+    """
+    Minimum cut of an undirected multigraph with Karger-Stein.
+
+    Args:
+        num_vertices: Number of vertices (labeled 0 to num_vertices-1)
+        edges: List of (u, v) edges; parallel edges count separately
+        trials: Number of independent trials (default: ceil(ln(n)^2))
+        seed: Master seed; the same seed gives the same result
+        workers: Number of processes (default: os.cpu_count()); 1 runs in
+                 this process without a pool
+        stop_after: Stop once the best cut so far has been found this many
+                    times (default: run every trial)
+
+    Returns:
+        Tuple of (cut_size, side) where side lists the vertices on one side
+        of the cut
+    """
+    n = num_vertices
+    if n < 2:
+        raise ValueError("a cut needs at least 2 vertices")
+    src, dst, weights = _merge_parallel(edges, repeat(1))
+
+    # A disconnected graph has a cut of size 0: any one component
+    dsu = ArrayDisjointSet(n)
+    dsu.union_many(zip(src, dst))
+    if dsu.num_sets > 1:
+        root = dsu.find(0)
+        return 0, [v for v in range(n) if dsu.find(v) == root]
+
+    if trials is None:
+        trials = max(1, math.ceil(math.log(n) ** 2))
+    master = random.Random(seed)
+    seeds = [master.getrandbits(64) for _ in range(trials)]
+    workers = min(workers or os.cpu_count() or 1, trials)
+
+    def first_best(results) -> Tuple[int, List[int]]:
+        best, best_side, hits = INF, None, 0
+        for cut, side in results:
+            if cut < best:
+                best, best_side, hits = cut, side, 1
+            elif cut == best:
+                hits += 1
+            if stop_after and hits >= stop_after:
+                break
+        return best, list(best_side)
+
+    if workers == 1:
+        return first_best(map(partial(_trial, n, src, dst, weights), seeds))
+
+    arrays = {"src": src, "dst": dst, "weights": weights}
+    with SharedArrays(arrays) as shared:
+        # Leaving the pool early terminates the trials still running
+        with Pool(workers, _init_worker, (shared.spec,)) as pool:
+            return first_best(pool.imap(partial(_worker_trial, n), seeds))
+
+
+if __name__ == "__main__":
+    import time
+
+    from graph.max_flow.kargers_algorithm import Edge, Graph, karger_min_cut
+
+    # Example 1: The 4-vertex graph from kargers_algorithm.py
+    edges_list = [(0, 1), (0, 2), (0, 3), (1, 3), (2, 3)]
+    cut, side = karger_stein_min_cut(4, edges_list, seed=1)
+    print("Karger-Stein - Example 1")
+    print("=" * 50)
+    print(f"Minimum cut: {cut}, side: {side}")  # Output: 2
+
+    # Example 2: Two random dense clusters joined by 3 edges
+    half = 60
+    rng = random.Random(5)
+    edges_list = []
+    for offset in (0, half):
+        for u in range(half):
+            for v in range(u + 1, half):
+                if rng.random() < 0.3:
+                    edges_list.append((offset + u, offset + v))
+    for _ in range(3):
+        edges_list.append((rng.randrange(half), half + rng.randrange(half)))
+    n = 2 * half
+    print(f"\nExample 2 - {n} vertices, {len(edges_list)} edges, planted cut 3")
+    print("=" * 50)
+    for workers in sorted({1, 2, os.cpu_count() or 1}):
+        start = time.perf_counter()
+        cut, side = karger_stein_min_cut(n, edges_list, seed=42, workers=workers)
+        elapsed = time.perf_counter() - start
+        print(f"  workers={workers}: cut {cut}, |side| = {len(side)} ({elapsed:.2f}s)")
+
+    start = time.perf_counter()
+    cut, _ = karger_stein_min_cut(n, edges_list, seed=42, stop_after=3)
+    elapsed = time.perf_counter() - start
+    print(f"  stop_after=3: cut {cut} ({elapsed:.2f}s)")
+
+    graph = Graph(n, [Edge(u, v) for u, v in edges_list])
+    start = time.perf_counter()
+    cut = karger_min_cut(graph, iterations=200)
+    elapsed = time.perf_counter() - start
+    print(f"  karger_min_cut(), 200 contractions: cut {cut} ({elapsed:.2f}s)")
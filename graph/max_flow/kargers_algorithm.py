@@ -3,12 +3,19 @@ Karger's Algorithm for Minimum Cut.
 
 Randomized algorithm to find minimum cut in undirected graphs. Contracts random edges until 2 vertices remain. Run multiple times for reliable results.
 
+For larger graphs use karger_stein.py: recursive Karger-Stein trials, which
+need far fewer repetitions, run over a process pool with a reproducible seed.
+
 Based on: https://www.geeksforgeeks.org/kargers-algorithm-for-minimum-cut-set-1-introduction-and-implementation/
+
+Run from the repository root: python -m graph.max_flow.kargers_algorithm
 """
 
 import random
 from typing import List
 
+from graph.disjoint_set.union_by_rank_path_compression import ArrayDisjointSet
+
 
 class Edge:
     def __init__(self, src: int, dest: int):
@@ -22,45 +29,24 @@ class Graph:
         self.edges = edges.copy()
 
 
-def find(subsets: List[List[int]], i: int) -> int:
-    if subsets[i][0] != i:
-        subsets[i][0] = find(subsets, subsets[i][0])
-    return subsets[i][0]
-
-
-def union(subsets: List[List[int]], x: int, y: int) -> None:
-    x_root = find(subsets, x)
-    y_root = find(subsets, y)
-    if subsets[x_root][1] < subsets[y_root][1]:
-        subsets[x_root][0] = y_root
-    elif subsets[x_root][1] > subsets[y_root][1]:
-        subsets[y_root][0] = x_root
-    else:
-        subsets[y_root][0] = x_root
-        subsets[x_root][1] += 1
-
-
 def karger_min_cut(graph: Graph, iterations: int = 1000) -> int:
     """Run Karger's algorithm multiple times to find minimum cut."""
     min_cut = float("inf")
     for _ in range(iterations):
         current_edges = graph.edges.copy()
-        subsets = [[i, 0] for i in range(graph.V)]
-        vertices = graph.V
-
-        while vertices > 2:
-            idx = random.randint(0, len(current_edges) - 1)
-            edge = current_edges[idx]
-            src_root = find(subsets, edge.src)
-            dest_root = find(subsets, edge.dest)
-            if src_root == dest_root:
-                continue
-            union(subsets, src_root, dest_root)
-            vertices -= 1
+        dsu = ArrayDisjointSet(graph.V)
+
+        # One pass in random order instead of repeated random picks
+        random.shuffle(current_edges)
+        for edge in current_edges:
+            if dsu.num_sets <= 2:
+                break
+            dsu.union(edge.src, edge.dest)
 
+        find = dsu.find
         cut_edges = 0
         for edge in current_edges:
-            if find(subsets, edge.src) != find(subsets, edge.dest):
+            if find(edge.src) != find(edge.dest):
                 cut_edges += 1
         min_cut = min(min_cut, cut_edges)
     return min_cut
@@ -3,54 +3,16 @@ Maximum Number of Edge-Disjoint Paths Between Two Vertices.
 
 Edge-disjoint paths share no common edges. The maximum number equals the max flow from s to t when all edge capacities are set to 1.
 
+The flow is computed with Dinic from dinics_algorithm.py.
+
 Based on: https://www.geeksforgeeks.org/problems/find-maximum-number-of-edge-disjoint-paths-between-two-vertices/1
+
+Run from the repository root: python -m graph.max_flow.max_edge_disjoint_paths
 """
 
-from collections import deque
 from typing import List
 
-
-def _bfs(
-    residual_graph: List[List[int]], source: int, sink: int, parent: List[int]
-) -> bool:
-    num_vertices = len(residual_graph)
-    visited = [False] * num_vertices
-    queue = deque([source])
-    visited[source] = True
-    parent[source] = -1
-    while queue:
-        u = queue.popleft()
-        for v in range(num_vertices):
-            if not visited[v] and residual_graph[u][v] > 0:
-                queue.append(v)
-                parent[v] = u
-                visited[v] = True
-    return visited[sink]
-
-
-def _ford_fulkerson(graph: List[List[int]], source: int, sink: int) -> int:
-    num_vertices = len(graph)
-    residual_graph = [[0] * num_vertices for _ in range(num_vertices)]
-    for u in range(num_vertices):
-        for v in range(num_vertices):
-            residual_graph[u][v] = graph[u][v]
-    parent = [-1] * num_vertices
-    max_flow = 0
-    while _bfs(residual_graph, source, sink, parent):
-        path_flow = float("inf")
-        v = sink
-        while v != source:
-            u = parent[v]
-            path_flow = min(path_flow, residual_graph[u][v])
-            v = parent[v]
-        v = sink
-        while v != source:
-            u = parent[v]
-            residual_graph[u][v] -= path_flow
-            residual_graph[v][u] += path_flow
-            v = parent[v]
-        max_flow += path_flow
-    return max_flow
+from graph.max_flow.dinics_algorithm import Dinic
 
 
 def max_edge_disjoint_paths(graph: List[List[int]], source: int, sink: int) -> int:
@@ -65,11 +27,12 @@ def max_edge_disjoint_paths(graph: List[List[int]], source: int, sink: int) -> i
     Returns:
         Maximum number of edge-disjoint paths.
     """
-    capacity_graph = [
-        [1 if graph[u][v] > 0 else 0 for v in range(len(graph))]
-        for u in range(len(graph))
-    ]
-    return _ford_fulkerson(capacity_graph, source, sink)
+    network = Dinic(len(graph))
+    for u in range(len(graph)):
+        for v in range(len(graph)):
+            if graph[u][v] > 0:
+                network.add_edge(u, v, 1)
+    return network.max_flow(source, sink)
 
 
 if __name__ == "__main__":
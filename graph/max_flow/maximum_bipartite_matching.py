@@ -1,13 +1,21 @@
 """
 Maximum Bipartite Matching.
 
-A matching in a bipartite graph is a set of edges with no shared endpoints. Maximum matching is the largest such set. Uses DFS-based approach similar to Ford-Fulkerson.
+A matching in a bipartite graph is a set of edges with no shared endpoints. Maximum matching is the largest such set.
+
+The matching itself is computed by Hopcroft-Karp (hopcroft_karp.py),
+O(E * sqrt(V)) instead of one DFS per applicant.
 
 Based on: https://www.geeksforgeeks.org/maximum-bipartite-matching/
+
+Run from the repository root:
+    python -m graph.max_flow.maximum_bipartite_matching
 """
 
 from typing import List
 
+from graph.max_flow.hopcroft_karp import hopcroft_karp
+
 
 class BipartiteMatching:
     """Solves maximum bipartite matching problems."""
@@ -21,25 +29,11 @@ class BipartiteMatching:
         self.num_applicants = len(bipartite_graph)
         self.num_jobs = len(bipartite_graph[0]) if self.num_applicants > 0 else 0
 
-    def _bpm(self, applicant: int, match_r: List[int], seen: List[bool]) -> bool:
-        """DFS to find matching for applicant."""
-        for job in range(self.num_jobs):
-            if self.graph[applicant][job] == 1 and not seen[job]:
-                seen[job] = True
-                if match_r[job] == -1 or self._bpm(match_r[job], match_r, seen):
-                    match_r[job] = applicant
-                    return True
-        return False
-
     def max_matching(self) -> int:
         """Compute maximum number of matches."""
-        match_r = [-1] * self.num_jobs
-        result = 0
-        for applicant in range(self.num_applicants):
-            seen = [False] * self.num_jobs
-            if self._bpm(applicant, match_r, seen):
-                result += 1
-        return result
+        adjacency = [[j for j, x in enumerate(row) if x == 1] for row in self.graph]
+        size, _, _ = hopcroft_karp(adjacency, self.num_jobs)
+        return size
 
 
 if __name__ == "__main__":
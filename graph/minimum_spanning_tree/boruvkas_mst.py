@@ -21,64 +21,18 @@ Key Properties:
 
 Time Complexity: O(E log V)
 Space Complexity: O(V)
-"""
-
-from typing import List, Tuple
-
-
-class DisjointSet:
-    """Disjoint Set Union (DSU) data structure with path compression and union by rank."""
-
-    def __init__(self, n: int) -> None:
-        """
-        Initialize DSU with n elements.
-
-        Args:
-            n: Number of elements.
-        """
-        self.parent: List[int] = list(range(n))
-        self.rank: List[int] = [0] * n
-
-    def find(self, x: int) -> int:
-        """
-        Find the root of the set containing x with path compression.
-
-        Args:
-            x: Element to find.
-
-        Returns:
-            Root of the set containing x.
-        """
-        if self.parent[x] != x:
-            self.parent[x] = self.find(self.parent[x])
-        return self.parent[x]
 
-    def union(self, x: int, y: int) -> bool:
-        """
-        Union the sets containing x and y using union by rank.
-
-        Args:
-            x: First element.
-            y: Second element.
+The DSU is the shared ArrayDisjointSet from
+graph/disjoint_set/union_by_rank_path_compression.py. For very large edge
+lists, parallel_boruvka_mst.py runs the cheapest-edge scan in a process
+pool over shared-memory edge shards.
 
-        Returns:
-            True if union was performed, False if already in the same set.
-        """
-        root_x = self.find(x)
-        root_y = self.find(y)
-
-        if root_x == root_y:
-            return False
+Run from the repository root: python -m graph.minimum_spanning_tree.boruvkas_mst
+"""
 
-        if self.rank[root_x] < self.rank[root_y]:
-            self.parent[root_x] = root_y
-        elif self.rank[root_x] > self.rank[root_y]:
-            self.parent[root_y] = root_x
-        else:
-            self.parent[root_y] = root_x
-            self.rank[root_x] += 1
+from typing import List, Tuple
 
-        return True
+from graph.disjoint_set.union_by_rank_path_compression import ArrayDisjointSet
 
 
 class Graph:
@@ -113,12 +67,11 @@ class Graph:
             Tuple of (mst_edges, mst_weight) where mst_edges is a list of
             (u, v, weight) tuples and mst_weight is the total weight.
         """
-        dsu = DisjointSet(self.V)
-        num_components = self.V
+        dsu = ArrayDisjointSet(self.V)
         mst_edges: List[Tuple[int, int, int]] = []
         mst_weight = 0
 
-        while num_components > 1:
+        while dsu.num_sets > 1:
             # For each component, store the cheapest edge: cheapest[component] = (u, v, w)
             cheapest: List[Tuple[int, int, int] | None] = [None] * self.V
 
@@ -147,7 +100,10 @@ class Graph:
                         dsu.union(set_u, set_v)
                         mst_edges.append((u, v, w))
                         mst_weight += w
-                        num_components -= 1
+
+            # Disconnected graph: no component has an outgoing edge left
+            if not any(c is not None for c in cheapest):
+                break
 
         return mst_edges, mst_weight
 
@@ -0,0 +1,289 @@
+"""
+External-Memory Kruskal's MST for Edge Files Larger than RAM
+
+Graph.kruskal_mst() in kruskals_mst.py keeps every edge as a Python tuple
+and sorts the whole list in memory. When the edge list only fits on disk,
+the sort is done externally and the sorted stream is fed to the DSU:
+
+1. Edges are fixed-size binary records (u, v, weight) in a file,
+   see write_edge_file().
+2. Run formation: read run_records edges at a time, sort them by weight
+   in memory and write each sorted run to a temporary file.
+3. Merge: heapq.merge() streams the runs in weight order, reading every
+   run in blocks. At most MERGE_FAN_IN runs are open at once; while there
+   are more, groups of MERGE_FAN_IN runs are merged into longer runs on
+   disk first, so the open-file limit is never reached.
+4. Kruskal: union each edge of the merged stream with ArrayDisjointSet;
+   stop as soon as V - 1 edges are taken.
+
+Only the DSU, the MST itself, one run buffer and one read block per open
+run are in memory. run_records defaults to max(V, 65536) and the merge
+blocks share the same budget (but are never smaller than
+MIN_BLOCK_RECORDS), so peak memory is O(V) independent of E.
+
+Time Complexity: O(E log E) CPU, O(E) sequential record reads and writes
+                 per merge pass (one pass unless there are more than
+                 MERGE_FAN_IN runs)
+Space Complexity: O(V + run_records) memory, O(E) temporary disk
+
+Run from the repository root:
+    python -m graph.minimum_spanning_tree.external_kruskal_mst
+"""
+
+import heapq
+import os
+import struct
+import tempfile
+from itertools import islice, starmap
+from operator import itemgetter
+from typing import BinaryIO, Iterable, Iterator, List, Optional, Tuple
+
+from graph.disjoint_set.union_by_rank_path_compression import ArrayDisjointSet
+
+# Little-endian record layouts: int32 u, int32 v, int64 or float64 weight
+RECORD_FORMATS = {"q": "<iiq", "d": "<iid"}
+
+# Most runs merged (and files open) at once, and the smallest read block
+MERGE_FAN_IN = 32
+MIN_BLOCK_RECORDS = 1024
+
+_by_weight = itemgetter(2)
+
+
+def _record(weight_type: str) -> struct.Struct:
+    if weight_type not in RECORD_FORMATS:
+        raise ValueError(f"weight_type must be 'q' or 'd', got {weight_type!r}")
+    return struct.Struct(RECORD_FORMATS[weight_type])
+
+
+def write_edge_file(
+    path: str, edges: Iterable[Tuple[int, int, int]], weight_type: str = "q"
+) -> int:
+    """
+    Write (u, v, weight) edges as binary records.
+
+    Args:
+        path: Output file
+        edges: Iterable of (u, v, weight); read lazily, so a generator
+               never needs to fit in memory
+        weight_type: "q" for int64 weights, "d" for float64
+
+    Returns:
+        Number of edges written
+    """
+    pack = _record(weight_type).pack
+    edges = iter(edges)
+    count = 0
+    with open(path, "wb") as f:
+        while True:
+            block = list(islice(edges, 65536))
+            if not block:
+                return count
+            f.write(b"".join(starmap(pack, block)))
+            count += len(block)
+
+
+def _read_records(
+    f: BinaryIO, record: struct.Struct, block_records: int
+) -> Iterator[Tuple[int, int, int]]:
+    """Yield records from an open file, block_records at a time."""
+    size = record.size * block_records
+    while True:
+        data = f.read(size)
+        if not data:
+            return
+        yield from record.iter_unpack(data)
+
+
+def _write_records(
+    path: str, records: Iterable[Tuple[int, int, int]], record: struct.Struct
+) -> None:
+    """Write records to path, 65536 at a time."""
+    pack = record.pack
+    records = iter(records)
+    with open(path, "wb") as out:
+        while True:
+            block = list(islice(records, 65536))
+            if not block:
+                return
+            out.write(b"".join(starmap(pack, block)))
+
+
+def _merge_runs(
+    runs: List[str], record: struct.Struct, block: int, extra=()
+) -> Iterator[Tuple[int, int, int]]:
+    """Merge sorted run files (and the sorted iterable extra) by weight."""
+    files = [open(run, "rb") for run in runs]
+    try:
+        streams = [_read_records(f, record, block) for f in files]
+        streams.append(iter(extra))
+        yield from heapq.merge(*streams, key=_by_weight)
+    finally:
+        for f in files:
+            f.close()
+
+
+def read_edge_file(
+    path: str, weight_type: str = "q", block_records: int = 65536
+) -> Iterator[Tuple[int, int, int]]:
+    """
+    Stream (u, v, weight) records from an edge file in file order.
+
+    Args:
+        path: File written by write_edge_file()
+        weight_type: Weight layout the file was written with
+        block_records: Records read per system call
+    """
+    with open(path, "rb") as f:
+        yield from _read_records(f, _record(weight_type), block_records)
+
+
+def external_sorted_edges(
+    path: str,
+    run_records: int = 1 << 20,
+    weight_type: str = "q",
+    tmpdir: Optional[str] = None,
+) -> Iterator[Tuple[int, int, int]]:
+    """
+    Stream the edges of a file in non-decreasing weight order.
+
+    Sorted runs of run_records edges go to a temporary directory that is
+    removed when the generator is exhausted or closed.
+
+    Args:
+        path: File written by write_edge_file()
+        run_records: Edges sorted in memory at a time
+        weight_type: Weight layout the file was written with
+        tmpdir: Where to put the runs (default: the system temp directory)
+
+    Yields:
+        (u, v, weight) tuples sorted by weight
+    """
+    record = _record(weight_type)
+    with tempfile.TemporaryDirectory(dir=tmpdir) as directory:
+        runs: List[str] = []
+        written = 0
+
+        def new_run() -> str:
+            nonlocal written
+            written += 1
+            return os.path.join(directory, f"run{written}.bin")
+
+        last: List[Tuple[int, int, int]] = []
+        with open(path, "rb") as f:
+            edges = _read_records(f, record, min(run_records, 65536))
+            while True:
+                chunk = list(islice(edges, run_records))
+                if not chunk:
+                    break
+                chunk.sort(key=_by_weight)
+                if last:
+                    runs.append(new_run())
+                    _write_records(runs[-1], last, record)
+                last = chunk
+
+        # The last run never touches the disk
+        if not runs:
+            yield from last
+            return
+        block = max(MIN_BLOCK_RECORDS, run_records // (MERGE_FAN_IN + 1))
+        while len(runs) > MERGE_FAN_IN:
+            # Consecutive groups keep equal weights in file order
+            merged = []
+            for lo in range(0, len(runs), MERGE_FAN_IN):
+                group = runs[lo : lo + MERGE_FAN_IN]
+                if len(group) == 1:
+                    merged.append(group[0])
+                    continue
+                merged.append(new_run())
+                _write_records(merged[-1], _merge_runs(group, record, block), record)
+                for run in group:
+                    os.remove(run)
+            runs = merged
+        yield from _merge_runs(runs, record, block, last)
+
+
+def external_kruskal_mst(
+    path: str,
+    num_vertices: int,
+    run_records: Optional[int] = None,
+    weight_type: str = "q",
+    tmpdir: Optional[str] = None,
+) -> Tuple[List[Tuple[int, int, int]], int]:
+    """
+    Minimum spanning tree (forest) of an undirected graph stored on disk.
+
+    Args:
+        path: Edge file written by write_edge_file()
+        num_vertices: Number of vertices (labeled 0 to num_vertices-1)
+        run_records: Edges per in-memory sorted run
+                     (default: max(num_vertices, 65536))
+        weight_type: "q" for int64 weights, "d" for float64
+        tmpdir: Directory for the sorted runs
+
+    Returns:
+        Tuple of (mst_edges, mst_weight)
+    """
+    if run_records is None:
+        run_records = max(num_vertices, 65536)
+
+    dsu = ArrayDisjointSet(num_vertices)
+    mst_edges: List[Tuple[int, int, int]] = []
+    mst_weight = 0
+    stream = external_sorted_edges(path, run_records, weight_type, tmpdir)
+    try:
+        for u, v, w in stream:
+            if dsu.union(u, v):
+                mst_edges.append((u, v, w))
+                mst_weight += w
+                if len(mst_edges) == num_vertices - 1:
+                    break
+    finally:
+        stream.close()  # removes the temporary runs
+    return mst_edges, mst_weight
+
+
+if __name__ == "__main__":
+    import random
+    import time
+
+    from graph.minimum_spanning_tree.kruskals_mst import kruskals_mst
+
+    workdir = tempfile.mkdtemp()
+    try:
+        # Example 1: The 6-vertex graph from kruskals_mst.py
+        edges_list = [
+            (0, 1, 2), (0, 3, 1), (0, 4, 4), (1, 2, 3), (1, 3, 3),
+            (1, 5, 7), (2, 3, 5), (2, 5, 8), (3, 4, 9),
+        ]  # fmt: skip
+        small = os.path.join(workdir, "small.bin")
+        write_edge_file(small, edges_list)
+        print("External Kruskal - Example 1 (runs of 2 edges)")
+        print("=" * 50)
+        mst_edges, mst_weight = external_kruskal_mst(small, 6, run_records=2)
+        for u, v, w in mst_edges:
+            print(f"  {u} -- {v} == {w}")
+        print(f"Total MST Weight: {mst_weight}")
+
+        # Example 2: A generated edge file that is never held in memory
+        n, m = 100_000, 1_000_000
+        rng = random.Random(11)
+        generated = (
+            (rng.randrange(n), rng.randrange(n), rng.randint(1, 10**6))
+            for _ in range(m)
+        )
+        big = os.path.join(workdir, "big.bin")
+        write_edge_file(big, generated)
+        print(f"\nExample 2 - {n} vertices, {m} edges on disk")
+        print("=" * 50)
+        start = time.perf_counter()
+        forest, total = external_kruskal_mst(big, n)
+        elapsed = time.perf_counter() - start
+        runs = -(-m // max(n, 65536))
+        print(f"  {runs} sorted runs: {elapsed:.2f}s, {len(forest)} edges, {total}")
+        in_memory = kruskals_mst(n, list(read_edge_file(big)))
+        print(f"  Matches kruskals_mst(): {sum(w for *_, w in in_memory) == total}")
+    finally:
+        for name in os.listdir(workdir):
+            os.remove(os.path.join(workdir, name))
+        os.rmdir(workdir)
@@ -14,64 +14,17 @@ Algorithm:
 
 Time Complexity: O(E log E) or O(E log V)
 Space Complexity: O(V + E)
-"""
-
-from typing import List, Tuple
-
-
-class DisjointSet:
-    """Disjoint Set Union (DSU) data structure with path compression and union by rank."""
-
-    def __init__(self, n: int) -> None:
-        """
-        Initialize DSU with n elements.
 
-        Args:
-            n: Number of elements.
-        """
-        self.parent: List[int] = list(range(n))
-        self.rank: List[int] = [0] * n
-
-    def find(self, x: int) -> int:
-        """
-        Find the root/representative of the set containing x with path compression.
-
-        Args:
-            x: Element to find.
+The DSU is the shared ArrayDisjointSet from
+graph/disjoint_set/union_by_rank_path_compression.py. Edge lists that do
+not fit in memory are handled by external_kruskal_mst.py.
 
-        Returns:
-            Root of the set containing x.
-        """
-        if self.parent[x] != x:
-            self.parent[x] = self.find(self.parent[x])
-        return self.parent[x]
-
-    def union(self, x: int, y: int) -> bool:
-        """
-        Union the sets containing x and y using union by rank.
-
-        Args:
-            x: First element.
-            y: Second element.
-
-        Returns:
-            True if union was performed, False if x and y were already in the same set.
-        """
-        root_x = self.find(x)
-        root_y = self.find(y)
-
-        if root_x == root_y:
-            return False
+Run from the repository root: python -m graph.minimum_spanning_tree.kruskals_mst
+"""
 
-        if self.rank[root_x] < self.rank[root_y]:
-            self.parent[root_x] = root_y
-        elif self.rank[root_x] > self.rank[root_y]:
-            self.parent[root_y] = root_x
-        else:
-            self.parent[root_y] = root_x
-            self.rank[root_x] += 1
+from typing import List, Tuple
 
-        return True
+from graph.disjoint_set.union_by_rank_path_compression import ArrayDisjointSet
 
 
 class Graph:
@@ -108,7 +61,7 @@ class Graph:
         # Sort edges by weight
         sorted_edges = sorted(self.edges, key=lambda e: e[2])
 
-        dsu = DisjointSet(self.V)
+        dsu = ArrayDisjointSet(self.V)
         mst_edges: List[Tuple[int, int, int]] = []
 
         for u, v, w in sorted_edges:
@@ -20,66 +20,14 @@ Algorithm:
 
 Time Complexity: O(E log E) for sorting edges
 Space Complexity: O(V) for Union-Find structure
+
+Run from the repository root:
+    python -m graph.minimum_spanning_tree.minimum_cost_connect_cities
 """
 
 from typing import List
 
-
-class UnionFind:
-    """Union-Find data structure for efficient connectivity queries."""
-
-    def __init__(self, n: int) -> None:
-        """
-        Initialize Union-Find with n elements.
-
-        Args:
-            n: Number of elements.
-        """
-        self.parent: List[int] = list(range(n + 1))  # 1-based indexing
-        self.rank: List[int] = [0] * (n + 1)
-        self.components = n  # Number of connected components
-
-    def find(self, x: int) -> int:
-        """
-        Find the root of the set containing x with path compression.
-
-        Args:
-            x: Element to find.
-
-        Returns:
-            Root of the set containing x.
-        """
-        if self.parent[x] != x:
-            self.parent[x] = self.find(self.parent[x])
-        return self.parent[x]
-
-    def union(self, x: int, y: int) -> bool:
-        """
-        Union the sets containing x and y.
-
-        Args:
-            x: First element.
-            y: Second element.
-
-        Returns:
-            True if union was performed, False if already in the same set.
-        """
-        root_x = self.find(x)
-        root_y = self.find(y)
-
-        if root_x == root_y:
-            return False
-
-        if self.rank[root_x] < self.rank[root_y]:
-            self.parent[root_x] = root_y
-        elif self.rank[root_x] > self.rank[root_y]:
-            self.parent[root_y] = root_x
-        else:
-            self.parent[root_y] = root_x
-            self.rank[root_x] += 1
-
-        self.components -= 1
-        return True
+from graph.disjoint_set.union_by_rank_path_compression import ArrayDisjointSet
 
 
 def minimum_cost_connect_cities(n: int, connections: List[List[int]]) -> int:
@@ -96,16 +44,17 @@ def minimum_cost_connect_cities(n: int, connections: List[List[int]]) -> int:
     # Sort connections by cost
     connections.sort(key=lambda x: x[2])
 
-    uf = UnionFind(n)
+    # 1-based cities: element 0 stays a singleton set of its own
+    uf = ArrayDisjointSet(n + 1)
     total_cost = 0
 
     for city1, city2, cost in connections:
         if uf.union(city1, city2):
             total_cost += cost
-            if uf.components == 1:
+            if uf.num_sets == 2:
                 return total_cost
 
-    return -1 if uf.components > 1 else total_cost
+    return -1 if uf.num_sets > 2 else total_cost
 
 
 def minimum_cost_connect_cities_prim(n: int, connections: List[List[int]]) -> int:
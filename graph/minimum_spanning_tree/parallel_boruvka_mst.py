@@ -0,0 +1,309 @@
+"""
+Parallel Boruvka MST over Shared-Memory Edge Shards (Process Pool)
+
+boruvkas_mst() scans a list of Python tuples once per round in one
+process. The scan - "cheapest edge leaving every component" - is a
+reduction that splits naturally over edge ranges, so for very large edge
+lists it is spread over a process pool:
+
+1. The edge list is stored as flat arrays (src, dst, weight, edge id) and
+   cut into shards. The arrays, the shard bounds and a component label
+   per vertex are copied once into a shared memory block
+   (graph/core/shared_arrays.py); workers attach to it by name.
+2. The workers first sort every shard by weight. Then each round, every
+   shard is one task: a worker scans its shard, drops edges whose
+   endpoints are already in the same component (compacting the shard in
+   place, so later rounds scan fewer edges) and returns the first, i.e.
+   cheapest, edge it saw for every component as a few small arrays.
+3. The master reduces the per-shard candidates to one edge per component,
+   unions them with ArrayDisjointSet, writes the new component labels into
+   the shared block and starts the next round.
+
+Ties are broken by edge id, so the chosen edges never form a cycle and
+the MST is the same for any number of workers or shards. Disconnected
+graphs give a minimum spanning forest.
+
+Time Complexity: O((E log E + E log V) / workers) for the sorts and
+                 scans, plus O(V log V) for the central merge steps
+Space Complexity: O(V + E) shared, plus O(V) per worker
+
+Run from the repository root:
+    python -m graph.minimum_spanning_tree.parallel_boruvka_mst
+"""
+
+import os
+from array import array
+from functools import partial
+from multiprocessing import Pool
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from graph.core.shared_arrays import SharedArrays, attach
+from graph.disjoint_set.union_by_rank_path_compression import ArrayDisjointSet
+
+# Per-shard result: (components, u, v, weight, edge id) as parallel arrays
+ShardResult = Tuple[array, array, array, array, array]
+
+# Per-process views of the shared block
+_worker_views = None
+_worker_handle = None
+
+
+def _typecode(buffer) -> str:
+    """Typecode of an array.array or a cast memoryview."""
+    return getattr(buffer, "typecode", None) or buffer.format
+
+
+def _sort_shard(buffers, shard: int) -> None:
+    """
+    Sort one shard by (weight, edge id) in place.
+
+    Args:
+        buffers: Name -> array or memoryview (src, dst, weights, ids,
+                 shard_start, shard_len)
+        shard: Shard index
+    """
+    start = buffers["shard_start"][shard]
+    end = start + buffers["shard_len"][shard]
+    # Edge ids ascend within a shard, so a stable sort by weight suffices
+    order = sorted(range(start, end), key=buffers["weights"].__getitem__)
+    for name in ("src", "dst", "weights", "ids"):
+        column = buffers[name]
+        column[start:end] = array(_typecode(column), map(column.__getitem__, order))
+
+
+def _cheapest_in_shard(buffers, shard: int) -> ShardResult:
+    """
+    Cheapest edge per component within one sorted shard, compacting it.
+
+    Args:
+        buffers: Name -> array or memoryview (src, dst, weights, ids, comp,
+                 shard_start, shard_len)
+        shard: Shard index
+
+    Returns:
+        Parallel arrays (component, u, v, weight, edge id), one entry per
+        component that has an outgoing edge in this shard
+    """
+    src, dst = buffers["src"], buffers["dst"]
+    weights, ids = buffers["weights"], buffers["ids"]
+    comp, shard_len = buffers["comp"], buffers["shard_len"]
+    start = buffers["shard_start"][shard]
+    end = start + shard_len[shard]
+
+    # The shard is sorted, so the first edge seen for a component is its
+    # cheapest one
+    best: Dict[int, int] = {}  # component -> position of its cheapest edge
+    keep = start
+    for i in range(start, end):
+        u, v = src[i], dst[i]
+        cu, cv = comp[u], comp[v]
+        if cu == cv:
+            continue  # internal edge, never needed again
+        if keep != i:
+            src[keep], dst[keep] = u, v
+            weights[keep], ids[keep] = weights[i], ids[i]
+        if cu not in best:
+            best[cu] = keep
+        if cv not in best:
+            best[cv] = keep
+        keep += 1
+    shard_len[shard] = keep - start
+
+    positions = list(best.values())
+    return (
+        array("i", best.keys()),
+        array("i", map(src.__getitem__, positions)),
+        array("i", map(dst.__getitem__, positions)),
+        array(_typecode(weights), map(weights.__getitem__, positions)),
+        array("q", map(ids.__getitem__, positions)),
+    )
+
+
+def _init_worker(spec) -> None:
+    """Pool initializer: attach to the shared edge shards once per process."""
+    global _worker_views, _worker_handle
+    _worker_handle, _worker_views = attach(spec)
+
+
+def _worker_sort(shard: int) -> None:
+    """Pool task: sort one shard of the attached shared edge arrays."""
+    _sort_shard(_worker_views, shard)
+
+
+def _worker_shard(shard: int) -> ShardResult:
+    """Pool task: scan one shard of the attached shared edge arrays."""
+    return _cheapest_in_shard(_worker_views, shard)
+
+
+def _boruvka_rounds(
+    n: int, comp, scan: Callable[[], Iterable[ShardResult]]
+) -> Tuple[List[Tuple[int, int, int]], int]:
+    """
+    Central merge loop shared by the inline and the process-pool paths.
+
+    Args:
+        n: Number of vertices
+        comp: Writable component label buffer read by the shard scans
+        scan: Runs one round over all shards and yields their results
+
+    Returns:
+        Tuple of (mst_edges, mst_weight)
+    """
+    dsu = ArrayDisjointSet(n)
+    mst_edges: List[Tuple[int, int, int]] = []
+    mst_weight = 0
+
+    while dsu.num_sets > 1:
+        best: Dict[int, Tuple] = {}  # component -> (w, id, u, v)
+        for comps, us, vs, ws, es in scan():
+            for c, u, v, w, e in zip(comps, us, vs, ws, es):
+                b = best.get(c)
+                if b is None or w < b[0] or (w == b[0] and e < b[1]):
+                    best[c] = (w, e, u, v)
+
+        # Disconnected graph: no component has an outgoing edge left
+        if not best:
+            break
+
+        # Both endpoints may pick the same edge; union() skips the repeat
+        for w, _, u, v in best.values():
+            if dsu.union(u, v):
+                mst_edges.append((u, v, w))
+                mst_weight += w
+
+        find = dsu.find
+        comp[:] = array("i", map(find, range(n)))
+
+    return mst_edges, mst_weight
+
+
+def parallel_boruvka_mst_arrays(
+    num_vertices: int,
+    src: Sequence[int],
+    dst: Sequence[int],
+    weights: Sequence,
+    workers: Optional[int] = None,
+    shards: Optional[int] = None,
+) -> Tuple[List[Tuple[int, int, int]], int]:
+    """
+    Minimum spanning tree (forest) of an undirected edge list in arrays.
+
+    Args:
+        num_vertices: Number of vertices (labeled 0 to num_vertices-1)
+        src: Edge endpoints u, e.g. array('i')
+        dst: Edge endpoints v
+        weights: Edge weights, e.g. array('q') or array('d')
+        workers: Number of processes (default: os.cpu_count()); 1 runs in
+                 this process without a pool
+        shards: Number of edge shards (default: 4 per worker)
+
+    Returns:
+        Tuple of (mst_edges, mst_weight) like boruvkas_mst()
+    """
+    m = len(src)
+    workers = workers or os.cpu_count() or 1
+    shards = max(1, min(shards or 4 * workers, m))
+
+    bounds = [m * k // shards for k in range(shards + 1)]
+    typecode = getattr(weights, "typecode", None)
+    if typecode is None:
+        typecode = "d" if any(isinstance(w, float) for w in weights) else "q"
+    # The shard scans compact these arrays, so the caller's arrays are copied
+    buffers: Dict[str, array] = {
+        "src": array("i", src),
+        "dst": array("i", dst),
+        "weights": array(typecode, weights),
+        "ids": array("q", range(m)),
+        "comp": array("i", range(num_vertices)),
+        "shard_start": array("q", bounds[:-1]),
+        "shard_len": array("q", [b - a for a, b in zip(bounds, bounds[1:])]),
+    }
+
+    if workers == 1 or shards == 1:
+        for k in range(shards):
+            _sort_shard(buffers, k)
+        scan_shard = partial(_cheapest_in_shard, buffers)
+        return _boruvka_rounds(
+            num_vertices, buffers["comp"], lambda: map(scan_shard, range(shards))
+        )
+
+    with SharedArrays(buffers) as shared:
+        handle, views = attach(shared.spec)
+        try:
+            with Pool(min(workers, shards), _init_worker, (shared.spec,)) as pool:
+                pool.map(_worker_sort, range(shards))
+                return _boruvka_rounds(
+                    num_vertices,
+                    views["comp"],
+                    lambda: pool.imap_unordered(_worker_shard, range(shards)),
+                )
+        finally:
+            for view in views.values():
+                view.release()
+            handle.close()
+
+
+def parallel_boruvkas_mst(
+    num_vertices: int,
+    edges: List[Tuple[int, int, int]],
+    workers: Optional[int] = None,
+) -> Tuple[List[Tuple[int, int, int]], int]:
+    """
+    Find MST using the process-pool Boruvka (convenience function).
+
+    Args:
+        num_vertices: Number of vertices in the graph.
+        edges: List of tuples (u, v, weight) representing graph edges.
+        workers: Number of processes (default: os.cpu_count()).
+
+    Returns:
+        Tuple of (mst_edges, mst_weight).
+    """
+    return parallel_boruvka_mst_arrays(
+        num_vertices,
+        array("i", [u for u, _, _ in edges]),
+        array("i", [v for _, v, _ in edges]),
+        [w for _, _, w in edges],
+        workers,
+    )
+
+
+if __name__ == "__main__":
+    import random
+    import time
+
+    from graph.minimum_spanning_tree.boruvkas_mst import boruvkas_mst
+    from graph.minimum_spanning_tree.kruskals_mst import kruskals_mst
+
+    # Example 1: The 8-vertex graph from boruvkas_mst.py
+    edges_list = [
+        (0, 1, 10), (0, 2, 6), (0, 3, 5), (1, 3, 15), (2, 3, 4), (3, 4, 8),
+        (4, 5, 10), (4, 6, 6), (4, 7, 12), (5, 7, 15), (6, 7, 14),
+    ]  # fmt: skip
+    print("Parallel Boruvka MST - Example 1")
+    print("=" * 50)
+    mst_edges, mst_weight = parallel_boruvkas_mst(8, edges_list, workers=2)
+    for u, v, w in mst_edges:
+        print(f"  {u} -- {v} == {w}")
+    print(f"Total weight of MST: {mst_weight}")
+    print(f"boruvkas_mst() weight: {boruvkas_mst(8, edges_list)[1]}")
+
+    # Example 2: Random sparse graph, flat arrays in, compared with Kruskal
+    n, m = 50_000, 400_000
+    rng = random.Random(7)
+    src = array("i", [rng.randrange(n) for _ in range(m)])
+    dst = array("i", [rng.randrange(n) for _ in range(m)])
+    weights = array("q", [rng.randint(1, 1000) for _ in range(m)])
+
+    print(f"\nExample 2 - {n} vertices, {m} edges")
+    print("=" * 50)
+    for workers in sorted({1, 2, os.cpu_count() or 1}):
+        start = time.perf_counter()
+        forest, total = parallel_boruvka_mst_arrays(n, src, dst, weights, workers)
+        elapsed = time.perf_counter() - start
+        print(f"  workers={workers}: {elapsed:.2f}s, {len(forest)} edges, {total}")
+
+    start = time.perf_counter()
+    kruskal = kruskals_mst(n, list(zip(src, dst, weights)))
+    elapsed = time.perf_counter() - start
+    print(f"  kruskals_mst(): {elapsed:.2f}s, weight {sum(w for *_, w in kruskal)}")
@@ -0,0 +1,272 @@
+"""
+Memory-Lean Held-Karp TSP over Flat Popcount Layers
+
+tsp_dp() in travelling_salesman.py keeps a 2^n x n table of nested Python
+lists, about 8 * n * 2^n bytes of pointers plus the int objects, which
+runs out of memory around n = 20. The recurrence only ever reads subsets
+with one city less, so the table is processed layer by layer:
+
+    dp[S][j] = min(dp[S - {j}][i] + cost[i][j] for i in S - {j})
+
+where S is a set of cities other than the start city 0 and dp[S][j] is the
+cheapest path 0 -> ... -> j through exactly the cities of S.
+
+- Layer r holds the C(n-1, r) subsets of size r in colex order (Gosper's
+  hack enumerates them as increasing bitmasks); rank[mask] is the index of
+  a subset within its layer. A layer is one flat array with r entries per
+  subset, one for each end city j in S.
+- Only two dp layers are alive at a time. When the tour is requested, the
+  best predecessor of every state is kept in one array('b') (one byte per
+  state, n * 2^(n-2) bytes in total) and the tour is rebuilt from it.
+- Subsets of a layer are independent, so every layer is split into rank
+  ranges over a process pool. The rank array, the costs, both dp layers
+  and the parents live in one shared memory block
+  (graph/core/shared_arrays.py) that the workers write into directly.
+
+Integer cost matrices use array('q') layers, anything else array('d').
+
+Time Complexity: O(n^2 * 2^n)
+Space Complexity: O(2^n) for rank plus O(sqrt(n) * 2^n) for two dp layers;
+                  O(n * 2^n) bytes more for parents when the tour is needed
+
+Reference: https://www.geeksforgeeks.org/travelling-salesman-problem-using-dynamic-programming/
+
+Run from the repository root: python -m graph.np_hard.held_karp
+"""
+
+import os
+from array import array
+from math import comb
+from multiprocessing import Pool
+from operator import add
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from graph.core.shared_arrays import SharedArrays, attach
+
+# Smaller instances are always solved in this process
+PARALLEL_MIN_CITIES = 14
+
+# Per-process views of the shared block and the problem size
+_worker_views = None
+_worker_handle = None
+_worker_n = 0
+
+
+def _unrank(rank: int, r: int) -> int:
+    """Bitmask of the r-subset with the given colex rank."""
+    mask = 0
+    for t in range(r, 0, -1):
+        c = t - 1
+        while comb(c + 1, t) <= rank:
+            c += 1
+        rank -= comb(c, t)
+        mask |= 1 << c
+    return mask
+
+
+def _subset_ranks(k: int) -> array:
+    """rank[mask] = colex index of mask among the subsets of its size."""
+    rank = array("i", [0]) * (1 << k)
+    for r in range(1, k + 1):
+        mask = (1 << r) - 1
+        for index in range(comb(k, r)):
+            rank[mask] = index
+            low = mask & -mask
+            high = mask + low
+            mask = (((high ^ mask) >> 2) // low) | high
+    return rank
+
+
+def _parent_offsets(k: int) -> List[int]:
+    """Start of layer r in the parent array (r entries per subset)."""
+    offsets = [0] * (k + 2)
+    for r in range(1, k + 1):
+        offsets[r + 1] = offsets[r] + comb(k, r) * r
+    return offsets
+
+
+def _solve_range(buffers, n: int, r: int, start: int, end: int) -> None:
+    """
+    Fill the dp entries of the layer-r subsets with ranks start..end-1.
+
+    Args:
+        buffers: Name -> array or memoryview (rank, cost, dp0, dp1 and
+                 optionally parent)
+        n: Number of cities
+        r: Layer (subset size), at least 2
+        start: First subset rank
+        end: One past the last subset rank
+    """
+    k = n - 1
+    rank, cost = buffers["rank"], buffers["cost"]
+    prev, cur = buffers[f"dp{(r - 1) % 2}"], buffers[f"dp{r % 2}"]
+    parent = buffers.get("parent")
+    parent_base = _parent_offsets(k)[r] if parent is not None else 0
+    # into[b][a] = cost of city a + 1 -> city b + 1
+    into = [[cost[(a + 1) * n + b + 1] for a in range(k)] for b in range(k)]
+
+    mask = _unrank(start, r)
+    for s in range(start, end):
+        members = [b for b in range(k) if mask >> b & 1]
+        out = s * r
+        for p, b in enumerate(members):
+            others = members[:p] + members[p + 1 :]
+            base = rank[mask ^ (1 << b)] * (r - 1)
+            values = list(
+                map(add, prev[base : base + r - 1], map(into[b].__getitem__, others))
+            )
+            best = min(values)
+            cur[out + p] = best
+            if parent is not None:
+                parent[parent_base + out + p] = others[values.index(best)] + 1
+        low = mask & -mask
+        high = mask + low
+        mask = (((high ^ mask) >> 2) // low) | high
+
+
+def _init_worker(spec, n: int) -> None:
+    """Pool initializer: attach to the shared block once per process."""
+    global _worker_views, _worker_handle, _worker_n
+    _worker_handle, _worker_views = attach(spec)
+    _worker_n = n
+
+
+def _worker_range(r: int, start: int, end: int) -> None:
+    """Pool task: fill one rank range of layer r in the shared block."""
+    _solve_range(_worker_views, _worker_n, r, start, end)
+
+
+def _run_layers(buffers, n: int, pool=None, chunks: int = 1) -> None:
+    """Layer 1 from the start city, then layers 2..n-1 (optionally pooled)."""
+    k = n - 1
+    cost, dp1 = buffers["cost"], buffers["dp1"]
+    for b in range(k):
+        dp1[b] = cost[b + 1]  # {b}: rank b, path 0 -> b + 1
+    if "parent" in buffers:
+        buffers["parent"][:k] = array("b", [0]) * k
+
+    for r in range(2, k + 1):
+        size = comb(k, r)
+        if pool is None or size < chunks:
+            _solve_range(buffers, n, r, 0, size)
+        else:
+            bounds = [size * c // chunks for c in range(chunks + 1)]
+            pool.starmap(
+                _worker_range, [(r, a, b) for a, b in zip(bounds, bounds[1:]) if a < b]
+            )
+
+
+def _finish(buffers, n: int, with_tour: bool, cycle: bool):
+    """Best final state, and the tour rebuilt from the parents."""
+    k = n - 1
+    cost, last = buffers["cost"], buffers[f"dp{k % 2}"]
+    totals = [last[b] + (cost[(b + 1) * n] if cycle else 0) for b in range(k)]
+    best = min(totals)
+    if not with_tour:
+        return best, None
+
+    rank, parent = buffers["rank"], buffers["parent"]
+    offsets = _parent_offsets(k)
+    mask, city = (1 << k) - 1, totals.index(best) + 1
+    path = []
+    for r in range(k, 0, -1):
+        path.append(city)
+        b = city - 1
+        position = bin(mask & ((1 << b) - 1)).count("1")
+        city = parent[offsets[r] + rank[mask] * r + position]
+        mask ^= 1 << b
+    path.append(0)
+    path.reverse()
+    return best, path + [0] if cycle else path
+
+
+def held_karp(
+    cost: Sequence[Sequence[float]],
+    with_tour: bool = False,
+    workers: Optional[int] = None,
+    cycle: bool = True,
+) -> Tuple[float, Optional[List[int]]]:
+    """
+    Exact TSP by Held-Karp dynamic programming over popcount layers.
+
+    Args:
+        cost: Square matrix, cost[i][j] = cost of travelling from i to j
+        with_tour: Also keep parent pointers and return the optimal tour
+        workers: Number of processes (default: os.cpu_count()); 1, or
+                 fewer than PARALLEL_MIN_CITIES cities, runs in this process
+        cycle: Return to city 0 at the end; False gives the cheapest
+               Hamiltonian path starting at city 0
+
+    Returns:
+        Tuple of (min_cost, tour) where tour lists the cities from 0 (and
+        back to 0 if cycle), or None unless with_tour
+    """
+    n = len(cost)
+    if n <= 1:
+        if n == 0:
+            return 0, [] if with_tour else None
+        return cost[0][0] if cycle else 0, [0] if with_tour else None
+
+    k = n - 1
+    flat = [c for row in cost for c in row]
+    typecode = "q" if all(isinstance(c, int) for c in flat) else "d"
+    widest = max(comb(k, r) * r for r in range(1, k + 1))
+    buffers: Dict[str, array] = {
+        "rank": _subset_ranks(k),
+        "cost": array(typecode, flat),
+        "dp0": array(typecode, [0]) * widest,
+        "dp1": array(typecode, [0]) * widest,
+    }
+    if with_tour:
+        buffers["parent"] = array("b", [0]) * _parent_offsets(k)[k + 1]
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or n < PARALLEL_MIN_CITIES:
+        _run_layers(buffers, n)
+        return _finish(buffers, n, with_tour, cycle)
+
+    with SharedArrays(buffers) as shared:
+        del buffers  # the shared block holds the only copy from here on
+        handle, views = attach(shared.spec)
+        try:
+            with Pool(workers, _init_worker, (shared.spec, n)) as pool:
+                _run_layers(views, n, pool, 4 * workers)
+            return _finish(views, n, with_tour, cycle)
+        finally:
+            for view in views.values():
+                view.release()
+            handle.close()
+
+
+if __name__ == "__main__":
+    import random
+    import time
+
+    from graph.np_hard.travelling_salesman import tsp_bruteforce
+
+    # Example 1: The 4-city tour from travelling_salesman.py
+    cost_matrix = [[0, 10, 15, 20], [10, 0, 35, 25], [15, 35, 0, 30], [20, 25, 30, 0]]
+    print("Held-Karp - Example 1")
+    print("=" * 50)
+    min_cost, tour = held_karp(cost_matrix, with_tour=True)
+    print(f"Minimum TSP cost: {min_cost}")  # Output: 80
+    print(f"Optimal tour: {' -> '.join(map(str, tour))}")
+
+    # Example 2: Random instances against brute force
+    rng = random.Random(3)
+    for n in (5, 7, 9):
+        costs = [[rng.randint(1, 100) for _ in range(n)] for _ in range(n)]
+        print(f"  n={n}: {held_karp(costs)[0]} (brute force {tsp_bruteforce(costs)})")
+
+    # Example 3: Larger instance, cost only (two layers) vs with the tour
+    n = 16
+    costs = [[rng.randint(1, 1000) for _ in range(n)] for _ in range(n)]
+    print(f"\nExample 3 - {n} cities")
+    print("=" * 50)
+    for with_tour in (False, True):
+        for workers in sorted({1, os.cpu_count() or 1}):
+            start = time.perf_counter()
+            min_cost, _ = held_karp(costs, with_tour, workers)
+            elapsed = time.perf_counter() - start
+            label = f"with_tour={with_tour}, workers={workers}"
+            print(f"  {label}: {min_cost} ({elapsed:.2f}s)")
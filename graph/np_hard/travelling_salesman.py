@@ -6,13 +6,18 @@ from city i to city j, find the minimum cost to complete a tour from city 0
 to all other cities, visiting each city exactly once, and returning to city 0.
 
 This implementation uses Dynamic Programming with bitmask representation for
-optimal substructure, achieving O(n^2 * 2^n) time complexity.
+optimal substructure, achieving O(n^2 * 2^n) time complexity. The DP itself
+is the flat-array, layer-by-layer Held-Karp engine in held_karp.py. For
+instances too large for an exact answer see tsp_local_search.py.
 
 Reference: https://www.geeksforgeeks.org/travelling-salesman-problem-using-dynamic-programming/
+
+Run from the repository root: python -m graph.np_hard.travelling_salesman
 """
 
-from typing import List, Optional
-import sys
+from typing import List
+
+from graph.np_hard.held_karp import held_karp
 
 
 def tsp_dp(cost: List[List[int]]) -> int:
@@ -25,43 +30,12 @@ def tsp_dp(cost: List[List[int]]) -> int:
     Returns:
         Minimum cost to visit all cities exactly once and return to start.
 
+    The table is kept as two flat popcount layers, see held_karp.py.
+
     Time Complexity: O(n^2 * 2^n)
-    Space Complexity: O(n * 2^n)
+    Space Complexity: O(sqrt(n) * 2^n)
     """
-    n = len(cost)
-    if n <= 1:
-        return cost[0][0] if n == 1 else 0
-
-    INF = sys.maxsize
-    FULL = 1 << n
-    full_mask = FULL - 1
-
-    # dp[mask][i] = minimum cost to visit all cities in mask, ending at city i
-    dp = [[INF] * n for _ in range(FULL)]
-    dp[1][0] = 0  # Start at city 0, only city 0 visited
-
-    # Iterate over all subsets of cities
-    for mask in range(1, FULL):
-        for i in range(n):
-            # Skip if city i is not in mask or state not reachable
-            if not (mask & (1 << i)) or dp[mask][i] == INF:
-                continue
-
-            # Try to go to every unvisited city j
-            for j in range(n):
-                if mask & (1 << j):  # Skip if already visited
-                    continue
-
-                nxt_mask = mask | (1 << j)
-                dp[nxt_mask][j] = min(dp[nxt_mask][j], dp[mask][i] + cost[i][j])
-
-    # Find minimum cost to return to city 0 from any city after visiting all
-    ans = INF
-    for i in range(n):
-        if dp[full_mask][i] != INF:
-            ans = min(ans, dp[full_mask][i] + cost[i][0])
-
-    return ans
+    return held_karp(cost)[0]
 
 
 def tsp_bruteforce(cost: List[List[int]]) -> int:
@@ -131,54 +105,8 @@ class TSP:
         Returns:
             Tuple of (minimum_cost, optimal_path)
         """
-        n = self.n
-        if n <= 1:
-            return (self.cost[0][0] if n == 1 else 0, [0] if n == 1 else [])
-
-        INF = sys.maxsize
-        FULL = 1 << n
-        full_mask = FULL - 1
-
-        dp = [[INF] * n for _ in range(FULL)]
-        parent = [[-1] * n for _ in range(FULL)]
-        dp[1][0] = 0
-
-        for mask in range(1, FULL):
-            for i in range(n):
-                if not (mask & (1 << i)) or dp[mask][i] == INF:
-                    continue
-
-                for j in range(n):
-                    if mask & (1 << j):
-                        continue
-
-                    nxt_mask = mask | (1 << j)
-                    if dp[nxt_mask][j] > dp[mask][i] + self.cost[i][j]:
-                        dp[nxt_mask][j] = dp[mask][i] + self.cost[i][j]
-                        parent[nxt_mask][j] = i
-
-        # Find optimal ending city
-        min_cost = INF
-        end_city = -1
-        for i in range(n):
-            if dp[full_mask][i] != INF:
-                total = dp[full_mask][i] + self.cost[i][0]
-                if total < min_cost:
-                    min_cost = total
-                    end_city = i
-
-        # Reconstruct path
-        path = []
-        mask = full_mask
-        curr = end_city
-        while curr != -1:
-            path.append(curr)
-            prev = parent[mask][curr]
-            mask = mask ^ (1 << curr)
-            curr = prev
-
-        path.reverse()
-        return (min_cost, [0] + path + [0])
+        min_cost, path = held_karp(self.cost, with_tour=True)
+        return (min_cost, path)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,535 @@
+"""
+Local-Search TSP Heuristics: Construction, 2-opt, Or-opt and Lin-Kernighan
+
+held_karp.py, tsp_branch_bound.py and tsp_reduced_matrix.py are exact and
+stop being usable somewhere between 15 and 25 cities. For routing
+thousands of cities this module builds a good tour fast and then improves
+it for as long as it is allowed to:
+
+1. Construction: nearest neighbor, or greedy edge matching (shortest
+   candidate edges first, ArrayDisjointSet rejects cycles, the fragments
+   are then chained nearest-endpoint-first).
+2. Local search with neighbor lists and don't-look bits: only the
+   num_neighbors nearest cities of a city are tried as new neighbors, and
+   only cities next to a recently changed edge are queued for another
+   look.
+   - 2-opt: replace two tour edges by two shorter ones (one reversal).
+   - Or-opt: move a segment of 1 to 3 cities, possibly reversed, between
+     two other neighboring cities (a restricted 3-opt move).
+   - Lin-Kernighan style (lk_depth > 1): chain up to lk_depth 2-opt
+     reversals as long as the partial gain stays positive and keep the
+     best prefix of the chain.
+3. With a time_limit, the local optimum is then perturbed by small
+   double-bridge kicks (iterated local search) until time runs out.
+   on_improve(length, tour) is called with every new best tour.
+
+The tour is an array of cities plus the position of every city, so a
+reversal costs O(min(segment, n - segment)).
+
+Distances come from a coordinate list (Euclidean, neighbor lists by grid
+bucketing, no n x n matrix) or from a symmetric cost matrix.
+
+Time Complexity: O(n * k) per local-search sweep for k neighbors, plus
+                 the reversals; O(n log n) construction for points
+Space Complexity: O(n * k)
+
+Reference: https://www.geeksforgeeks.org/travelling-salesman-problem-using-dynamic-programming/
+
+Run from the repository root: python -m graph.np_hard.tsp_local_search
+"""
+
+import heapq
+import math
+import random
+import time
+from array import array
+from collections import deque
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from graph.disjoint_set.union_by_rank_path_compression import ArrayDisjointSet
+
+EPS = 1e-9
+
+# Cities a double-bridge kick may span in the tour
+KICK_WINDOW = 50
+
+
+def _ring_cells(cx: int, cy: int, ring: int):
+    """Grid cells at Chebyshev distance exactly ring from (cx, cy)."""
+    if ring == 0:
+        yield cx, cy
+        return
+    for gx in range(cx - ring, cx + ring + 1):
+        yield gx, cy - ring
+        yield gx, cy + ring
+    for gy in range(cy - ring + 1, cy + ring):
+        yield cx - ring, gy
+        yield cx + ring, gy
+
+
+def _neighbors_from_points(xs, ys, k: int) -> List[List[int]]:
+    """k nearest cities of every city, found by bucketing into a grid."""
+    n = len(xs)
+    min_x, min_y = min(xs), min(ys)
+    # Cells from the longer side: collinear cities must not shrink them to 0
+    extent = max(max(xs) - min_x, max(ys) - min_y)
+    size = extent / math.sqrt(n / 2) or 1.0  # about 2 cities per cell
+    cells: Dict[Tuple[int, int], List[int]] = {}
+    for i in range(n):
+        key = (int((xs[i] - min_x) / size), int((ys[i] - min_y) / size))
+        cells.setdefault(key, []).append(i)
+    k = min(k, n - 1)
+    last_ring = int(extent / size) + 1  # covers the whole grid from any cell
+
+    neighbors = []
+    for i in range(n):
+        x, y = xs[i], ys[i]
+        cx, cy = int((x - min_x) / size), int((y - min_y) / size)
+        found: List[Tuple[float, int]] = []
+        ring = 0
+        while True:
+            for cell in _ring_cells(cx, cy, ring):
+                for j in cells.get(cell, ()):
+                    if j != i:
+                        found.append((math.hypot(xs[j] - x, ys[j] - y), j))
+            # Unseen cities are at least ring * size away
+            if ring >= last_ring or (
+                len(found) >= k and heapq.nsmallest(k, found)[-1][0] <= ring * size
+            ):
+                break
+            ring += 1
+        neighbors.append([j for _, j in heapq.nsmallest(k, found)])
+    return neighbors
+
+
+def _neighbors_from_matrix(cost, k: int) -> List[List[int]]:
+    """k cheapest cities of every row of a cost matrix."""
+    n = len(cost)
+    k = min(k, n - 1)
+    return [
+        heapq.nsmallest(k, (j for j in range(n) if j != i), key=cost[i].__getitem__)
+        for i in range(n)
+    ]
+
+
+def nearest_neighbor_tour(n: int, dist, neighbors: List[List[int]]) -> List[int]:
+    """
+    Nearest-neighbor tour from city 0.
+
+    The neighbor list is tried first; only when all of a city's listed
+    neighbors are visited are the remaining cities scanned.
+    """
+    unvisited = list(range(1, n))
+    index = array("i", range(-1, n - 1))  # position of a city in unvisited
+    order = [0]
+    current = 0
+    while unvisited:
+        nxt = -1
+        for j in neighbors[current]:
+            if index[j] >= 0:
+                nxt = j
+                break
+        if nxt < 0:
+            nxt = min(unvisited, key=lambda j: dist(current, j))
+        # Swap-remove nxt from the unvisited list
+        last = unvisited.pop()
+        if last != nxt:
+            unvisited[index[nxt]] = last
+            index[last] = index[nxt]
+        index[nxt] = -1
+        order.append(nxt)
+        current = nxt
+    return order
+
+
+def greedy_tour(n: int, dist, neighbors: List[List[int]]) -> List[int]:
+    """
+    Greedy edge matching tour.
+
+    Candidate edges (from the neighbor lists) are taken shortest first
+    when both endpoints have degree < 2 and no cycle is closed; the
+    resulting paths are then joined nearest endpoint first.
+    """
+    candidates = sorted(
+        (dist(i, j), i, j)
+        for i in range(n)
+        for j in neighbors[i]
+        if i < j or i not in neighbors[j]  # each edge once
+    )
+    dsu = ArrayDisjointSet(n)
+    adjacency: List[List[int]] = [[] for _ in range(n)]
+    for _, i, j in candidates:
+        if len(adjacency[i]) < 2 and len(adjacency[j]) < 2 and dsu.union(i, j):
+            adjacency[i].append(j)
+            adjacency[j].append(i)
+
+    ends = [v for v in range(n) if len(adjacency[v]) < 2]
+    visited = bytearray(n)
+    order: List[int] = []
+    current = ends[0] if ends else 0
+    while True:
+        # Walk the path that starts at current
+        prev = -1
+        while True:
+            visited[current] = 1
+            order.append(current)
+            nxt = -1
+            for w in adjacency[current]:
+                if w != prev and not visited[w]:
+                    nxt = w
+            if nxt < 0:
+                break
+            prev, current = current, nxt
+        ends = [v for v in ends if not visited[v]]
+        if not ends:
+            return order
+        tail = current
+        current = min(ends, key=lambda v: dist(tail, v))
+
+
+class _Tour:
+    """Cyclic tour: order[i] is the i-th city, pos[c] the index of city c."""
+
+    def __init__(self, order: List[int]):
+        self.n = len(order)
+        self.order = order
+        self.pos = array("i", [0]) * self.n
+        for i, c in enumerate(order):
+            self.pos[c] = i
+
+    def succ(self, c: int) -> int:
+        i = self.pos[c] + 1
+        return self.order[i if i < self.n else 0]
+
+    def pred(self, c: int) -> int:
+        return self.order[self.pos[c] - 1]
+
+    def on_path(self, a: int, x: int, b: int) -> bool:
+        """True if x lies on the forward path from a to b."""
+        pos, n = self.pos, self.n
+        return (pos[x] - pos[a]) % n <= (pos[b] - pos[a]) % n
+
+    def reverse(self, a: int, b: int, avoid: int) -> None:
+        """Reverse the path between a and b that does not contain avoid."""
+        if self.on_path(a, avoid, b):
+            a, b = b, a
+        order, pos, n = self.order, self.pos, self.n
+        i, j = pos[a], pos[b]
+        length = (j - i) % n + 1
+        if 2 * length > n:
+            # Reversing the rest of the tour gives the same cycle
+            i, j, length = (j + 1) % n, (i - 1) % n, n - length
+        if i <= j:
+            order[i : j + 1] = order[i : j + 1][::-1]
+            for k in range(i, j + 1):
+                pos[order[k]] = k
+        else:
+            for _ in range(length // 2):
+                ci, cj = order[i], order[j]
+                order[i], order[j] = cj, ci
+                pos[cj], pos[ci] = i, j
+                i = i + 1 if i + 1 < n else 0
+                j = j - 1 if j > 0 else n - 1
+
+    def double_bridge(self, rng: random.Random) -> List[int]:
+        """
+        Small double-bridge kick A B C D -> A C B D inside a window.
+
+        Returns:
+            [a1, a2, a3, b1, b2, b3]: edges (a1, b1), (a2, b2), (a3, b3)
+            were replaced by (a1, b2), (a3, b1), (a2, b3)
+        """
+        n, order = self.n, self.order
+        window = min(KICK_WINDOW, n - 1)
+        start = rng.randrange(n - window)
+        cuts = sorted(rng.sample(range(start + 1, start + window + 1), 3))
+        p1, p2, p3 = cuts
+        touched = [order[p - 1] for p in cuts] + [order[p] for p in cuts]
+        order[p1:p3] = order[p2:p3] + order[p1:p2]
+        for k in range(p1, p3):
+            self.pos[order[k]] = k
+        return touched
+
+
+class _LocalSearch:
+    def __init__(self, tour: _Tour, dist, neighbors, or_opt: bool, lk_depth: int):
+        self.tour = tour
+        self.dist = dist
+        self.neighbors = neighbors
+        self.or_opt = or_opt
+        self.lk_depth = lk_depth
+        self.touched: List[int] = []
+
+    def _lk_move(self, t1: int) -> float:
+        """2-opt (lk_depth 1) or a Lin-Kernighan chain of reversals from t1."""
+        tour, dist, neighbors = self.tour, self.dist, self.neighbors
+        for t2 in (tour.succ(t1), tour.pred(t1)):
+            g_open = dist(t1, t2)
+            best_gain, best_steps = 0.0, 0  # nothing to keep unless closed
+            steps: List[Tuple[int, int]] = []
+            for depth in range(self.lk_depth):
+                forward = tour.succ(t1) == t2
+                away = tour.succ(t2) if forward else tour.pred(t2)
+                # Best move that closes the tour now, and best one to extend
+                close, close_gain = None, EPS
+                extend, extend_gain = None, -math.inf
+                for t3 in neighbors[t2]:
+                    g1 = g_open - dist(t2, t3)
+                    if g1 <= EPS:
+                        break  # neighbors are sorted by distance
+                    if t3 == t1 or t3 == away:
+                        continue
+                    t4 = tour.pred(t3) if forward else tour.succ(t3)
+                    value = g1 + dist(t3, t4)
+                    if value - dist(t4, t1) > close_gain:
+                        close, close_gain = (t3, t4), value - dist(t4, t1)
+                    if value > extend_gain:
+                        extend, extend_gain = (t3, t4), value
+                choice = close or (extend if depth < self.lk_depth - 1 else None)
+                if choice is None:
+                    break
+                t4 = choice[1]
+                tour.reverse(t2, t4, t1)
+                steps.append((t2, t4))
+                if close is not None:
+                    best_gain, best_steps = close_gain, len(steps)
+                    break
+                g_open = extend_gain
+                t2 = t4
+
+            for a, b in reversed(steps[best_steps:]):
+                tour.reverse(a, b, t1)  # undo the unprofitable tail of the chain
+            if best_gain > EPS:
+                self.touched.append(t1)
+                for a, b in steps[:best_steps]:
+                    for c in (a, b):
+                        self.touched += [c, tour.succ(c), tour.pred(c)]
+                return best_gain
+        return 0.0
+
+    def _target_edges(self, segment: List[int], nx: int, forward: bool, limit):
+        """
+        Tour edges (x, y) near the ends of segment, outside of it.
+
+        x comes before y on the path nx -> ... -> p that is left when the
+        segment is cut out. Only neighbors closer than limit to a segment
+        end are tried.
+        """
+        tour, dist, pos, n = self.tour, self.dist, self.tour.pos, self.tour.n
+        ends = (segment[0], segment[-1]) if len(segment) > 1 else segment[:1]
+        for end in ends:
+            for c in self.neighbors[end]:
+                if dist(end, c) >= limit:
+                    break  # the new edge at end alone costs more
+                if c in segment:
+                    continue
+                for e in (tour.succ(c), tour.pred(c)):
+                    if e in segment:
+                        continue
+                    if forward:
+                        c_first = (pos[c] - pos[nx]) % n < (pos[e] - pos[nx]) % n
+                    else:
+                        c_first = (pos[nx] - pos[c]) % n < (pos[nx] - pos[e]) % n
+                    yield (c, e) if c_first else (e, c)
+
+    def _or_move(self, s1: int) -> float:
+        """Best move of a 1-3 city segment starting at s1 (either direction)."""
+        tour, dist = self.tour, self.dist
+        best_gain, best_move = EPS, None
+        for forward in (True, False):
+            step = tour.succ if forward else tour.pred
+            p = tour.pred(s1) if forward else tour.succ(s1)
+            segment = [s1]
+            while len(segment) <= 3 and len(segment) + 3 <= tour.n:
+                s2 = segment[-1]
+                nx = step(s2)
+                removed = dist(p, s1) + dist(s2, nx) - dist(p, nx)
+                if removed > best_gain:
+                    for x, y in self._target_edges(segment, nx, forward, removed):
+                        base = removed + dist(x, y)
+                        # Insert reversed (x, s2 .. s1, y) or as is (x, s1 .. s2, y)
+                        gain = base - dist(x, s2) - dist(s1, y)
+                        if gain > best_gain:
+                            best_gain, best_move = gain, (p, s1, s2, nx, x, y, False)
+                        gain = base - dist(x, s1) - dist(s2, y)
+                        if gain > best_gain:
+                            best_gain, best_move = gain, (p, s1, s2, nx, x, y, True)
+                segment.append(nx)
+        if best_move is None:
+            return 0.0
+
+        p, s1, s2, nx, x, y, keep_direction = best_move
+        # p S nx .. x y  ->  p x .. nx S' y  ->  p nx .. x S' y
+        tour.reverse(s1, x, p)
+        if x != nx:
+            tour.reverse(x, nx, p)
+        if keep_direction and s1 != s2:
+            tour.reverse(s1, s2, p)
+        self.touched += [p, s1, s2, nx, x, y]
+        return best_gain
+
+    def run(self, queue: deque, length: float, deadline: Optional[float]) -> float:
+        """Improve until no queued city yields a move; returns the new length."""
+        queued = bytearray(self.tour.n)
+        for c in queue:
+            queued[c] = 1
+        checks = 0
+        while queue:
+            checks += 1
+            if deadline is not None and checks % 64 == 0:
+                if time.perf_counter() > deadline:
+                    break
+            c = queue.popleft()
+            queued[c] = 0
+            gain = self._lk_move(c) if self.lk_depth else 0.0
+            if gain <= 0 and self.or_opt:
+                gain = self._or_move(c)
+            if gain > 0:
+                length -= gain
+                for t in self.touched:
+                    if not queued[t]:
+                        queued[t] = 1
+                        queue.append(t)
+                self.touched = []
+        return length
+
+
+def tsp_local_search(
+    points: Optional[Sequence[Tuple[float, float]]] = None,
+    cost: Optional[Sequence[Sequence[float]]] = None,
+    construction: str = "greedy",
+    or_opt: bool = True,
+    lk_depth: int = 1,
+    time_limit: Optional[float] = None,
+    on_improve: Optional[Callable[[float, List[int]], None]] = None,
+    num_neighbors: int = 8,
+    seed: Optional[int] = None,
+) -> Tuple[float, List[int]]:
+    """
+    Heuristic TSP tour: construction, then local search until a local
+    optimum (or until time_limit), then iterated local search until
+    time_limit.
+
+    Args:
+        points: (x, y) coordinates; distances are Euclidean
+        cost: Symmetric cost matrix, used when points is not given
+        construction: "greedy" (greedy edge matching) or "nearest"
+        or_opt: Also try Or-opt segment moves
+        lk_depth: 1 for plain 2-opt moves, more for Lin-Kernighan chains
+                  of up to lk_depth reversals, 0 for no 2-opt at all
+        time_limit: Seconds to spend in total; None stops at the first
+                    local optimum
+        on_improve: Called as on_improve(length, tour) for the
+                    constructed tour and every better tour found later
+        num_neighbors: Candidate neighbors per city
+        seed: Seed of the random kicks
+
+    Returns:
+        Tuple of (length, tour) where tour starts and ends at city 0
+    """
+    deadline = None if time_limit is None else time.perf_counter() + time_limit
+    if points is not None:
+        xs = [float(x) for x, _ in points]
+        ys = [float(y) for _, y in points]
+        n = len(xs)
+
+        def dist(i: int, j: int) -> float:
+            return math.hypot(xs[i] - xs[j], ys[i] - ys[j])
+
+        neighbors = _neighbors_from_points(xs, ys, num_neighbors) if n > 1 else []
+    elif cost is not None:
+        n = len(cost)
+
+        def dist(i: int, j: int) -> float:
+            return cost[i][j]
+
+        neighbors = _neighbors_from_matrix(cost, num_neighbors)
+    else:
+        raise ValueError("pass either points or cost")
+    if n <= 3:
+        order = list(range(n))
+        length = sum(dist(a, b) for a, b in zip(order, order[1:] + order[:1]))
+        return length, order + order[:1]
+    if construction not in ("greedy", "nearest"):
+        raise ValueError(
+            f"construction must be 'greedy' or 'nearest', got {construction!r}"
+        )
+
+    def closed_tour(tour: _Tour) -> List[int]:
+        i = tour.pos[0]
+        return tour.order[i:] + tour.order[: i + 1]
+
+    def tour_length(tour: _Tour) -> float:
+        order = tour.order
+        return sum(dist(order[i - 1], order[i]) for i in range(n))
+
+    build = greedy_tour if construction == "greedy" else nearest_neighbor_tour
+    tour = _Tour(build(n, dist, neighbors))
+    length = tour_length(tour)
+    if on_improve is not None:
+        on_improve(length, closed_tour(tour))
+
+    search = _LocalSearch(tour, dist, neighbors, or_opt, lk_depth)
+    length = search.run(deque(tour.order), length, deadline)
+    length = tour_length(tour)  # drop accumulated rounding
+    best_length, best_order = length, list(tour.order)
+    if on_improve is not None:
+        on_improve(best_length, closed_tour(tour))
+
+    # Iterated local search: kick, repair locally, keep if better
+    best_pos = array("i", tour.pos)
+    rng = random.Random(seed)
+    while deadline is not None and time.perf_counter() < deadline and n >= 8:
+        a1, a2, a3, b1, b2, b3 = touched = tour.double_bridge(rng)
+        length = best_length + (
+            dist(a1, b2) + dist(a3, b1) + dist(a2, b3)
+            - dist(a1, b1) - dist(a2, b2) - dist(a3, b3)
+        )  # fmt: skip
+        length = search.run(deque(touched), length, deadline)
+        if length < best_length - EPS:
+            best_length, best_order = length, list(tour.order)
+            best_pos = array("i", tour.pos)
+            if on_improve is not None:
+                on_improve(best_length, closed_tour(tour))
+        else:
+            tour.order[:] = best_order
+            tour.pos[:] = best_pos
+
+    tour.order[:] = best_order
+    tour.pos[:] = best_pos
+    return tour_length(tour), closed_tour(tour)
+
+
+if __name__ == "__main__":
+    from graph.np_hard.held_karp import held_karp
+
+    # Example 1: The 4-city tour from travelling_salesman.py
+    cost_matrix = [[0, 10, 15, 20], [10, 0, 35, 25], [15, 35, 0, 30], [20, 25, 30, 0]]
+    length, tour = tsp_local_search(cost=cost_matrix)
+    print("Local-search TSP - Example 1")
+    print("=" * 50)
+    print(f"Tour length: {length}, tour: {tour}")  # Output: 80
+
+    # Example 2: 12 random cities against the exact Held-Karp optimum
+    rng = random.Random(4)
+    points = [(rng.random(), rng.random()) for _ in range(12)]
+    matrix = [[math.dist(p, q) for q in points] for p in points]
+    optimum, _ = held_karp(matrix)
+    length, _ = tsp_local_search(points, lk_depth=3)
+    print(f"\nExample 2 - 12 cities: {length:.4f} (optimum {optimum:.4f})")
+
+    # Example 3: 10000 random cities with a time budget
+    n = 10_000
+    points = [(rng.random(), rng.random()) for _ in range(n)]
+    print(f"\nExample 3 - {n} random cities, 10 s budget")
+    print("=" * 50)
+    start = time.perf_counter()
+    shown = [math.inf]
+
+    def report(length: float, tour: List[int]) -> None:
+        if length < 0.995 * shown[0]:  # only print steps of 0.5 % or more
+            shown[0] = length
+            print(f"  {time.perf_counter() - start:6.2f}s: {length:.2f}")
+
+    length, _ = tsp_local_search(points, time_limit=10, on_improve=report, seed=1)
+    print(f"  final: {length:.2f}")
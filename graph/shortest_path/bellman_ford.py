@@ -14,7 +14,14 @@ Time Complexity: O(V * E)
 Space Complexity: O(V)
 """
 
-from typing import List, Tuple, Optional
+from typing import Iterable, List, Tuple, Optional
+
+
+def _edge_list(edges) -> Iterable[Tuple[int, int, int]]:
+    """Return a re-iterable (u, v, weight) sequence for a list or CSRGraph."""
+    if hasattr(edges, "edges"):
+        return edges.edges()
+    return edges
 
 
 def bellman_ford(
@@ -25,7 +32,8 @@ def bellman_ford(
 
     Args:
         V: Number of vertices (labeled 0 to V-1)
-        edges: List of edges as (u, v, weight) tuples representing directed edge u->v
+        edges: List of edges as (u, v, weight) tuples representing directed edge u->v,
+               or a CSRGraph (graph/core/csr_graph.py) whose arcs are used directly
         src: Source vertex index
 
     Returns:
@@ -34,6 +42,7 @@ def bellman_ford(
         Unreachable vertices have distance = infinity.
     """
     INF = 10**8
+    edges = _edge_list(edges)
     dist = [INF] * V
     dist[src] = 0
 
@@ -64,7 +73,7 @@ def bellman_ford_with_path(
 
     Args:
         V: Number of vertices (labeled 0 to V-1)
-        edges: List of edges as (u, v, weight) tuples
+        edges: List of edges as (u, v, weight) tuples, or a CSRGraph
         src: Source vertex index
         target: Target vertex index
 
@@ -72,6 +81,7 @@ def bellman_ford_with_path(
         Tuple of (distance, path) or None if negative cycle or unreachable.
     """
     INF = 10**8
+    edges = _edge_list(edges)
     dist = [INF] * V
     prev = [-1] * V
     dist[src] = 0
@@ -13,10 +13,31 @@ Algorithm:
 
 Time Complexity: O((V + E) * log V) with priority queue
 Space Complexity: O(V + E)
+
+Two priority-queue strategies are provided:
+- Lazy deletion (dijkstra, dijkstra_with_path): push a new (dist, node) tuple
+  on every improvement and skip stale entries on pop. The heap can hold O(E)
+  entries.
+- Indexed decrease-key (dijkstra_indexed, dijkstra_indexed_with_path): keep
+  each vertex in an indexed d-ary heap at most once and lower its key in
+  place. The heap never holds more than V entries and nothing is stale.
+
+Run from the repository root: python -m graph.shortest_path.dijkstra
 """
 
 import heapq
-from typing import List, Tuple
+from typing import Callable, Iterable, List, Tuple
+
+from Heap.other_types.k_ary_heap import IndexedKAryHeap
+
+
+def _weighted_neighbors(adj) -> Callable[[int], Iterable[Tuple[int, int]]]:
+    """Return a function yielding (v, weight) pairs of a vertex.
+
+    CSR graphs keep weights in a separate array and expose the pairs through
+    ``weighted_neighbors``; plain adjacency lists already store them per vertex.
+    """
+    return getattr(adj, "weighted_neighbors", adj.__getitem__)
 
 
 def dijkstra(adj: List[List[Tuple[int, int]]], src: int) -> List[int]:
@@ -24,7 +45,8 @@ def dijkstra(adj: List[List[Tuple[int, int]]], src: int) -> List[int]:
     Find shortest distances from source to all vertices using Dijkstra's algorithm.
 
     Args:
-        adj: Adjacency list where adj[u] contains list of (v, weight) tuples
+        adj: Adjacency list where adj[u] contains list of (v, weight) tuples,
+             or a CSRGraph (graph/core/csr_graph.py)
         src: Source vertex index
 
     Returns:
@@ -34,6 +56,7 @@ def dijkstra(adj: List[List[Tuple[int, int]]], src: int) -> List[int]:
     V = len(adj)
     dist = [float("inf")] * V
     dist[src] = 0
+    neighbors = _weighted_neighbors(adj)
 
     # Min-heap storing (distance, vertex)
     pq: List[Tuple[int, int]] = [(0, src)]
@@ -46,7 +69,7 @@ def dijkstra(adj: List[List[Tuple[int, int]]], src: int) -> List[int]:
             continue
 
         # Explore all neighbors
-        for v, weight in adj[u]:
+        for v, weight in neighbors(u):
             if dist[u] + weight < dist[v]:
                 dist[v] = dist[u] + weight
                 heapq.heappush(pq, (dist[v], v))
@@ -61,7 +84,8 @@ def dijkstra_with_path(
     Find shortest path and distance from source to a specific target.
 
     Args:
-        adj: Adjacency list where adj[u] contains list of (v, weight) tuples
+        adj: Adjacency list where adj[u] contains list of (v, weight) tuples,
+             or a CSRGraph
         src: Source vertex index
         target: Target vertex index
 
@@ -72,6 +96,7 @@ def dijkstra_with_path(
     dist = [float("inf")] * V
     dist[src] = 0
     prev = [-1] * V
+    neighbors = _weighted_neighbors(adj)
 
     pq: List[Tuple[int, int]] = [(0, src)]
 
@@ -84,7 +109,7 @@ def dijkstra_with_path(
         if u == target:
             break
 
-        for v, weight in adj[u]:
+        for v, weight in neighbors(u):
             if dist[u] + weight < dist[v]:
                 dist[v] = dist[u] + weight
                 prev[v] = u
@@ -104,6 +129,96 @@ def dijkstra_with_path(
     return dist[target], path
 
 
+def dijkstra_indexed(
+    adj: List[List[Tuple[int, int]]], src: int, arity: int = 4
+) -> List[int]:
+    """
+    Dijkstra's algorithm using an indexed d-ary heap with true decrease-key.
+
+    Produces the same distances as dijkstra() but never pushes duplicates,
+    so every pop settles a vertex.
+
+    Args:
+        adj: Adjacency list where adj[u] contains list of (v, weight) tuples,
+             or a CSRGraph
+        src: Source vertex index
+        arity: Number of children per heap node (2 = binary heap)
+
+    Returns:
+        List of shortest distances from src to all vertices.
+        Unreachable vertices have distance = infinity.
+    """
+    V = len(adj)
+    dist = [float("inf")] * V
+    dist[src] = 0
+    neighbors = _weighted_neighbors(adj)
+
+    pq = IndexedKAryHeap(V, arity)
+    pq.push(src, 0)
+
+    while pq:
+        u, d = pq.pop()
+
+        for v, weight in neighbors(u):
+            nd = d + weight
+            if nd < dist[v]:
+                dist[v] = nd
+                pq.push_or_decrease(v, nd)
+
+    return dist
+
+
+def dijkstra_indexed_with_path(
+    adj: List[List[Tuple[int, int]]], src: int, target: int, arity: int = 4
+) -> Tuple[int, List[int]]:
+    """
+    Shortest path from source to target using the indexed decrease-key heap.
+
+    Args:
+        adj: Adjacency list where adj[u] contains list of (v, weight) tuples,
+             or a CSRGraph
+        src: Source vertex index
+        target: Target vertex index
+        arity: Number of children per heap node (2 = binary heap)
+
+    Returns:
+        Tuple of (shortest_distance, path_as_list_of_vertices)
+    """
+    V = len(adj)
+    dist = [float("inf")] * V
+    dist[src] = 0
+    prev = [-1] * V
+    neighbors = _weighted_neighbors(adj)
+
+    pq = IndexedKAryHeap(V, arity)
+    pq.push(src, 0)
+
+    while pq:
+        u, d = pq.pop()
+
+        if u == target:
+            break
+
+        for v, weight in neighbors(u):
+            nd = d + weight
+            if nd < dist[v]:
+                dist[v] = nd
+                prev[v] = u
+                pq.push_or_decrease(v, nd)
+
+    if dist[target] == float("inf"):
+        return float("inf"), []
+
+    path = []
+    node = target
+    while node != -1:
+        path.append(node)
+        node = prev[node]
+    path.reverse()
+
+    return dist[target], path
+
+
 if __name__ == "__main__":
     # Example 1: Basic graph
     #     4       6
@@ -155,3 +270,11 @@ if __name__ == "__main__":
     distances2 = dijkstra(adj2, 0)
     for i, dist in enumerate(distances2):
         print(f"  Vertex 0 -> {i}: {dist}")
+
+    print()
+
+    # Example 4: Indexed decrease-key heap gives identical results
+    print("Example 4 - Indexed d-ary heap (decrease-key):")
+    print(f"  Distances: {dijkstra_indexed(adj, 0)}")
+    distance, path = dijkstra_indexed_with_path(adj, 0, 4, arity=2)
+    print(f"  0 -> 4: distance {distance}, path {' -> '.join(map(str, path))}")
@@ -16,12 +16,223 @@ Algorithm:
 
 Time Complexity: O(V^3)
 Space Complexity: O(V^2)
+
+Fast paths (method="blocked" / method="numpy"):
+- The matrix is stored row-major in one flat array('q') or array('d') buffer
+  instead of a list of lists.
+- "blocked" runs the tiled three-phase algorithm: for each diagonal block
+  K, (1) close block (K, K), (2) update the blocks in row K and column K
+  from it, (3) update every other block (I, J) from (I, K) and (K, J).
+  Each row segment is relaxed with C-level map/compress over the buffer,
+  and rows i with d[i][k] unreachable are skipped entirely.
+- "numpy" views the same buffer as an N x N array (no copy) and relaxes the
+  whole matrix for each k in one vectorized min-plus step. NumPy is
+  optional; "auto" picks it when installed and falls back to "blocked".
+Both fast paths can also maintain the next-vertex matrix for path
+reconstruction.
+
+In int ('q') buffers "unreachable" is FLAT_INF = 2^60, so INF + weight can
+never overflow 64 bits; anything above FLAT_INF / 2 is reported as
+unreachable. Float ('d') buffers use float('inf').
 """
 
-from typing import List, Optional, Tuple
+from array import array
+from itertools import compress, repeat
+from operator import add, and_, lt
+from typing import List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; the pure-Python backends still work
+    np = None
+
+FLAT_INF = 2**60
+
+
+def _unreachable_limit(typecode: str) -> float:
+    """Values at or above this limit mean "no path" in a flat buffer."""
+    return FLAT_INF // 2 if typecode == "q" else float("inf")
+
+
+def to_flat(
+    matrix: Sequence[Sequence[float]],
+    no_edge: Sequence[float] = (int(1e8), float("inf")),
+    typecode: Optional[str] = None,
+) -> array:
+    """
+    Copy an N x N matrix into a flat row-major array buffer.
+
+    Args:
+        matrix: N x N distance matrix
+        no_edge: Entry values that mean "no edge"
+        typecode: 'q' or 'd'; 'q' if every finite entry is an int
+
+    Returns:
+        Flat array of N*N entries using FLAT_INF / inf for missing edges
+    """
+    if typecode is None:
+        finite = (x for row in matrix for x in row if x not in no_edge)
+        typecode = "q" if all(isinstance(x, int) for x in finite) else "d"
+    missing = FLAT_INF if typecode == "q" else float("inf")
+    return array(
+        typecode, (missing if x in no_edge else x for row in matrix for x in row)
+    )
+
+
+def from_flat(flat: array, n: int, no_edge: float = int(1e8)) -> List[List[float]]:
+    """
+    Expand a flat row-major buffer back into an N x N list matrix.
 
+    Args:
+        flat: Buffer produced by to_flat / the flat solvers
+        n: Matrix dimension
+        no_edge: Value to report for unreachable pairs
 
-def floyd_warshall(dist: List[List[int]]) -> List[List[int]]:
+    Returns:
+        N x N list of lists
+    """
+    limit = _unreachable_limit(flat.typecode)
+    return [
+        [no_edge if x >= limit else x for x in flat[i * n : (i + 1) * n]]
+        for i in range(n)
+    ]
+
+
+def _relax_tile(
+    d: array,
+    nxt: Optional[array],
+    n: int,
+    ks: range,
+    i_range: range,
+    j0: int,
+    j1: int,
+) -> None:
+    """
+    Relax one tile: d[i][j] = min(d[i][j], d[i][k] + d[k][j])
+    for k in ks, i in i_range and j in [j0, j1).
+    """
+    limit = _unreachable_limit(d.typecode)
+    cols = range(j1 - j0)
+    for k in ks:
+        krow = k * n
+        seg_k = d[krow + j0 : krow + j1]
+        # Columns j with d[k][j] reachable: INF + a negative d[i][k] would
+        # otherwise look like an improvement
+        reach_k = list(map(lt, seg_k, repeat(limit)))
+        for i in i_range:
+            irow = i * n
+            dik = d[irow + k]
+            if dik >= limit:
+                continue
+            lo = irow + j0
+            cand = list(map(add, seg_k, repeat(dik)))
+            improved = compress(
+                cols, map(and_, map(lt, cand, d[lo : irow + j1]), reach_k)
+            )
+            if nxt is None:
+                for j in improved:
+                    d[lo + j] = cand[j]
+            else:
+                nik = nxt[irow + k]
+                for j in improved:
+                    d[lo + j] = cand[j]
+                    nxt[lo + j] = nik
+
+
+def floyd_warshall_blocked(
+    d: array, n: int, block_size: int = 256, next_vertex: Optional[array] = None
+) -> array:
+    """
+    Tiled three-phase Floyd-Warshall, in place on a flat row-major buffer.
+
+    Args:
+        d: Flat N*N array('q') or array('d') (see to_flat)
+        n: Number of vertices
+        block_size: Tile width
+        next_vertex: Optional flat array('i') next-hop matrix (-1 = no path)
+                     updated alongside d
+
+    Returns:
+        d (modified in place)
+    """
+    blocks = [range(b, min(b + block_size, n)) for b in range(0, n, block_size)]
+    for kb in blocks:
+        k0, k1 = kb.start, kb.stop
+        # Phase 1: diagonal block
+        _relax_tile(d, next_vertex, n, kb, kb, k0, k1)
+        # Phase 2: blocks in row K and column K
+        for b in blocks:
+            if b is not kb:
+                _relax_tile(d, next_vertex, n, kb, kb, b.start, b.stop)
+                _relax_tile(d, next_vertex, n, kb, b, k0, k1)
+        # Phase 3: all remaining blocks
+        for ib in blocks:
+            if ib is kb:
+                continue
+            for jb in blocks:
+                if jb is not kb:
+                    _relax_tile(d, next_vertex, n, kb, ib, jb.start, jb.stop)
+    return d
+
+
+def floyd_warshall_numpy(
+    d: array, n: int, next_vertex: Optional[array] = None
+) -> array:
+    """
+    Vectorized min-plus Floyd-Warshall on a flat buffer (requires NumPy).
+
+    The buffer is viewed as an N x N ndarray without copying; for every k
+    the whole matrix is relaxed against column k and row k at once. Pairs
+    with d[i][k] or d[k][j] unreachable are masked out, so INF plus a
+    negative weight never counts as an improvement.
+
+    Args:
+        d: Flat N*N array('q') or array('d') (see to_flat)
+        n: Number of vertices
+        next_vertex: Optional flat array('i') next-hop matrix
+
+    Returns:
+        d (modified in place)
+    """
+    if np is None:
+        raise ImportError("method='numpy' requires NumPy")
+    dtype = np.int64 if d.typecode == "q" else np.float64
+    dist = np.frombuffer(d, dtype=dtype).reshape(n, n)
+    nxt = None
+    if next_vertex is not None:
+        nxt = np.frombuffer(next_vertex, dtype=np.int32).reshape(n, n)
+
+    limit = _unreachable_limit(d.typecode)
+    for k in range(n):
+        cand = dist[:, k, None] + dist[None, k, :]
+        mask = cand < dist
+        mask &= (dist[:, k] < limit)[:, None]
+        mask &= (dist[k, :] < limit)[None, :]
+        if nxt is None:
+            np.copyto(dist, cand, where=mask)
+        else:
+            dist[mask] = cand[mask]
+            nxt[mask] = np.broadcast_to(nxt[:, k, None], (n, n))[mask]
+    return d
+
+
+def _solve_flat(
+    d: array, n: int, method: str, block_size: int, next_vertex: Optional[array]
+) -> None:
+    """Dispatch a flat buffer to the requested fast backend."""
+    if method == "auto":
+        method = "numpy" if np is not None else "blocked"
+    if method == "numpy":
+        floyd_warshall_numpy(d, n, next_vertex)
+    elif method == "blocked":
+        floyd_warshall_blocked(d, n, block_size, next_vertex)
+    else:
+        raise ValueError(f"Unknown method: {method!r}")
+
+
+def floyd_warshall(
+    dist: List[List[int]], method: str = "naive", block_size: int = 256
+) -> List[List[int]]:
     """
     Compute all-pairs shortest paths using Floyd-Warshall algorithm.
 
@@ -29,6 +240,9 @@ def floyd_warshall(dist: List[List[int]]) -> List[List[int]]:
         dist: N x N matrix where dist[i][j] is the weight of edge i->j.
               Use a large value (e.g., 10^8) for no direct edge.
               dist[i][i] should be 0.
+        method: "naive" (triple loop), "blocked" (tiled, flat array),
+                "numpy" (vectorized, flat array) or "auto"
+        block_size: Tile width for the blocked method
 
     Returns:
         N x N matrix of shortest distances between all pairs.
@@ -37,6 +251,11 @@ def floyd_warshall(dist: List[List[int]]) -> List[List[int]]:
     V = len(dist)
     INF = int(1e8)
 
+    if method != "naive":
+        flat = to_flat(dist)
+        _solve_flat(flat, V, method, block_size, None)
+        return from_flat(flat, V, INF)
+
     # Create a working copy
     d = [row[:] for row in dist]
 
@@ -52,7 +271,7 @@ def floyd_warshall(dist: List[List[int]]) -> List[List[int]]:
 
 
 def floyd_warshall_with_path(
-    graph: List[List[int]],
+    graph: List[List[int]], method: str = "naive", block_size: int = 256
 ) -> Tuple[List[List[int]], List[List[Optional[int]]]]:
     """
     Compute all-pairs shortest paths with path reconstruction.
@@ -60,6 +279,8 @@ def floyd_warshall_with_path(
     Args:
         graph: N x N adjacency matrix. graph[i][j] is edge weight, 0 means no edge
                (except diagonal). Use float('inf') for no edge.
+        method: "naive", "blocked", "numpy" or "auto" (see floyd_warshall)
+        block_size: Tile width for the blocked method
 
     Returns:
         Tuple of (distance_matrix, next_vertex_matrix)
@@ -69,6 +290,25 @@ def floyd_warshall_with_path(
     V = len(graph)
     INF = float("inf")
 
+    if method != "naive":
+        # Diagonal is 0, off-diagonal 0 / inf means no edge
+        matrix = [
+            [0 if i == j else (graph[i][j] or INF) for j in range(V)]
+            for i in range(V)
+        ]
+        flat = to_flat(matrix, no_edge=(INF,))
+        limit = _unreachable_limit(flat.typecode)
+        nxt = array(
+            "i",
+            (j if flat[i * V + j] < limit else -1 for i in range(V) for j in range(V)),
+        )
+        _solve_flat(flat, V, method, block_size, nxt)
+        dist = from_flat(flat, V, INF)
+        next_vertex = [
+            [None if x == -1 else x for x in nxt[i * V : (i + 1) * V]] for i in range(V)
+        ]
+        return dist, next_vertex
+
     # Initialize distance matrix
     dist = [[INF] * V for _ in range(V)]
     next_vertex: List[List[Optional[int]]] = [[None] * V for _ in range(V)]
@@ -122,16 +362,20 @@ def reconstruct_path(
     return path
 
 
-def has_negative_cycle(dist: List[List[int]]) -> bool:
+def has_negative_cycle(dist, n: Optional[int] = None) -> bool:
     """
     Check if the result matrix indicates a negative weight cycle.
 
     Args:
-        dist: Distance matrix from floyd_warshall
+        dist: Distance matrix from floyd_warshall, or a flat buffer from
+              floyd_warshall_blocked / floyd_warshall_numpy
+        n: Number of vertices when dist is a flat buffer
 
     Returns:
         True if a negative cycle exists, False otherwise.
     """
+    if n is not None:
+        return any(dist[i * n + i] < 0 for i in range(n))
     for i in range(len(dist)):
         if dist[i][i] < 0:
             return True
@@ -203,3 +447,18 @@ if __name__ == "__main__":
         print("\n  Negative cycle detected!")
     else:
         print("\n  No negative cycle.")
+
+    print()
+
+    # Example 4: Fast paths on flat buffers give the same answers
+    print("Example 4 - Blocked / vectorized backends:")
+    for method in ("blocked", "auto"):
+        fast = floyd_warshall(dist_matrix, method=method, block_size=2)
+        print(f"  {method:<8} matches naive: {fast == result}")
+    dist4, nxt4 = floyd_warshall_with_path(graph2, method="blocked", block_size=2)
+    path4 = reconstruct_path(3, 0, nxt4)
+    print(f"  Path 3 -> 0 (blocked): {path4}, Distance: {dist4[3][0]}")
+
+    flat = to_flat(dist3)
+    floyd_warshall_blocked(flat, len(dist3))
+    print(f"  Flat buffer negative cycle: {has_negative_cycle(flat, len(dist3))}")
@@ -11,7 +11,9 @@ negative weight cycles. It combines Bellman-Ford and Dijkstra's algorithms:
 4. Remove s and run Dijkstra from each vertex
 5. Adjust distances back: d(u,v) = d'(u,v) - h[u] + h[v]
 
-This is more efficient than Floyd-Warshall for sparse graphs.
+This is more efficient than Floyd-Warshall for sparse graphs. The Dijkstra
+runs in step 4 are independent; parallel_apsp.johnson_parallel() spreads
+them over a process pool.
 
 Time Complexity: O(V^2 log V + VE)
 Space Complexity: O(V^2)
@@ -38,21 +40,12 @@ def johnson_algorithm(
     """
     INF = float("inf")
 
-    # Step 1: Build adjacency list for Bellman-Ford
-    # Add a virtual source vertex V connected to all vertices with weight 0
-    bf_edges = list(edges)
-    for i in range(V):
-        bf_edges.append((V, i, 0))
-
-    # Step 2: Run Bellman-Ford from virtual source to get h[] values
-    h = _bellman_ford(V + 1, bf_edges, V)
+    # Steps 1-2: Vertex potentials h[] from Bellman-Ford on a virtual source
+    h = johnson_potentials(V, edges)
 
     if h is None:
         return None  # Negative weight cycle detected
 
-    # Remove the virtual source value
-    h = h[:V]
-
     # Step 3: Reweight edges using h values
     reweighted_adj: List[List[Tuple[int, int]]] = [[] for _ in range(V)]
     for u, v, w in edges:
@@ -73,6 +66,36 @@ def johnson_algorithm(
     return result
 
 
+def johnson_potentials(
+    V: int, edges: List[Tuple[int, int, int]]
+) -> Optional[List[int]]:
+    """
+    Compute Johnson vertex potentials h[] for reweighting.
+
+    Adds a virtual source connected to every vertex with weight 0 and runs
+    Bellman-Ford from it. Afterwards w(u, v) + h[u] - h[v] >= 0 for every
+    edge, and d(u, v) = d'(u, v) - h[u] + h[v] for reweighted distances d'.
+
+    Args:
+        V: Number of vertices (labeled 0 to V-1)
+        edges: List of (u, v, weight) tuples for directed edges
+
+    Returns:
+        List of V potentials, or None if a negative weight cycle exists.
+    """
+    # Add a virtual source vertex V connected to all vertices with weight 0
+    bf_edges = list(edges)
+    for i in range(V):
+        bf_edges.append((V, i, 0))
+
+    h = _bellman_ford(V + 1, bf_edges, V)
+    if h is None:
+        return None
+
+    # Remove the virtual source value
+    return h[:V]
+
+
 def _bellman_ford(
     V: int, edges: List[Tuple[int, int, int]], src: int
 ) -> Optional[List[int]]:
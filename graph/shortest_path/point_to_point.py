@@ -0,0 +1,283 @@
+"""
+Point-to-Point Shortest Path Queries (Early-Exit, Bidirectional, A*)
+
+dijkstra() settles every vertex reachable from the source. When only one
+source-target distance is needed, most of that work can be skipped:
+
+1. Early exit: stop Dijkstra as soon as the target is settled.
+2. Bidirectional Dijkstra: grow one search forward from the source and one
+   backward from the target (on the reverse graph). Keep the best meeting
+   distance mu over vertices reached by both searches; stop once
+   top(forward queue) + top(backward queue) >= mu.
+   Each search only covers about half the radius, so on road-like graphs
+   roughly half the vertices of a one-sided search are settled.
+3. A*: order the queue by g(v) + h(v) where h(v) is an admissible lower bound
+   on the remaining distance (e.g. straight-line distance when edge weights
+   are at least the Euclidean length). The search is pulled towards the
+   target.
+
+Every query returns the number of settled (popped, non-stale) vertices so
+the saving over a full dijkstra() run can be measured. Distance and parent
+maps are dicts, so a query only touches the vertices it explores instead of
+allocating O(V) arrays.
+
+Time Complexity: O((V + E) log V) worst case, far less in practice
+Space Complexity: O(vertices explored)
+
+Run from the repository root: python -m graph.shortest_path.point_to_point
+"""
+
+import heapq
+import math
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from graph.shortest_path.dijkstra import _weighted_neighbors, dijkstra
+
+INF = float("inf")
+
+
+def reverse_graph(adj) -> List[List[Tuple[int, int]]]:
+    """
+    Build the reverse graph (every edge u -> v becomes v -> u).
+
+    Bidirectional queries need it; build it once and pass it to every query.
+
+    Args:
+        adj: Adjacency list of (v, weight) tuples, or a CSRGraph
+
+    Returns:
+        Reverse graph in the same representation as adj
+    """
+    # CSRGraph has its own transpose; list.reverse() is the in-place reversal
+    if hasattr(adj, "weighted_neighbors"):
+        return adj.reverse()
+
+    radj: List[List[Tuple[int, int]]] = [[] for _ in range(len(adj))]
+    for u in range(len(adj)):
+        for v, weight in adj[u]:
+            radj[v].append((u, weight))
+    return radj
+
+
+def _build_path(prev: Dict[int, int], node: int) -> List[int]:
+    """Follow parent pointers from node back to the root (-1)."""
+    path = []
+    while node != -1:
+        path.append(node)
+        node = prev[node]
+    path.reverse()
+    return path
+
+
+def astar(
+    adj,
+    src: int,
+    target: int,
+    heuristic: Optional[Callable[[int], float]] = None,
+) -> Tuple[float, List[int], int]:
+    """
+    A* search from src to target.
+
+    With heuristic=None this is plain Dijkstra that stops when the target
+    is settled.
+
+    Args:
+        adj: Adjacency list where adj[u] contains (v, weight) tuples,
+             or a CSRGraph
+        src: Source vertex
+        target: Target vertex
+        heuristic: Admissible lower bound h(v) on dist(v, target)
+
+    Returns:
+        Tuple of (distance, path, settled_count). Distance is infinity and
+        path is empty when target is unreachable.
+    """
+    neighbors = _weighted_neighbors(adj)
+    h = heuristic if heuristic is not None else (lambda v: 0)
+
+    dist: Dict[int, float] = {src: 0}
+    prev: Dict[int, int] = {src: -1}
+    pq: List[Tuple[float, float, int]] = [(h(src), 0, src)]
+    settled = 0
+
+    while pq:
+        _, d, u = heapq.heappop(pq)
+
+        # Skip stale entries (a shorter path to u was found later)
+        if d > dist[u]:
+            continue
+
+        settled += 1
+        if u == target:
+            return d, _build_path(prev, target), settled
+
+        for v, weight in neighbors(u):
+            nd = d + weight
+            if nd < dist.get(v, INF):
+                dist[v] = nd
+                prev[v] = u
+                heapq.heappush(pq, (nd + h(v), nd, v))
+
+    return INF, [], settled
+
+
+def point_to_point_dijkstra(
+    adj, src: int, target: int
+) -> Tuple[float, List[int], int]:
+    """
+    Dijkstra that stops as soon as target is settled.
+
+    Returns:
+        Tuple of (distance, path, settled_count)
+    """
+    return astar(adj, src, target, None)
+
+
+def bidirectional_dijkstra(
+    adj, src: int, target: int, reverse_adj=None
+) -> Tuple[float, List[int], int]:
+    """
+    Bidirectional Dijkstra from src and target at the same time.
+
+    The side whose queue has the smaller minimum is expanded next. Every
+    relaxed vertex v already reached by the other side gives a candidate
+    mu = d_f(v) + d_b(v); the search stops when the two queue minima sum to
+    at least mu.
+
+    Args:
+        adj: Adjacency list where adj[u] contains (v, weight) tuples,
+             or a CSRGraph
+        src: Source vertex
+        target: Target vertex
+        reverse_adj: Precomputed reverse_graph(adj); built on the fly if None
+
+    Returns:
+        Tuple of (distance, path, settled_count)
+    """
+    if src == target:
+        return 0, [src], 1
+    if reverse_adj is None:
+        reverse_adj = reverse_graph(adj)
+
+    # Index 0 = forward search from src, 1 = backward search from target
+    neighbors = (_weighted_neighbors(adj), _weighted_neighbors(reverse_adj))
+    dist: Tuple[Dict[int, float], Dict[int, float]] = ({src: 0}, {target: 0})
+    prev: Tuple[Dict[int, int], Dict[int, int]] = ({src: -1}, {target: -1})
+    queues: Tuple[list, list] = ([(0, src)], [(0, target)])
+
+    best = INF
+    meet = -1
+    settled = 0
+
+    while queues[0] and queues[1]:
+        if queues[0][0][0] + queues[1][0][0] >= best:
+            break
+
+        side = 0 if queues[0][0][0] <= queues[1][0][0] else 1
+        pq, my_dist, my_prev = queues[side], dist[side], prev[side]
+        other_dist = dist[1 - side]
+
+        d, u = heapq.heappop(pq)
+        if d > my_dist[u]:
+            continue
+        settled += 1
+
+        for v, weight in neighbors[side](u):
+            nd = d + weight
+            if nd < my_dist.get(v, INF):
+                my_dist[v] = nd
+                my_prev[v] = u
+                heapq.heappush(pq, (nd, v))
+            if v in other_dist and my_dist[v] + other_dist[v] < best:
+                best = my_dist[v] + other_dist[v]
+                meet = v
+
+    if meet == -1:
+        return INF, [], settled
+
+    forward_path = _build_path(prev[0], meet)
+    backward_path = _build_path(prev[1], meet)
+    backward_path.reverse()
+    return best, forward_path + backward_path[1:], settled
+
+
+def euclidean_heuristic(
+    coords: Sequence[Tuple[float, float]], target: int, scale: float = 1.0
+) -> Callable[[int], float]:
+    """
+    Straight-line distance heuristic for A*.
+
+    Admissible when every edge weight is at least scale times the Euclidean
+    length of the edge.
+
+    Args:
+        coords: (x, y) position of each vertex
+        target: Target vertex
+        scale: Minimum cost per unit of distance
+
+    Returns:
+        Function h(v) giving a lower bound on dist(v, target)
+    """
+    tx, ty = coords[target]
+
+    def h(v: int) -> float:
+        x, y = coords[v]
+        return scale * math.hypot(x - tx, y - ty)
+
+    return h
+
+
+if __name__ == "__main__":
+    import random
+
+    # Example 1: Small graph, all query types agree
+    adj: List[List[Tuple[int, int]]] = [
+        [(1, 4), (2, 8)],  # 0
+        [(0, 4), (4, 6), (2, 3)],  # 1
+        [(0, 8), (3, 2), (1, 3)],  # 2
+        [(2, 2), (4, 10)],  # 3
+        [(1, 6), (3, 10)],  # 4
+    ]
+    print("Point-to-Point Queries - Example 1 (0 -> 3)")
+    print("=" * 50)
+    for name, result in [
+        ("early-exit Dijkstra", point_to_point_dijkstra(adj, 0, 3)),
+        ("bidirectional", bidirectional_dijkstra(adj, 0, 3)),
+    ]:
+        distance, path, settled = result
+        print(f"  {name:<20} dist={distance} path={path} settled={settled}")
+
+    # Example 2: Road-like grid with coordinates, weights >= Euclidean length
+    side = 60
+    n = side * side
+    rng = random.Random(7)
+    coords = [(float(i % side), float(i // side)) for i in range(n)]
+    grid: List[List[Tuple[int, int]]] = [[] for _ in range(n)]
+    for v in range(n):
+        x, y = v % side, v // side
+        for dx, dy in ((1, 0), (0, 1)):
+            if x + dx < side and y + dy < side:
+                w = rng.randint(1, 4)
+                u = v + dx + dy * side
+                grid[v].append((u, w))
+                grid[u].append((v, w))
+
+    src, target = 30 * side + 5, 30 * side + 55
+    full = dijkstra(grid, src)
+    full_settled = sum(1 for d in full if d != INF)
+    radj = reverse_graph(grid)
+
+    print(f"\nExample 2 - {side}x{side} grid, query {src} -> {target}")
+    print("=" * 50)
+    print(f"  {'full dijkstra()':<20} dist={full[target]} settled={full_settled}")
+    for name, result in [
+        ("early-exit Dijkstra", point_to_point_dijkstra(grid, src, target)),
+        ("bidirectional", bidirectional_dijkstra(grid, src, target, radj)),
+        (
+            "A* (Euclidean)",
+            astar(grid, src, target, euclidean_heuristic(coords, target)),
+        ),
+    ]:
+        distance, _, settled = result
+        speedup = full_settled / settled
+        print(f"  {name:<20} dist={distance} settled={settled} ({speedup:.1f}x fewer)")
@@ -0,0 +1,227 @@
+"""
+Incremental Topological Order and SCCs under Edge Insertions (Pearce-Kelly)
+
+kahns_algorithm() and tarjan_scc() rebuild everything from scratch. When a
+dependency graph only grows by edge insertions, the previous order is
+almost always still valid, and a new edge u -> v only disturbs the part of
+the order between v and u.
+
+Pearce-Kelly keeps a position ord[c] for every component c:
+1. Insert u -> v. If ord[comp(u)] < ord[comp(v)] the order is still valid.
+2. Otherwise only components with lb = ord[comp(v)] <= ord <= ub =
+   ord[comp(u)] can be affected:
+   - F = forward DFS from v, visiting components with ord <= ub
+   - B = backward DFS from u, visiting components with ord >= lb
+3. If u is in F the edge closes a cycle. The components in F and B lie on
+   a cycle through u -> v and are merged into one SCC (union-find).
+4. Reorder: B \\ SCC, then the merged SCC, then F \\ SCC, written into the
+   smallest and largest of the positions the affected components held
+   (positions freed by the merge stay empty).
+
+In strict mode a cycle-closing edge is rejected instead, so the graph
+stays a DAG over single vertices. Either way the cycle u -> v -> ... -> u
+is reported.
+
+Time Complexity: O(affected region) per insertion (worst case O(V + E));
+                 O(1) when the edge already agrees with the order
+Space Complexity: O(V + E)
+
+Run from the repository root:
+    python -m graph.topological_sort.incremental_topological_order
+"""
+
+from array import array
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+class IncrementalTopologicalOrder:
+    """
+    Topological order of the SCC condensation, maintained under insertions.
+
+    Attributes:
+        num_vertices: Number of vertices (0 to num_vertices - 1)
+        strict: Reject cycle-closing edges instead of merging SCCs
+        num_components: Current number of strongly connected components
+    """
+
+    def __init__(self, num_vertices: int, strict: bool = False):
+        self.num_vertices = num_vertices
+        self.strict = strict
+        self.num_components = num_vertices
+        self.out: List[List[int]] = [[] for _ in range(num_vertices)]
+        self.inn: List[List[int]] = [[] for _ in range(num_vertices)]
+
+        # Union-find over vertices; the root is the component id
+        self._parent = array("i", range(num_vertices))
+        self._members: Dict[int, List[int]] = {}
+
+        # ord[c] for component roots; slot[p] = component at position p or -1
+        self._ord = array("i", range(num_vertices))
+        self._slot = array("i", range(num_vertices))
+
+    def component(self, v: int) -> int:
+        """Component id (union-find root) of vertex v."""
+        parent = self._parent
+        root = v
+        while parent[root] != root:
+            root = parent[root]
+        while parent[v] != root:
+            parent[v], v = root, parent[v]
+        return root
+
+    def add_edge(self, u: int, v: int) -> Optional[List[int]]:
+        """
+        Insert the directed edge u -> v.
+
+        Args:
+            u: Tail vertex
+            v: Head vertex
+
+        Returns:
+            None if the condensation stays acyclic. If the edge closes a
+            cycle, the cycle as a vertex list [u, v, ..., u]; the edge is
+            then rejected in strict mode, otherwise its SCCs are merged.
+        """
+        cu, cv = self.component(u), self.component(v)
+        if cu == cv:
+            if self.strict:
+                return [u, u] if u == v else None
+            self._link(u, v)
+            return None
+
+        order = self._ord
+        lb, ub = order[cv], order[cu]
+        if lb > ub:
+            self._link(u, v)
+            return None
+
+        forward, parent = self._search(v, self.out, lambda c: order[c] <= ub)
+        cycle = None
+        if u in parent:
+            path = [u]
+            while path[-1] != v:
+                path.append(parent[path[-1]])
+            path.append(u)
+            path.reverse()
+            cycle = path
+            if self.strict:
+                return cycle
+
+        backward, _ = self._search(u, self.inn, lambda c: order[c] >= lb)
+        self._link(u, v)
+        self._reorder(forward, backward, cycle is not None)
+        return cycle
+
+    def add_edges(self, edges: Iterable[Tuple[int, int]]) -> List[List[int]]:
+        """Insert many edges; return every cycle reported, in order."""
+        cycles = []
+        for u, v in edges:
+            cycle = self.add_edge(u, v)
+            if cycle is not None:
+                cycles.append(cycle)
+        return cycles
+
+    def _link(self, u: int, v: int) -> None:
+        self.out[u].append(v)
+        self.inn[v].append(u)
+
+    def _search(self, start: int, adj, allowed) -> Tuple[set, dict]:
+        """
+        DFS over vertices whose component position passes allowed().
+
+        Returns:
+            (components reached, parent map of the vertices reached)
+        """
+        find = self.component
+        parent = {start: start}
+        comps = {find(start)}
+        stack = [start]
+        while stack:
+            x = stack.pop()
+            for y in adj[x]:
+                if y in parent:
+                    continue
+                cy = find(y)
+                if allowed(cy):
+                    parent[y] = x
+                    comps.add(cy)
+                    stack.append(y)
+        return comps, parent
+
+    def _reorder(self, forward: set, backward: set, merge: bool) -> None:
+        """Rewrite the positions of the affected components."""
+        order, slot = self._ord, self._slot
+        affected = forward | backward
+        slots = sorted(order[c] for c in affected)
+        for p in slots:
+            slot[p] = -1
+
+        cyclic = forward & backward if merge else set()
+        head = sorted(backward - cyclic, key=order.__getitem__)
+        tail = sorted(forward - cyclic, key=order.__getitem__)
+        if cyclic:
+            head.append(self._merge(cyclic))
+
+        # B (and the merged SCC) take the lowest slots, F the highest
+        for p, c in zip(slots, head):
+            order[c] = p
+            slot[p] = c
+        for p, c in zip(slots[len(slots) - len(tail) :], tail):
+            order[c] = p
+            slot[p] = c
+
+    def _merge(self, comps: set) -> int:
+        """Union the given components; return the surviving root."""
+        members = self._members
+        root = max(comps, key=lambda c: len(members.get(c, (c,))))
+        group = members.setdefault(root, [root])
+        for c in comps:
+            if c != root:
+                self._parent[c] = root
+                group.extend(members.pop(c, (c,)))
+        self.num_components -= len(comps) - 1
+        return root
+
+    def members(self, c: int) -> List[int]:
+        """Vertices of component c (a component id from component())."""
+        return list(self._members.get(c, (c,)))
+
+    def components(self) -> List[List[int]]:
+        """Strongly connected components in topological order."""
+        return [self.members(c) for c in self._slot if c != -1]
+
+    def order(self) -> List[int]:
+        """
+        Vertices in topological order of their components.
+
+        Members of one SCC are adjacent; for a DAG this is a topological
+        sort of the vertices.
+        """
+        return [v for comp in self.components() for v in comp]
+
+    def precedes(self, u: int, v: int) -> bool:
+        """True if u's component comes strictly before v's in the order."""
+        return self._ord[self.component(u)] < self._ord[self.component(v)]
+
+
+if __name__ == "__main__":
+    # Example 1: Strict mode keeps a DAG and reports the rejected cycle
+    print("Incremental Topological Order - Example 1 (strict)")
+    print("=" * 50)
+    dag = IncrementalTopologicalOrder(6, strict=True)
+    for u, v in [(5, 2), (5, 0), (4, 0), (4, 1), (2, 3), (3, 1)]:
+        dag.add_edge(u, v)
+        print(f"  add {u} -> {v}: order = {dag.order()}")
+    print(f"  add 1 -> 5: cycle = {dag.add_edge(1, 5)} (rejected)")
+    print(f"  order unchanged: {dag.order()}")
+
+    # Example 2: SCCs merge as edges arrive
+    print("\nExample 2 (SCC maintenance)")
+    print("=" * 50)
+    graph = IncrementalTopologicalOrder(6)
+    for u, v in [(0, 1), (1, 2), (3, 4), (4, 5), (2, 3), (2, 0), (5, 3)]:
+        cycle = graph.add_edge(u, v)
+        note = f" cycle = {cycle}" if cycle else ""
+        print(f"  add {u} -> {v}:{note}")
+    print(f"  SCCs in topological order: {graph.components()}")
+    print(f"  Number of SCCs: {graph.num_components}")
@@ -16,6 +16,9 @@ Algorithm:
 
 Time Complexity: O(V + E)
 Space Complexity: O(V)
+
+For a graph that grows by edge insertions, incremental_topological_order.py
+keeps the order up to date instead of re-running this from scratch.
 """
 
 from collections import deque
@@ -27,7 +30,8 @@ def kahns_algorithm(adj: list[list[int]]) -> list[int]:
 
     Args:
         adj: Adjacency list where adj[u] contains all vertices v
-             such that there is a directed edge u -> v.
+             such that there is a directed edge u -> v. A CSRGraph
+             (graph/core/csr_graph.py) can be passed directly.
 
     Returns:
         A list representing a valid topological ordering.
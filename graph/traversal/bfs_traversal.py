@@ -8,14 +8,32 @@ of exploration.
 Time Complexity: O(V + E) where V = vertices, E = edges
 Space Complexity: O(V) for visited array and queue
 
+Direction-optimizing BFS (Beamer et al.):
+  On low-diameter graphs (social networks, web graphs) the middle levels
+  contain most of the graph. Top-down BFS then checks every edge out of a
+  huge frontier, and nearly all of those edges lead to vertices that are
+  already visited. Bottom-up BFS turns the step around: every unvisited
+  vertex scans its in-neighbors and stops at the first one in the
+  frontier, so most vertices are settled after a few edge checks.
+  The search switches to bottom-up when the frontier's out-edges m_f
+  exceed m_u / alpha (m_u = edges out of unvisited vertices) and back to
+  top-down once the frontier drops below n / beta vertices. Visited and
+  frontier sets are bit-packed bitsets (one bit per vertex), and every
+  level reports its direction, size, edge checks and time so alpha and
+  beta can be tuned per graph.
+
 Applications:
   - Shortest path in unweighted graphs
   - Cycle detection
   - Connected components
   - Network routing
+
+Run from the repository root: python -m graph.traversal.bfs_traversal
 """
 
 from __future__ import annotations
+import time
+from array import array
 from collections import deque
 
 
@@ -25,7 +43,8 @@ def bfs(adj: list[list[int]], start: int = 0) -> list[int]:
     Visits all vertices reachable from the start vertex in level-order.
 
     Args:
-        adj: Adjacency list where adj[i] contains neighbors of vertex i.
+        adj: Adjacency list where adj[i] contains neighbors of vertex i
+            (a CSRGraph from graph/core/csr_graph.py also works).
         start: Starting vertex for BFS. Defaults to 0.
 
     Returns:
@@ -57,7 +76,8 @@ def bfs_all(adj: list[list[int]]) -> list[int]:
     vertex, ensuring all connected components are explored.
 
     Args:
-        adj: Adjacency list where adj[i] contains neighbors of vertex i.
+        adj: Adjacency list where adj[i] contains neighbors of vertex i
+            (a CSRGraph from graph/core/csr_graph.py also works).
 
     Returns:
         List of all vertices in BFS traversal order.
@@ -83,6 +103,165 @@ def bfs_all(adj: list[list[int]]) -> list[int]:
     return result
 
 
+def reverse_adjacency(adj: list[list[int]]) -> list[list[int]]:
+    """Build the in-neighbor lists that bottom-up steps scan.
+
+    Args:
+        adj: Adjacency list (or CSRGraph) of a directed graph.
+
+    Returns:
+        radj where radj[v] lists every u with an edge u -> v. An undirected
+        CSRGraph is returned as is.
+    """
+    if hasattr(adj, "weighted_neighbors"):
+        return adj.reverse() if adj.directed else adj
+    radj: list[list[int]] = [[] for _ in range(len(adj))]
+    for u in range(len(adj)):
+        for v in adj[u]:
+            radj[v].append(u)
+    return radj
+
+
+def direction_optimizing_bfs(
+    adj: list[list[int]],
+    source: int,
+    reverse_adj: list[list[int]] | None = None,
+    alpha: float = 15.0,
+    beta: float = 18.0,
+    target: int = -1,
+    stats: list[dict] | None = None,
+    direction: str = "auto",
+) -> tuple[array, array]:
+    """BFS that switches between top-down and bottom-up steps per level.
+
+    Args:
+        adj: Adjacency list where adj[i] contains neighbors of vertex i
+            (a CSRGraph from graph/core/csr_graph.py also works).
+        source: Starting vertex.
+        reverse_adj: In-neighbor lists from reverse_adjacency(adj). Pass adj
+            itself for undirected graphs; built on the fly if None.
+        alpha: Go bottom-up when frontier edges > unvisited edges / alpha.
+        beta: Go back top-down when frontier size < n / beta.
+        target: Stop after the level that reaches this vertex (-1 = never).
+        stats: Optional list; one dict per level is appended with keys
+            level, direction, frontier, edge_checks and seconds.
+        direction: "auto" switches with alpha/beta; "top-down" or
+            "bottom-up" forces one step type (baselines for tuning).
+
+    Returns:
+        Tuple of (dist, parent) as array('i'); both are -1 for unreached
+        vertices and parent[source] is -1.
+    """
+    if direction not in ("auto", "top-down", "bottom-up"):
+        raise ValueError(f"unknown direction: {direction!r}")
+    n = len(adj)
+    if reverse_adj is None and direction != "top-down":
+        reverse_adj = reverse_adjacency(adj)
+
+    dist = array("i", [-1]) * n
+    parent = array("i", [-1]) * n
+    visited = bytearray((n + 7) >> 3)
+
+    dist[source] = 0
+    visited[source >> 3] |= 1 << (source & 7)
+    frontier: list[int] = [source]
+    unvisited_edges = sum(len(adj[u]) for u in range(n)) - len(adj[source])
+    unvisited: list[int] | None = None  # built on the first bottom-up step
+    bottom_up = direction == "bottom-up"
+    level = 0
+
+    while frontier and not (target >= 0 and dist[target] >= 0):
+        started = time.perf_counter()
+        frontier_edges = sum(len(adj[u]) for u in frontier)
+        if direction == "auto":
+            if not bottom_up and frontier_edges > unvisited_edges / alpha:
+                bottom_up = True
+            elif bottom_up and len(frontier) < n / beta:
+                bottom_up = False
+
+        level += 1
+        nxt: list[int] = []
+        checks = 0
+
+        if bottom_up:
+            in_frontier = bytearray((n + 7) >> 3)
+            for u in frontier:
+                in_frontier[u >> 3] |= 1 << (u & 7)
+            if unvisited is None:
+                unvisited = [
+                    v for v in range(n) if not visited[v >> 3] >> (v & 7) & 1
+                ]
+            remaining: list[int] = []
+            for v in unvisited:
+                for u in reverse_adj[v]:
+                    checks += 1
+                    if in_frontier[u >> 3] >> (u & 7) & 1:
+                        parent[v] = u
+                        nxt.append(v)
+                        break
+                else:
+                    remaining.append(v)
+            unvisited = remaining
+            for v in nxt:
+                visited[v >> 3] |= 1 << (v & 7)
+                dist[v] = level
+        else:
+            checks = frontier_edges
+            for u in frontier:
+                for v in adj[u]:
+                    if not visited[v >> 3] >> (v & 7) & 1:
+                        visited[v >> 3] |= 1 << (v & 7)
+                        dist[v] = level
+                        parent[v] = u
+                        nxt.append(v)
+            if unvisited is not None:
+                unvisited = [v for v in unvisited if dist[v] == -1]
+
+        unvisited_edges -= sum(len(adj[v]) for v in nxt)
+        if stats is not None:
+            stats.append(
+                {
+                    "level": level,
+                    "direction": "bottom-up" if bottom_up else "top-down",
+                    "frontier": len(frontier),
+                    "edge_checks": checks,
+                    "seconds": time.perf_counter() - started,
+                }
+            )
+        frontier = nxt
+
+    return dist, parent
+
+
+def bfs_direction_optimizing(
+    adj: list[list[int]],
+    start: int = 0,
+    reverse_adj: list[list[int]] | None = None,
+    stats: list[dict] | None = None,
+) -> list[int]:
+    """BFS traversal using direction_optimizing_bfs().
+
+    Vertices come out level by level like bfs(); inside a level they are
+    ordered by vertex id rather than by discovery.
+
+    Args:
+        adj: Adjacency list where adj[i] contains neighbors of vertex i
+            (a CSRGraph from graph/core/csr_graph.py also works).
+        start: Starting vertex for BFS. Defaults to 0.
+        reverse_adj: In-neighbor lists (adj itself for undirected graphs).
+        stats: Optional list that receives per-level statistics.
+
+    Returns:
+        List of vertices in BFS level order.
+    """
+    dist, _ = direction_optimizing_bfs(adj, start, reverse_adj, stats=stats)
+    buckets: list[list[int]] = [[] for _ in range(max(dist) + 1)]
+    for v, d in enumerate(dist):
+        if d >= 0:
+            buckets[d].append(v)
+    return [v for bucket in buckets for v in bucket]
+
+
 if __name__ == "__main__":
     print("=" * 60)
     print("BFS - Connected Undirected Graph")
@@ -127,3 +306,34 @@ if __name__ == "__main__":
         [],  # 3 (sink)
     ]
     print(f"BFS from 0: {bfs(adj_directed, 0)}")
+
+    print("\n" + "=" * 60)
+    print("Direction-Optimizing BFS - Random Social-Style Graph")
+    print("=" * 60)
+    import random
+
+    rng = random.Random(42)
+    n = 50000
+    social: list[list[int]] = [[] for _ in range(n)]
+    for u in range(1, n):
+        # Preferential attachment: a few hubs, small diameter
+        for _ in range(5):
+            if rng.random() < 0.5 or not social[u - 1]:
+                v = rng.randrange(u)
+            else:
+                v = rng.choice(social[u - 1])
+            social[u].append(v)
+            social[v].append(u)
+
+    for mode in ("top-down", "bottom-up", "auto"):
+        stats: list[dict] = []
+        direction_optimizing_bfs(social, 0, social, stats=stats, direction=mode)
+        total = sum(row["edge_checks"] for row in stats)
+        seconds = sum(row["seconds"] for row in stats)
+        print(f"\n{mode}: {total} edge checks, {seconds * 1000:.1f} ms")
+        for row in stats:
+            print(
+                f"  level {row['level']:>2} {row['direction']:<9} "
+                f"frontier={row['frontier']:>6} checks={row['edge_checks']:>7} "
+                f"{row['seconds'] * 1000:6.1f} ms"
+            )
@@ -26,7 +26,8 @@ def dfs_recursive(adj: list[list[int]], start: int = 0) -> list[int]:
     is disconnected, only the connected component containing start is visited.
 
     Args:
-        adj: Adjacency list where adj[i] contains neighbors of vertex i.
+        adj: Adjacency list where adj[i] contains neighbors of vertex i
+            (a CSRGraph from graph/core/csr_graph.py also works).
         start: Starting vertex for DFS. Defaults to 0.
 
     Returns:
@@ -54,7 +55,8 @@ def dfs_recursive_all(adj: list[list[int]]) -> list[int]:
     vertex, ensuring all connected components are explored.
 
     Args:
-        adj: Adjacency list where adj[i] contains neighbors of vertex i.
+        adj: Adjacency list where adj[i] contains neighbors of vertex i
+            (a CSRGraph from graph/core/csr_graph.py also works).
 
     Returns:
         List of all vertices in DFS traversal order.
@@ -84,7 +86,8 @@ def dfs_iterative(adj: list[list[int]], start: int = 0) -> list[int]:
     reverse order (due to stack LIFO behavior).
 
     Args:
-        adj: Adjacency list where adj[i] contains neighbors of vertex i.
+        adj: Adjacency list where adj[i] contains neighbors of vertex i
+            (a CSRGraph from graph/core/csr_graph.py also works).
         start: Starting vertex for DFS. Defaults to 0.
 
     Returns:
@@ -112,7 +115,8 @@ def dfs_iterative_all(adj: list[list[int]]) -> list[int]:
     """Perform DFS traversal visiting ALL vertices (iterative, handles disconnected).
 
     Args:
-        adj: Adjacency list where adj[i] contains neighbors of vertex i.
+        adj: Adjacency list where adj[i] contains neighbors of vertex i
+            (a CSRGraph from graph/core/csr_graph.py also works).
 
     Returns:
         List of all vertices in DFS traversal order.
@@ -12,11 +12,19 @@ Algorithm:
 
 Time Complexity: O(V + E)
 Space Complexity: O(V)
+
+shortest_path_direction_optimizing() runs the same query with the
+top-down/bottom-up BFS from bfs_traversal.py, which checks far fewer edges
+on low-diameter graphs such as social networks.
+
+Run from the repository root: python -m graph.traversal.shortest_path_unweighted
 """
 
 from __future__ import annotations
 from collections import deque
 
+from graph.traversal.bfs_traversal import direction_optimizing_bfs
+
 
 def shortest_path_unweighted(
     adj: list[list[int]], source: int, destination: int
@@ -112,6 +120,45 @@ def reconstruct_path(parent: list[int | None], destination: int) -> list[int]:
     return path
 
 
+def shortest_path_direction_optimizing(
+    adj: list[list[int]],
+    source: int,
+    destination: int,
+    reverse_adj: list[list[int]] | None = None,
+    stats: list[dict] | None = None,
+) -> list[int] | None:
+    """Shortest path using direction-optimizing BFS.
+
+    The search stops after the level that reaches destination.
+
+    Args:
+        adj: Adjacency list where adj[i] contains neighbors of vertex i.
+        source: Starting vertex.
+        destination: Target vertex.
+        reverse_adj: In-neighbor lists (adj itself for undirected graphs);
+            built on the fly if None.
+        stats: Optional list that receives per-level direction, frontier
+            size, edge checks and time.
+
+    Returns:
+        List of vertices forming the shortest path from source to destination,
+        or None if no path exists.
+    """
+    dist, parent = direction_optimizing_bfs(
+        adj, source, reverse_adj, target=destination, stats=stats
+    )
+    if dist[destination] == -1:
+        return None
+
+    path: list[int] = []
+    current = destination
+    while current != -1:
+        path.append(current)
+        current = parent[current]
+    path.reverse()
+    return path
+
+
 if __name__ == "__main__":
     print("=" * 60)
     print("Shortest Path in Unweighted Graph")
@@ -168,3 +215,15 @@ if __name__ == "__main__":
     ]
     path = shortest_path_unweighted(adj2, 0, 3)
     print(f"Path from 0 to 3: {path}")
+
+    print("\n" + "=" * 60)
+    print("Direction-Optimizing BFS")
+    print("=" * 60)
+    stats: list[dict] = []
+    path = shortest_path_direction_optimizing(adj1, 2, 6, adj1, stats)
+    print(f"Shortest path from 2 to 6: {' -> '.join(map(str, path))}")
+    for row in stats:
+        print(
+            f"  level {row['level']}: {row['direction']:<9} "
+            f"frontier={row['frontier']} edge checks={row['edge_checks']}"
+        )
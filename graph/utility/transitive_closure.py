@@ -8,9 +8,16 @@ The reachability matrix is called the transitive closure of a graph.
 
 Time Complexity: O(V^3) where V is the number of vertices
 Auxiliary Space: O(V^2) for the result matrix
+
+Bitset variant: row i is stored as one bit set (a Python int, bit j set when
+j is reachable from i). For each k, every row that contains bit k absorbs
+row k with a single OR, so the inner loop over j runs in C one machine word
+at a time: O(V^3 / w) time and V^2 bits of memory.
+
+For graphs too large for a V x V matrix see reachability_index.py.
 """
 
-from typing import List
+from typing import List, Union
 
 
 def transitive_closure(graph: List[List[int]]) -> List[List[int]]:
@@ -60,6 +67,66 @@ def transitive_closure(graph: List[List[int]]) -> List[List[int]]:
     return tc
 
 
+def transitive_closure_bitset(
+    graph: List[List[int]], as_bytes: bool = False
+) -> Union[List[int], List[bytearray]]:
+    """
+    Compute the transitive closure with one bit set per row.
+
+    Args:
+        graph: Adjacency matrix where graph[i][j] = 1 if there is a direct
+               edge from vertex i to vertex j, 0 otherwise.
+        as_bytes: Return each row as a fixed-size little-endian bytearray
+                  (bit j of the row is bit j % 8 of byte j // 8) instead of
+                  a Python int.
+
+    Returns:
+        List of rows; j is reachable from i iff bit j of row i is set.
+
+    Example:
+        >>> rows = transitive_closure_bitset([[0, 1, 0], [0, 0, 1], [0, 0, 0]])
+        >>> [bin(r) for r in rows]
+        ['0b111', '0b110', '0b100']
+    """
+    n = len(graph)
+
+    # Build rows from the matrix; every vertex can reach itself
+    rows = [0] * n
+    for i in range(n):
+        bits = 1 << i
+        for j, val in enumerate(graph[i]):
+            if val:
+                bits |= 1 << j
+        rows[i] = bits
+
+    # Warshall: if i reaches k, i reaches everything k reaches
+    for k in range(n):
+        bit = 1 << k
+        row_k = rows[k]
+        for i in range(n):
+            if rows[i] & bit:
+                rows[i] |= row_k
+
+    if as_bytes:
+        width = (n + 7) // 8
+        return [bytearray(row.to_bytes(width, "little")) for row in rows]
+    return rows
+
+
+def is_reachable(rows: Union[List[int], List[bytearray]], i: int, j: int) -> bool:
+    """Test bit j of row i in a closure from transitive_closure_bitset."""
+    row = rows[i]
+    if isinstance(row, int):
+        return (row >> j) & 1 == 1
+    return (row[j >> 3] >> (j & 7)) & 1 == 1
+
+
+def bitset_to_matrix(rows: Union[List[int], List[bytearray]]) -> List[List[int]]:
+    """Expand bit set rows into the 0/1 matrix returned by transitive_closure."""
+    n = len(rows)
+    return [[1 if is_reachable(rows, i, j) else 0 for j in range(n)] for i in range(n)]
+
+
 def print_matrix(matrix: List[List[int]]) -> None:
     """Print a matrix in a readable format."""
     for row in matrix:
@@ -93,3 +160,12 @@ if __name__ == "__main__":
     print("\nTransitive closure:")
     result3 = transitive_closure(graph3)
     print_matrix(result3)
+
+    # Example 4: Bitset rows give the same closure
+    print("\nExample 4 (bitset rows for Example 1):")
+    rows1 = transitive_closure_bitset(graph1)
+    for i, row in enumerate(rows1):
+        print(f"row {i} = {row:#06b}")
+    print(f"Matches Floyd-Warshall: {bitset_to_matrix(rows1) == result1}")
+    packed = transitive_closure_bitset(graph1, as_bytes=True)
+    print(f"Row 3 as bytes: {bytes(packed[3])!r}, 3 reaches 0: {is_reachable(packed, 3, 0)}")
@@ -1,28 +1,16 @@
-def can_color_graph(graph: list[list[int]], m: int) -> list[int] | None:
-    """Solve M Coloring Problem and return color assignment for each vertex."""
-    n = len(graph)
-    colors = [0] * n
-
-    def is_safe(v: int, c: int) -> bool:
-        for i in range(n):
-            if graph[v][i] == 1 and colors[i] == c:
-                return False
-        return True
+from graph.advanced.bitset_coloring import (
+    bitset_adjacency_from_matrix,
+    color_with_at_most,
+)
 
-    def solve(v: int) -> bool:
-        if v == n:
-            return True
-        for c in range(1, m + 1):
-            if is_safe(v, c):
-                colors[v] = c
-                if solve(v + 1):
-                    return True
-                colors[v] = 0
-        return False
 
-    if solve(0):
-        return colors
-    return None
+def can_color_graph(graph: list[list[int]], m: int) -> list[int] | None:
+    """Solve M Coloring Problem and return color assignment for each vertex."""
+    # DSATUR-order backtracking over bitset rows (graph/advanced/bitset_coloring.py)
+    colors = color_with_at_most(bitset_adjacency_from_matrix(graph), m)
+    if colors is None:
+        return None
+    return [c + 1 for c in colors]
 
 
 if __name__ == "__main__":
@@ -1,17 +1,10 @@
+from graph.np_hard.held_karp import held_karp
+
+
 def bitmasking_tsp(graph: list[list[int]], n: int) -> int:
     """Solve TSP using bitmasking dynamic programming."""
-    dp = [[float("inf")] * n for _ in range(1 << n)]
-    dp[1][0] = 0
-    for mask in range(1 << n):
-        for u in range(n):
-            if (mask >> u) & 1:
-                for v in range(n):
-                    if (mask >> v) & 1 == 0:
-                        new_mask = mask | (1 << v)
-                        dp[new_mask][v] = min(
-                            dp[new_mask][v], dp[mask][u] + graph[u][v]
-                        )
-    return min(dp[(1 << n) - 1][i] for i in range(1, n))
+    # Cheapest path from city 0 through every city (no return edge)
+    return held_karp([row[:n] for row in graph[:n]], cycle=False)[0]
 
 
 if __name__ == "__main__":
@@ -1,4 +1,12 @@
-"""Job Assignment Problem using Branch and Bound."""
+"""Job Assignment Problem using Branch and Bound.
+
+Branch and bound explores worker-by-worker partial assignments and is only
+practical for small matrices. For larger ones use min_cost_assignment()
+from graph/max_flow/hopcroft_karp.py (Hungarian method, O(n^3)).
+
+Run from the repository root:
+    python -m other.branch_and_bound.job_assignment_branch_bound
+"""
 
 from __future__ import annotations
 
@@ -91,3 +99,8 @@ if __name__ == "__main__":
     print(f"Total cost: {total_cost}")
     for i, job in enumerate(assignment):
         print(f"Worker {i} -> Job {job} (cost: {cost_matrix[i][job]})")
+
+    # Same problem, Hungarian method
+    from graph.max_flow.hopcroft_karp import min_cost_assignment
+
+    print(f"Hungarian method: {min_cost_assignment(cost_matrix)}")
@@ -1,5 +1,8 @@
 import random
 
+from graph.disjoint_set.union_by_rank_path_compression import ArrayDisjointSet
+from graph.max_flow.karger_stein import karger_stein_min_cut
+
 
 class KargerMinCut:
     """Karger's algorithm for finding minimum cut in an undirected graph."""
@@ -8,18 +11,12 @@ class KargerMinCut:
         self.original_vertices = vertices
         self.original_edges = edges
 
-    def _contract(self, u: int, v: int, parent: list[int]) -> int:
-        """Contract edge (u, v) by merging u into v."""
-        for i in range(len(parent)):
-            if parent[i] == u:
-                parent[i] = v
-        return v
-
-    def _count_edges(self, parent: list[int]) -> int:
+    def _count_edges(self, dsu: ArrayDisjointSet) -> int:
         """Count edges between different components."""
+        find = dsu.find
         count = 0
         for u, v in self.original_edges:
-            if parent[u] != parent[v]:
+            if find(u) != find(v):
                 count += 1
         return count
 
@@ -32,29 +29,39 @@ class KargerMinCut:
         n = self.original_vertices
 
         for _ in range(iterations):
-            parent = list(range(n))
-            vertices = n
+            dsu = ArrayDisjointSet(n)
 
             edges = self.original_edges[:]
-            while vertices > 2:
-                edge_idx = random.randint(0, len(edges) - 1)
-                u, v = edges[edge_idx]
-
-                root_u, root_v = parent[u], parent[v]
-                while parent[root_u] != root_u:
-                    root_u = parent[root_u]
-                while parent[root_v] != root_v:
-                    root_v = parent[root_v]
+            # One pass in random order instead of repeated random picks
+            random.shuffle(edges)
+            for u, v in edges:
+                if dsu.num_sets <= 2:
+                    break
+                dsu.union(u, v)
 
-                if root_u != root_v:
-                    parent[root_u] = root_v
-                    vertices -= 1
-
-            cut = self._count_edges(parent)
+            cut = self._count_edges(dsu)
             min_cut = min(min_cut, cut)
 
         return min_cut
 
+    def find_min_cut_karger_stein(
+        self,
+        trials: int | None = None,
+        seed: int | None = None,
+        workers: int | None = None,
+        stop_after: int | None = None,
+    ) -> int:
+        """Find minimum cut with Karger-Stein trials over a process pool."""
+        cut, _ = karger_stein_min_cut(
+            self.original_vertices,
+            self.original_edges,
+            trials,
+            seed,
+            workers,
+            stop_after,
+        )
+        return cut
+
 
 if __name__ == "__main__":
     vertices = 4
@@ -71,3 +78,4 @@ if __name__ == "__main__":
     print(f"Graph with {vertices} vertices")
     print(f"Edges: {edges}")
     print(f"Minimum cut: {min_cut}")
+    print(f"Minimum cut (Karger-Stein): {karger.find_min_cut_karger_stein(seed=0)}")